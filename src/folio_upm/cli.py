@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 import json
 from datetime import datetime
+from typing import List, Type, TypeVar
 
 import click
+from pydantic import BaseModel
 
 from folio_upm.integration.services.eureka_cleanup_service import EurekaCleanupService
 from folio_upm.integration.services.eureka_migration_service import EurekaMigrationService
@@ -18,8 +20,10 @@ from folio_upm.services.loaders.capabilities_loader import CapabilitiesLoader
 from folio_upm.services.loaders.eureka_data_loader import EurekaDataLoader
 from folio_upm.services.loaders.okapi_data_loader import OkapiDataLoader
 from folio_upm.services.ps_details_service import PermissionDetailsService
+from folio_upm.storage.migration_journal import MigrationJournal
 from folio_upm.storage.tenant_storage_service import TenantStorageService
 from folio_upm.utils import log_factory
+from folio_upm.utils.shard_utils import ShardUtils
 from folio_upm.utils.system_roles_provider import SystemRolesProvider
 from folio_upm.utils.upm_env import Env
 from folio_upm.xlsx.cleanup_process_report_service import CleanupProcessReportProvider
@@ -45,11 +49,19 @@ hash_roles_cleanup_data_fn = "hash-roles-cleanup-data"
 
 # reports
 migration_result_fn = "migration-report"
+migration_journal_fn = "migration-journal"
 hash_roles_cleanup_report_fn = "hash-roles-cleanup-report"
 
+# load result fields, loaded with sectioned snapshots up front, other fields are loaded on first access
+capability_fields = ["capabilities", "capabilitySets"]
+role_relation_fields = ["roleCapabilities", "roleCapabilitySets"]
+expanded_permission_fields = ["allPermissionsExpanded"]
+
 
 _log = log_factory.get_logger("cli.py")
 
+M = TypeVar("M", bound=BaseModel)
+
 
 @click.group()
 def cli():
@@ -63,7 +75,7 @@ def collect_permissions():
     _log.info("Collecting permissions...")
     storage_service = TenantStorageService()
     perms_load_result = OkapiDataLoader().load_okapi_data()
-    storage_service.save_object(okapi_permissions_fn, json_gz_ext, perms_load_result)
+    storage_service.save_snapshot(okapi_permissions_fn, perms_load_result)
     _log.info("Permissions collected successfully (time: %s)", _get_time_taken(start_time))
 
 
@@ -81,9 +93,8 @@ def generate_report():
     SystemRolesProvider().print_system_roles()
 
     storage_service = TenantStorageService()
-    okapi_permissions_dict = storage_service.require_object(okapi_permissions_fn, json_gz_ext)
-    okapi_load_result = OkapiLoadResult(**okapi_permissions_dict)
-    eureka_load_result = EurekaDataLoader().find_load_result()
+    okapi_load_result = storage_service.require_snapshot(okapi_permissions_fn, OkapiLoadResult)
+    eureka_load_result = EurekaDataLoader(fields=capability_fields).find_load_result()
     load_result_analyzer = LoadResultAnalyzer(okapi_load_result, eureka_load_result)
     analysis_result = load_result_analyzer.get_results()
 
@@ -93,36 +104,62 @@ def generate_report():
 
     eureka_data_fn = f"{eureka_migration_data_fn}-{strategy_name}"
     eureka_migration_data = load_result_analyzer.get_eureka_migration_data()
-    storage_service.save_object(eureka_data_fn, json_gz_ext, eureka_migration_data.model_dump(by_alias=True))
+    storage_service.save_object(eureka_data_fn, json_gz_ext, eureka_migration_data)
     _log.info("Okapi Report is generated for strategy: %s (%s)", strategy_name, _get_time_taken(start_time))
 
 
 @cli.command("run-eureka-migration")
-def run_eureka_migration():
+@click.option("--resume", is_flag=True, default=False, help="Resume migration, skipping journaled entries.")
+@click.option("--shard-index", type=click.IntRange(min=0), default=0, help="Index of the shard to migrate.")
+@click.option("--shard-count", type=click.IntRange(min=1), default=1, help="Total number of shards.")
+def run_eureka_migration(resume: bool, shard_index: int, shard_count: int):
     start_time = datetime.now()
+    ShardUtils.validate(shard_index, shard_count)
     strategy_name = Env().get_migration_strategy().get_name()
-    _log.info("Running eureka migration for strategy: %s ...", strategy_name)
+    shard = f"{shard_index + 1}/{shard_count}"
+    _log.info("Running eureka migration for strategy: %s [resume=%s, shard=%s]...", strategy_name, resume, shard)
 
     _eureka_migration_data_fn = f"{eureka_migration_data_fn}-{strategy_name}"
     storage_service = TenantStorageService()
-    eureka_migration_data_dict = storage_service.require_object(_eureka_migration_data_fn, json_gz_ext)
-    migration_data = EurekaMigrationData(**eureka_migration_data_dict)
-    migration_report = EurekaMigrationService().migrate_to_eureka(migration_data)
-
-    _migration_result_fn = f"{migration_result_fn}-{strategy_name}"
-    storage_service.save_object(_migration_result_fn, json_gz_ext, migration_report.model_dump(by_alias=True))
+    migration_data = storage_service.require_model(_eureka_migration_data_fn, json_gz_ext, EurekaMigrationData)
+    # each role is created by the shard, assigning its capabilities, other shards resolve it by name
+    shard_roles = ShardUtils.filter_shard(migration_data.roles, lambda ar: ar.role.name, shard_index, shard_count)
+    shard_role_names = {ar.role.name for ar in shard_roles}
+    external_role_names = {ar.role.name for ar in migration_data.roles if ar.role.name not in shard_role_names}
+    migration_data = EurekaMigrationData(
+        roles=shard_roles,
+        roleCapabilities=ShardUtils.filter_shard(
+            migration_data.roleCapabilities, lambda arc: arc.roleName, shard_index, shard_count
+        ),
+        userRoles=ShardUtils.filter_shard(migration_data.userRoles, lambda ur: ur.userId, shard_index, shard_count),
+    )
+    eureka_load_result = EurekaDataLoader(use_ref_file=False, fields=capability_fields).find_load_result()
+    journal_fn = ShardUtils.get_shard_file_name(migration_journal_fn, strategy_name, shard_index, shard_count)
+    journal = MigrationJournal(journal_fn, resume)
+    migration_service = EurekaMigrationService()
+    migration_report = migration_service.migrate_to_eureka(
+        migration_data, eureka_load_result, journal, external_role_names
+    )
+
+    _migration_result_fn = ShardUtils.get_shard_file_name(migration_result_fn, strategy_name, shard_index, shard_count)
+    storage_service.save_object(_migration_result_fn, json_gz_ext, migration_report)
     _log.info("Eureka migration finished for strategy: %s (%s)", strategy_name, _get_time_taken(start_time))
 
 
 @cli.command("generate-migration-report")
-def generate_migration_report():
+@click.option("--shard-count", type=click.IntRange(min=1), default=1, help="Number of migration shards to merge.")
+def generate_migration_report(shard_count: int):
     start_time = datetime.now()
     _log.info("Generating migration report ...")
     strategy_name = Env().get_migration_strategy().get_name()
     storage_service = TenantStorageService()
     _migration_result_fn = f"{migration_result_fn}-{strategy_name}"
-    raw_migration_report = storage_service.require_object(_migration_result_fn, json_gz_ext)
-    migration_report = EurekaMigrationReport(**raw_migration_report)
+    if shard_count > 1:
+        shard_reports = _load_shard_objects(migration_result_fn, strategy_name, shard_count, EurekaMigrationReport)
+        migration_report = EurekaMigrationReport.merge(shard_reports)
+        storage_service.save_object(_migration_result_fn, json_gz_ext, migration_report)
+    else:
+        migration_report = storage_service.require_model(_migration_result_fn, json_gz_ext, EurekaMigrationReport)
     migration_xlsx_report = MigrationProcessReportProvider(migration_report).generate()
     storage_service.save_object(_migration_result_fn, xlsx_ext, migration_xlsx_report)
     _log.info("Migration Report is generated for strategy: %s (%s)", strategy_name, _get_time_taken(start_time))
@@ -130,8 +167,16 @@ def generate_migration_report():
 
 @cli.command("analyze-hash-roles")
 @click.option("--force-reload", is_flag=True, default=False, help="Force reloading of eureka capabilities.")
-def analyze_hash_roles(force_reload: bool):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Reload only roles changed by the migration, starting from the previous eureka data snapshot.",
+)
+def analyze_hash_roles(force_reload: bool, incremental: bool):
     start_time = datetime.now()
+    if force_reload and incremental:
+        raise click.BadParameter("cannot be used together with --force-reload", param_hint="--incremental")
     strategy_name = Env().get_migration_strategy().get_name()
     storage_service = TenantStorageService()
     _log.info("Analyzing hash-role capabilities for: %s", strategy_name)
@@ -139,6 +184,8 @@ def analyze_hash_roles(force_reload: bool):
 
     if force_reload:
         eureka_load_rs = __collect_capabilities(_migrated_eureka_data_fn)
+    elif incremental:
+        eureka_load_rs = __collect_capabilities_incrementally(_migrated_eureka_data_fn, strategy_name)
     else:
         eureka_rs_loader = EurekaDataLoader(use_ref_file=False, src_file_name=_migrated_eureka_data_fn)
         eureka_load_rs = eureka_rs_loader.find_load_result()
@@ -151,40 +198,58 @@ def analyze_hash_roles(force_reload: bool):
     storage_service.save_object(xlsx_analysis_result_fn, xlsx_ext, hash_role_xlsx_analysis_result)
 
     cleanup_records = HashRoleCleanupRecord.get_records_from_analysis_result(hash_role_analysis_result)
-    cleanup_records_dicts = [x.model_dump(by_alias=True) for x in cleanup_records]
     _hash_roles_cleanup_data_fn = f"{hash_roles_cleanup_data_fn}-{strategy_name}"
-    storage_service.save_object(_hash_roles_cleanup_data_fn, json_gz_ext, cleanup_records_dicts)
+    storage_service.save_object(_hash_roles_cleanup_data_fn, json_gz_ext, cleanup_records)
     _log.info("Hash-Roles analysis is finished for strategy: %s (%s)", strategy_name, _get_time_taken(start_time))
 
 
 @cli.command("cleanup-hash-roles")
-def clean_hash_roles():
+@click.option("--shard-index", type=click.IntRange(min=0), default=0, help="Index of the shard to clean up.")
+@click.option("--shard-count", type=click.IntRange(min=1), default=1, help="Total number of shards.")
+def clean_hash_roles(shard_index: int, shard_count: int):
     start_time = datetime.now()
+    ShardUtils.validate(shard_index, shard_count)
     migration_strategy = Env().get_migration_strategy()
     strategy_name = migration_strategy.get_name()
-    _log.info("Cleaning hash roles for strategy: %s ...", strategy_name)
+    shard = f"{shard_index + 1}/{shard_count}"
+    _log.info("Cleaning hash roles for strategy: %s [shard=%s]...", strategy_name, shard)
 
     storage_service = TenantStorageService()
     _hash_roles_cleanup_data_fn = f"{hash_roles_cleanup_data_fn}-{strategy_name}"
-    hash_role_raw_cleanup_records = storage_service.require_object(_hash_roles_cleanup_data_fn, json_gz_ext)
-    hash_role_cleanup_records = [HashRoleCleanupRecord(**x) for x in hash_role_raw_cleanup_records]
-    cleanup_service = EurekaCleanupService(hash_role_cleanup_records)
+    hash_role_raw_cleanup_records = storage_service.require_object_items(_hash_roles_cleanup_data_fn, json_gz_ext)
+    hash_role_cleanup_records = (HashRoleCleanupRecord(**x) for x in hash_role_raw_cleanup_records)
+    hash_role_cleanup_records = ShardUtils.iter_shard(
+        hash_role_cleanup_records, lambda record: record.role.id or record.role.name, shard_index, shard_count
+    )
+    _migrated_eureka_data_fn = f"{eureka_migrated_data_fn}-{strategy_name}"
+    eureka_rs_loader = EurekaDataLoader(False, _migrated_eureka_data_fn, role_relation_fields)
+    eureka_load_rs = eureka_rs_loader.find_load_result()
+    if eureka_load_rs is None:
+        _log.warning("Analyzed Eureka data is not found, all role capabilities will be updated.")
+    cleanup_service = EurekaCleanupService(hash_role_cleanup_records, eureka_load_rs)
     hash_role_cleanup_report = cleanup_service.perform_cleanup()
 
-    result_fn = f"{hash_roles_cleanup_report_fn}-{strategy_name}"
-    storage_service.save_object(result_fn, json_gz_ext, hash_role_cleanup_report.model_dump(by_alias=True))
+    result_fn = ShardUtils.get_shard_file_name(hash_roles_cleanup_report_fn, strategy_name, shard_index, shard_count)
+    storage_service.save_object(result_fn, json_gz_ext, hash_role_cleanup_report)
     _log.info("Hash-Roles cleanup is finished for strategy: %s (%s)", strategy_name, _get_time_taken(start_time))
 
 
 @cli.command("generate-cleanup-report")
-def generate_cleanup_report():
+@click.option("--shard-count", type=click.IntRange(min=1), default=1, help="Number of cleanup shards to merge.")
+def generate_cleanup_report(shard_count: int):
     start_time = datetime.now()
     _log.info("Generating cleanup report...")
     strategy_name = Env().get_migration_strategy().get_name()
     storage_service = TenantStorageService()
     cleanup_report_fn = f"{hash_roles_cleanup_report_fn}-{strategy_name}"
-    raw_cleanup_report = storage_service.require_object(cleanup_report_fn, json_gz_ext)
-    cleanup_report = HashRolesCleanupReport(**raw_cleanup_report)
+    if shard_count > 1:
+        shard_reports = _load_shard_objects(
+            hash_roles_cleanup_report_fn, strategy_name, shard_count, HashRolesCleanupReport
+        )
+        cleanup_report = HashRolesCleanupReport.merge(shard_reports)
+        storage_service.save_object(cleanup_report_fn, json_gz_ext, cleanup_report)
+    else:
+        cleanup_report = storage_service.require_model(cleanup_report_fn, json_gz_ext, HashRolesCleanupReport)
     migration_xlsx_report = CleanupProcessReportProvider(cleanup_report).generate()
     storage_service.save_object(cleanup_report_fn, xlsx_ext, migration_xlsx_report)
     _log.info("Cleanup report is generated for strategy: %s (%s)", strategy_name, _get_time_taken(start_time))
@@ -211,8 +276,9 @@ def explain_permissions(name, file):
     """Explain a permission by its name."""
     _log.info("Explaining permission: %s", name)
     storage_service = TenantStorageService()
-    okapi_load_result_dict = storage_service.require_object(okapi_permissions_fn, json_gz_ext)
-    okapi_load_result = OkapiLoadResult(**okapi_load_result_dict)
+    okapi_load_result = storage_service.require_snapshot(
+        okapi_permissions_fn, OkapiLoadResult, expanded_permission_fields
+    )
     pd_service = PermissionDetailsService(okapi_load_result)
     if name:
         _log.info("Explaining permissions by file name: %s", file)
@@ -230,10 +296,42 @@ def explain_permissions(name, file):
 def __collect_capabilities(result_fn: str) -> EurekaLoadResult:
     storage_service = TenantStorageService()
     capability_load_result = CapabilitiesLoader().load_capabilities()
-    storage_service.save_object(result_fn, json_gz_ext, capability_load_result)
+    storage_service.save_snapshot(result_fn, capability_load_result)
     return EurekaLoadResult(**capability_load_result)
 
 
+def __collect_capabilities_incrementally(result_fn: str, strategy_name: str) -> EurekaLoadResult:
+    storage_service = TenantStorageService()
+    _migration_result_fn = f"{migration_result_fn}-{strategy_name}"
+    migration_report = storage_service.find_model(_migration_result_fn, json_gz_ext, EurekaMigrationReport)
+    if migration_report is None:
+        _log.warning("Migration report is not found, performing full reload of eureka data...")
+        return __collect_capabilities(result_fn)
+
+    previous_load_result = storage_service.find_snapshot_object(result_fn)
+    if previous_load_result is None:
+        _log.info("Previous eureka data snapshot is not found, using eureka data loaded before the migration...")
+        previous_load_result = storage_service.find_snapshot_object(eureka_capabilities_fn)
+    if previous_load_result is None:
+        _log.warning("Eureka data snapshot is not found, performing full reload of eureka data...")
+        return __collect_capabilities(result_fn)
+
+    touched_role_ids = migration_report.get_touched_role_ids()
+    capability_load_result = CapabilitiesLoader().reload_roles(previous_load_result, touched_role_ids)
+    storage_service.save_snapshot(result_fn, capability_load_result)
+    return EurekaLoadResult(**capability_load_result)
+
+
+def _load_shard_objects(file_name: str, strategy_name: str, shard_count: int, model_type: Type[M]) -> List[M]:
+    storage_service = TenantStorageService()
+    shard_objects = list[M]()
+    for shard_index in range(shard_count):
+        shard_fn = ShardUtils.get_shard_file_name(file_name, strategy_name, shard_index, shard_count)
+        shard_objects.append(storage_service.require_model(shard_fn, json_gz_ext, model_type))
+    _log.info("Shard objects loaded: %s (shards: %s)", file_name, shard_count)
+    return shard_objects
+
+
 def _get_time_taken(start_time):
     end_time = datetime.now()
     delta = end_time - start_time
@@ -16,5 +16,6 @@ class EurekaHttpClient(HttpClient, metaclass=SingletonMeta):
         super().__init__(
             base_url=Env().get_eureka_url(),
             auth_func=LoginService().get_eureka_token,
+            invalidate_auth_func=LoginService().invalidate_eureka_token,
             client_timeout=Env().get_http_client_timeout(),
         )
@@ -1,24 +1,45 @@
+import threading
+import time
 from typing import Any, Callable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from folio_upm.integration.clients.base.retry_policy import RetryPolicy
+from folio_upm.model.stats.http_connection_stats import HttpConnectionStats
 from folio_upm.utils import log_factory
+from folio_upm.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
 from folio_upm.utils.json_utils import JsonUtils
+from folio_upm.utils.rate_limiter import TokenBucketRateLimiter
 from folio_upm.utils.upm_env import Env
 
 
 class HttpClient:
 
-    def __init__(self, base_url: str, auth_func: Callable, client_timeout: int | None = None):
+    _stats_log_interval = 1000
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_func: Callable,
+        client_timeout: int | None = None,
+        invalidate_auth_func: Callable[[str], None] | None = None,
+    ):
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._base_url = base_url
         self._auth_func = auth_func
+        self._invalidate_auth_func = invalidate_auth_func
         self._timeout = client_timeout or Env().get_http_client_timeout()
+        self._adapter = self.__create_adapter()
+        self._session = self.__create_session()
+        self._retry_policy = self.__create_retry_policy()
+        self._rate_limiter = self.__create_rate_limiter()
+        self._stats_lock = threading.Lock()
+        self._total_requests = 0
+        self._total_retries = 0
 
     def get_json(self, path: str, params: dict | None = None, handle_404: bool = False) -> Optional[Any]:
-        url = self.__prepare_url(path)
-        headers = self.__get_headers()
-        response = requests.get(url, params=params, headers=headers, timeout=self._timeout)
+        response = self.__send("GET", path, params=params)
 
         if response.status_code == 404 and handle_404:
             self._log.warning(f"Status if 404 for request: GET {path}")
@@ -29,35 +50,145 @@ class HttpClient:
 
     def post_json(self, path, request_body: Any, params: dict | None = None) -> Optional[Any]:
         body_json_str = JsonUtils.to_json(request_body)
-        response = requests.post(
-            self.__prepare_url(path),
-            params=params,
-            data=body_json_str,
-            headers=self.__get_headers(),
-            timeout=self._timeout,
-        )
+        response = self.__send("POST", path, params=params, data=body_json_str)
         response.raise_for_status()
         return response.json()
 
     def put_json(self, path, request_body: Any, params: dict | None = None) -> None:
         body_json_str = JsonUtils.to_json(request_body)
-        response = requests.put(
-            self.__prepare_url(path),
-            params=params,
-            data=body_json_str,
-            headers=self.__get_headers(),
-            timeout=self._timeout,
-        )
+        response = self.__send("PUT", path, params=params, data=body_json_str)
         response.raise_for_status()
 
     def delete(self, path: str) -> None:
-        response = requests.delete(
-            self.__prepare_url(path),
-            headers=self.__get_headers(),
-            timeout=self._timeout,
-        )
+        response = self.__send("DELETE", path)
         response.raise_for_status()
 
+    def get_connection_stats(self) -> HttpConnectionStats:
+        """
+        Returns connection usage statistics for the pooled session of this client.
+
+        New connections are counted by the connection pools of the mounted adapter, all other requests are
+        considered as sent over a reused (keep-alive) connection.
+        """
+        pool_manager = self._adapter.poolmanager
+        new_connections = sum(pool_manager.pools[key].num_connections for key in pool_manager.pools.keys())
+        total_requests = self._total_requests
+        return HttpConnectionStats(
+            totalRequests=total_requests,
+            newConnections=new_connections,
+            reusedConnections=max(total_requests - new_connections, 0),
+            retries=self._total_retries,
+        )
+
+    def __send(self, method: str, path: str, params: dict | None = None, data: str | None = None) -> requests.Response:
+        url = self.__prepare_url(path)
+        attempt = 0
+        is_reauthenticated = False
+        while True:
+            self._rate_limiter.acquire()
+            access_token = self.__get_access_token()
+            headers = self.__get_headers(access_token)
+            try:
+                response = self.__request(method, url, params, data, headers)
+            except requests.RequestException as e:
+                if not self._retry_policy.should_retry_error(method, e, attempt):
+                    raise
+                delay = self._retry_policy.get_delay(attempt)
+                self.__wait_before_retry(method, path, attempt, type(e).__name__, delay)
+                attempt += 1
+                continue
+
+            self.__on_request_completed()
+            if response.status_code == 401 and self._invalidate_auth_func is not None and not is_reauthenticated:
+                self._log.warning("Request %s %s is unauthorized, retrying with a new access token...", method, path)
+                response.close()
+                self._invalidate_auth_func(access_token)
+                is_reauthenticated = True
+                continue
+
+            if not self._retry_policy.should_retry_response(method, response, attempt):
+                return response
+            delay = self._retry_policy.get_delay(attempt, response)
+            self.__wait_before_retry(method, path, attempt, response.status_code, delay)
+            response.close()
+            attempt += 1
+
+    def __request(
+        self, method: str, url: str, params: dict | None, data: str | None, headers: dict
+    ) -> requests.Response:
+        limiter = AdaptiveConcurrencyLimiter.get_bound()
+        if limiter is None:
+            return self._session.request(method, url, params=params, data=data, headers=headers, timeout=self._timeout)
+
+        # each attempt is limited separately, so the limiter observes overload before the request is retried
+        limiter.acquire()
+        start_time = time.monotonic()
+        overloaded = False
+        try:
+            response = self._session.request(
+                method, url, params=params, data=data, headers=headers, timeout=self._timeout
+            )
+            overloaded = response.status_code == 429 or response.status_code >= 500
+            return response
+        except requests.Timeout:
+            overloaded = True
+            raise
+        finally:
+            limiter.release(time.monotonic() - start_time, overloaded)
+
+    def __wait_before_retry(self, method: str, path: str, attempt: int, reason: Any, delay: float):
+        with self._stats_lock:
+            self._total_retries += 1
+        max_retries = self._retry_policy.get_max_retries()
+        msg_template = "Retrying request %s %s (attempt %s/%s, reason: %s) in %.2fs..."
+        self._log.warning(msg_template, method, path, attempt + 1, max_retries, reason, delay)
+        time.sleep(delay)
+
+    def __on_request_completed(self):
+        with self._stats_lock:
+            self._total_requests += 1
+            total_requests = self._total_requests
+        if total_requests % self._stats_log_interval == 0:
+            stats = self.get_connection_stats()
+            msg_template = (
+                "HTTP connection stats for '%s': requests=%s, newConnections=%s, reusedConnections=%s, retries=%s"
+            )
+            self._log.info(
+                msg_template,
+                self._base_url,
+                stats.totalRequests,
+                stats.newConnections,
+                stats.reusedConnections,
+                stats.retries,
+            )
+
+    @staticmethod
+    def __create_retry_policy() -> RetryPolicy:
+        return RetryPolicy(
+            max_retries=Env().get_int_cached("HTTP_MAX_RETRIES", 3),
+            backoff_factor=Env().get_float_cached("HTTP_RETRY_BACKOFF_FACTOR", 0.5),
+            max_delay=Env().get_float_cached("HTTP_RETRY_MAX_DELAY", 60.0),
+        )
+
+    def __create_rate_limiter(self) -> TokenBucketRateLimiter:
+        rate = Env().get_float_cached("HTTP_RATE_LIMIT", 0.0)
+        burst = Env().get_int_cached("HTTP_RATE_LIMIT_BURST", max(int(rate), 1))
+        if rate > 0:
+            self._log.info("Rate limiter enabled for '%s': rate=%s/s, burst=%s", self._base_url, rate, burst)
+        return TokenBucketRateLimiter(rate, burst)
+
+    def __create_adapter(self) -> HTTPAdapter:
+        pool_size = Env().get_http_pool_size()
+        self._log.debug("Creating HTTP adapter for '%s' [poolSize=%s]", self._base_url, pool_size)
+        return HTTPAdapter(pool_maxsize=pool_size)
+
+    def __create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+        return session
+
     def __prepare_url(self, path: str) -> str:
         _path = path
         if path.startswith("/"):
@@ -67,9 +198,9 @@ class HttpClient:
     def __get_access_token(self):
         return self._auth_func()
 
-    def __get_headers(self):
+    def __get_headers(self, access_token: str):
         return {
-            "x-okapi-token": self.__get_access_token(),
+            "x-okapi-token": access_token,
             "Content-Type": "application/json",
             "x-okapi-tenant": Env().get_tenant_id(),
         }
@@ -16,5 +16,6 @@ class OkapiHttpClient(HttpClient, metaclass=SingletonMeta):
         super().__init__(
             base_url=Env().get_okapi_url(),
             auth_func=LoginService().get_okapi_token,
+            invalidate_auth_func=LoginService().invalidate_okapi_token,
             client_timeout=Env().get_http_client_timeout(),
         )
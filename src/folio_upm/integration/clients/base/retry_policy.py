@@ -0,0 +1,73 @@
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+
+class RetryPolicy:
+    """
+    Defines which requests can be retried and how long to wait before the next attempt.
+
+    Idempotent requests (GET, PUT, DELETE) are retried on gateway errors (502, 503, 504), rate limiting (429),
+    connection errors and timeouts. POST requests are retried only if the request was definitely not processed:
+    on 429, 503 and connect timeouts.
+    """
+
+    _idempotent_methods = {"GET", "HEAD", "PUT", "DELETE"}
+    _idempotent_retry_statuses = {429, 502, 503, 504}
+    _non_idempotent_retry_statuses = {429, 503}
+
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5, max_delay: float = 60.0):
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_delay = max_delay
+
+    def get_max_retries(self) -> int:
+        return self._max_retries
+
+    def should_retry_response(self, method: str, response: requests.Response, attempt: int) -> bool:
+        if attempt >= self._max_retries:
+            return False
+        if method.upper() in self._idempotent_methods:
+            return response.status_code in self._idempotent_retry_statuses
+        return response.status_code in self._non_idempotent_retry_statuses
+
+    def should_retry_error(self, method: str, error: Exception, attempt: int) -> bool:
+        if attempt >= self._max_retries:
+            return False
+        if method.upper() in self._idempotent_methods:
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+        return isinstance(error, requests.ConnectTimeout)
+
+    def get_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Returns delay before the next attempt: the Retry-After header value if present, otherwise exponential
+        backoff with full jitter. The result never exceeds the configured max delay.
+
+        :param attempt: zero-based number of the failed attempt.
+        :param response: the failed response, if any.
+        :return: delay in seconds.
+        """
+        retry_after = self.__get_retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self._max_delay)
+        return random.uniform(0, min(self._max_delay, self._backoff_factor * (2**attempt)))
+
+    @staticmethod
+    def __get_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+        if response is None:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        if retry_after.strip().isdigit():
+            return float(retry_after.strip())
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        return max((retry_at - datetime.now(tz=UTC)).total_seconds(), 0.0)
@@ -11,3 +11,10 @@ class AbstractEntityClient(Generic[E]):
         This method should be implemented by subclasses to perform the actual query.
         """
         raise NotImplementedError("Subclasses must implement this method.")
+
+    def find_page_by_query(self, cql_query: str, limit: int, offset: int) -> List[E]:
+        """
+        Finds a page of entities by a CQL query.
+        This method should be implemented by subclasses to perform the actual query.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
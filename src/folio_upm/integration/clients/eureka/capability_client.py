@@ -20,3 +20,10 @@ class CapabilityClient(AbstractEntityClient[Capability], metaclass=SingletonMeta
         response = self._http_client.get_json("/capabilities", params=query_params)
         found_capabilities = response.get("capabilities", []) if response else []
         return [Capability(**c) for c in found_capabilities]
+
+    @override
+    def find_page_by_query(self, cql_query: str, limit: int, offset: int) -> List[Capability]:
+        query_params = {"query": cql_query, "limit": limit, "offset": offset}
+        response = self._http_client.get_json("/capabilities", params=query_params)
+        found_entities = response.get("capabilities", []) if response else []
+        return [Capability(**c) for c in found_entities]
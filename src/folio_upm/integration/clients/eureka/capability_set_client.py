@@ -20,3 +20,10 @@ class CapabilitySetClient(AbstractEntityClient[CapabilitySet], metaclass=Singlet
         response = self._http_client.get_json("/capability-sets", params=query_params)
         found_capability_sets = response.get("capabilitySets", []) if response else []
         return [CapabilitySet(**cs) for cs in found_capability_sets]
+
+    @override
+    def find_page_by_query(self, cql_query: str, limit: int, offset: int) -> List[CapabilitySet]:
+        query_params = {"query": cql_query, "limit": limit, "offset": offset}
+        response = self._http_client.get_json("/capability-sets", params=query_params)
+        found_entities = response.get("capabilitySets", []) if response else []
+        return [CapabilitySet(**cs) for cs in found_entities]
@@ -19,7 +19,7 @@ class RoleCapabilitySetClient(AbstractRoleEntityClient[RoleCapabilitySet], metac
     @override
     def find_by_query(self, query: str, limit: int, offset: int) -> List[RoleCapabilitySet]:
         query_params = {"query": query, "limit": limit, "offset": offset}
-        response = self._http_client.get_json("/roles/capabilities", params=query_params)
+        response = self._http_client.get_json("/roles/capability-sets", params=query_params)
         if not isinstance(response, dict):
             error_msg_template = "Invalid response type for role-capability-sets query(%s, %s, %s): %s"
             self._log.error(error_msg_template, query, limit, offset, str(response))
@@ -13,6 +13,15 @@ class UserRolesClient(metaclass=SingletonMeta):
         self._log.debug("UserRolesClient initialized.")
         self._base_client = EurekaHttpClient()
 
+    def find_by_query(self, query: str, limit: int, offset: int) -> List[UserRole]:
+        query_params = {"query": query, "limit": limit, "offset": offset}
+        response = self._base_client.get_json("/roles/users", params=query_params)
+        if not isinstance(response, dict):
+            error_msg_template = "Invalid response type for user-roles query(%s, %s, %s): %s"
+            self._log.warning(error_msg_template, query, limit, offset, str(response))
+            return []
+        return [UserRole(**ur) for ur in response.get("userRoles", [])]
+
     def post_user_roles(self, user_id: str, role_ids: list[str]) -> List[UserRole]:
         body = {"userId": user_id, "roleIds": role_ids}
         response = self._base_client.post_json("/roles/users", request_body=body)
@@ -1,3 +1,5 @@
+from typing import Any, List, Optional, Tuple
+
 from folio_upm.integration.clients.base.eureka_http_client import EurekaHttpClient
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.utils import log_factory
@@ -11,10 +13,16 @@ class EurekaClient(metaclass=SingletonMeta):
         self._client = EurekaHttpClient()
 
     def load_page_by_query(self, resource: str, path: str, query: str, limit: int, offset: int):
+        return self.load_counted_page_by_query(resource, path, query, limit, offset)[0]
+
+    def load_counted_page_by_query(
+        self, resource: str, path: str, query: str, limit: int, offset: int
+    ) -> Tuple[List[Any], Optional[int]]:
         query_params = {"query": query, "limit": limit, "offset": offset}
         response_json = self._client.get_json(path, params=query_params)
         if not isinstance(response_json, dict):
             error_msg_template = "Invalid response type for roles query(%s, %s, %s, %s, %s): %s"
             self._log.error(error_msg_template, resource, path, query, limit, offset, str(response_json))
-            return []
-        return response_json.get(resource, [])
+            return [], None
+        total_records = response_json.get("totalRecords")
+        return response_json.get(resource, []), total_records if isinstance(total_records, int) else None
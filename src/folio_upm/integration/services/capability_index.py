@@ -0,0 +1,57 @@
+from typing import Callable, Dict, List, TypeVar
+
+from folio_upm.model.eureka.capability import Capability
+from folio_upm.model.eureka.capability_set import CapabilitySet
+
+T = TypeVar("T", Capability, CapabilitySet)
+
+
+class CapabilityIndex:
+    """
+    In-memory index of capabilities and capability sets by permission and by name.
+
+    Used to resolve role capabilities locally instead of querying Eureka for each role.
+    """
+
+    def __init__(self, capabilities: List[Capability], capability_sets: List[CapabilitySet]):
+        self._capabilities = {
+            "permission": self.__group_by(capabilities, lambda x: x.permission),
+            "name": self.__group_by(capabilities, lambda x: x.name),
+        }
+        self._capability_sets = {
+            "permission": self.__group_by(capability_sets, lambda x: x.permission),
+            "name": self.__group_by(capability_sets, lambda x: x.name),
+        }
+
+    def find_capabilities(self, field: str, values: List[str]) -> List[Capability]:
+        """
+        Finds capabilities by permission or name.
+
+        :param field: field to search by (one of: permission, name).
+        :param values: field values to search for.
+        :return: list of found capabilities in the order of the provided values.
+        """
+        return self.__find(self._capabilities[field], values)
+
+    def find_capability_sets(self, field: str, values: List[str]) -> List[CapabilitySet]:
+        """
+        Finds capability sets by permission or name.
+
+        :param field: field to search by (one of: permission, name).
+        :param values: field values to search for.
+        :return: list of found capability sets in the order of the provided values.
+        """
+        return self.__find(self._capability_sets[field], values)
+
+    @staticmethod
+    def __find(entities_by_key: Dict[str, List[T]], values: List[str]) -> List[T]:
+        return [entity for value in values for entity in entities_by_key.get(value, [])]
+
+    @staticmethod
+    def __group_by(entities: List[T], key_mapper: Callable[[T], str]) -> Dict[str, List[T]]:
+        entities_by_key = dict[str, List[T]]()
+        for entity in entities:
+            key = key_mapper(entity)
+            if key:
+                entities_by_key.setdefault(key, []).append(entity)
+        return entities_by_key
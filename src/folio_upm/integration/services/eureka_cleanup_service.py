@@ -1,25 +1,45 @@
-from typing import List
+from typing import Iterable, Optional
 
 from folio_upm.integration.services.role_capability_facade import RoleCapabilityFacade
 from folio_upm.integration.services.role_service import RoleService
 from folio_upm.model.cleanup.hash_role_cleanup_record import HashRoleCleanupRecord
 from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.load.eureka_load_result import EurekaLoadResult
 from folio_upm.model.report.hash_roles_cleanup_report import HashRolesCleanupReport
+from folio_upm.model.report.http_request_result import HttpRequestResult
 from folio_upm.utils import log_factory
+from folio_upm.utils.iterable_utils import IterableUtils
+from folio_upm.utils.upm_env import Env
 
 
 class EurekaCleanupService(metaclass=SingletonMeta):
 
-    def __init__(self, hash_role_cleanup_records: List[HashRoleCleanupRecord]):
+    def __init__(
+        self,
+        hash_role_cleanup_records: Iterable[HashRoleCleanupRecord],
+        eureka_load_result: Optional[EurekaLoadResult] = None,
+    ):
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._hash_role_cleanup_records = hash_role_cleanup_records
+        self._eureka_load_result = eureka_load_result
         self._role_service = RoleService()
         self._role_capability_facade = RoleCapabilityFacade()
 
     def perform_cleanup(self) -> HashRolesCleanupReport:
+        """
+        Updates capabilities of hash roles and removes roles without capabilities.
+
+        Cleanup records are consumed in batches of CLEANUP_BATCH_SIZE, so only a single batch of records is kept
+        in memory, when they are provided as a stream. Roles of a batch are removed after their capabilities
+        are updated.
+        """
         self._log.info("Starting Eureka Hash-Roles cleanup process...")
-        records = self._hash_role_cleanup_records
-        role_capabilities_rs = self._role_capability_facade.update_role_capabilities(records)
-        removed_roles_rs = self._role_service.delete_roles(records)
+        batch_size = Env().get_int_cached("CLEANUP_BATCH_SIZE", default_value=1000)
+        context = self._role_capability_facade.create_update_context(self._eureka_load_result)
+        role_capabilities_rs = list[HttpRequestResult]()
+        removed_roles_rs = list[HttpRequestResult]()
+        for records in IterableUtils.iter_partitions(self._hash_role_cleanup_records, batch_size):
+            role_capabilities_rs += self._role_capability_facade.update_role_capabilities_in_context(records, context)
+            removed_roles_rs += self._role_service.delete_roles(records)
         self._log.info("Eureka Hash-Roles cleanup process completed successfully.")
         return HashRolesCleanupReport(roles=removed_roles_rs, roleCapabilities=role_capabilities_rs)
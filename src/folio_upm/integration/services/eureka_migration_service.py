@@ -1,13 +1,32 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from folio_upm.integration.services.role_capability_context import RoleCapabilityContext
 from folio_upm.integration.services.role_capability_facade import RoleCapabilityFacade
+from folio_upm.integration.services.role_capability_service import RoleCapabilityService
+from folio_upm.integration.services.role_capability_set_service import RoleCapabilitySetService
 from folio_upm.integration.services.role_service import RoleService
 from folio_upm.integration.services.role_users_service import RoleUsersService
+from folio_upm.model.analysis.analyzed_role import AnalyzedRole
+from folio_upm.model.analysis.analyzed_role_capabilities import AnalyzedRoleCapabilities
+from folio_upm.model.analysis.analyzed_user_roles import AnalyzedUserRoles
 from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.load.eureka_load_result import EurekaLoadResult
 from folio_upm.model.report.eureka_migration_report import EurekaMigrationReport
+from folio_upm.model.report.http_request_result import HttpRequestResult
 from folio_upm.model.result.eureka_migration_data import EurekaMigrationData
+from folio_upm.storage.migration_journal import MigrationJournal
 from folio_upm.utils import log_factory
+from folio_upm.utils.concurrency_utils import ConcurrencyUtils
+from folio_upm.utils.task_scheduler import DependencyScheduler
+from folio_upm.utils.upm_env import Env
 
 
 class EurekaMigrationService(metaclass=SingletonMeta):
+
+    _roles_stage = "roles"
+    _rc_stage = "roleCapabilities"
+    _user_roles_stage = "roleUsers"
+
     def __init__(self):
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._log.info("EurekaService initialized.")
@@ -15,10 +34,164 @@ class EurekaMigrationService(metaclass=SingletonMeta):
         self._role_users_service = RoleUsersService()
         self._role_capability_facade = RoleCapabilityFacade()
 
-    def migrate_to_eureka(self, eureka_data: EurekaMigrationData) -> EurekaMigrationReport:
+    def migrate_to_eureka(
+        self,
+        eureka_data: EurekaMigrationData,
+        eureka_load_result: Optional[EurekaLoadResult] = None,
+        journal: Optional[MigrationJournal] = None,
+        external_role_names: Optional[Set[str]] = None,
+    ) -> EurekaMigrationReport:
+        """
+        Creates roles and assigns role capabilities and user roles in Eureka.
+
+        All operations are performed on a single worker pool: capabilities are assigned to a role as soon as the
+        role is created, and a user is assigned once all roles of the user are created.
+
+        :param eureka_data: migration data, generated by the permission analysis.
+        :param eureka_load_result: previously collected Eureka data, used to resolve capabilities by name.
+        :param journal: checkpoint journal, entries completed in the previous run are skipped.
+        :param external_role_names: names of roles, created by other migration shards, users of these roles are
+            assigned after all roles of this shard are processed, roles still missing at that point are reported
+            as not found and retried with the resumed migration.
+        :return: migration report, including results of journaled entries.
+        """
         self._log.info("Eureka migration started...")
-        return EurekaMigrationReport(
-            roles=self._role_service.create_roles(eureka_data.roles),
-            roleCapabilities=self._role_capability_facade.assign_role_entities(eureka_data.roleCapabilities),
-            roleUsers=self._role_users_service.assign_users(eureka_data.userRoles),
+        _journal = journal or MigrationJournal(f"migration-journal-{Env().get_migration_strategy().get_name()}")
+        completed_roles = _journal.get_completed_results(self._roles_stage)
+        completed_rcs = _journal.get_completed_results(self._rc_stage)
+        completed_urs = _journal.get_completed_results(self._user_roles_stage)
+        roles = [ar for ar in eureka_data.roles if ar.role.name not in completed_roles]
+        role_capabilities = [arc for arc in eureka_data.roleCapabilities if arc.roleName not in completed_rcs]
+        user_roles = [aur for aur in eureka_data.userRoles if aur.userId not in completed_urs]
+
+        self._role_service.load_roles_index()
+        existing_role_names = self._role_service.find_existing_role_names(roles)
+        existing_relations = self.__load_existing_relations()
+        assigned_role_ids_by_user = RoleUsersService.group_role_ids_by_user(existing_relations.roleUsers)
+
+        concurrency = Env().get_int_cached("MIGRATION_CONCURRENCY", default_value=1)
+        total_tasks = len(roles) + len(role_capabilities) + len(user_roles)
+        self._log.info("Running %s migration task(s) [concurrency=%s]...", total_tasks, concurrency)
+        scheduler = DependencyScheduler(concurrency, self.__log_progress)
+        role_task_keys = dict[str, Tuple[str, int]]()
+        for i, ar in enumerate(roles):
+            role_task_keys[ar.role.name] = (self._roles_stage, i)
+            scheduler.add_task(
+                (self._roles_stage, i),
+                self.__journaled(
+                    _journal, self._roles_stage, ar.role.name, self.__create_role(ar, existing_role_names)
+                ),
+            )
+        if role_capabilities:
+            rc_context = self._role_capability_facade.create_context(eureka_load_result, existing_relations)
+            for i, arc in enumerate(role_capabilities):
+                scheduler.add_task(
+                    (self._rc_stage, i),
+                    self.__journaled(_journal, self._rc_stage, arc.roleName, self.__assign_role(arc, rc_context)),
+                    self.__get_role_task_keys(role_task_keys, [arc.roleName]),
+                )
+        for i, aur in enumerate(user_roles):
+            assigned_role_ids = assigned_role_ids_by_user.get(aur.userId)
+            scheduler.add_task(
+                (self._user_roles_stage, i),
+                self.__journaled(
+                    _journal, self._user_roles_stage, aur.userId, self.__assign_user(aur, assigned_role_ids)
+                ),
+                self.__get_user_dependencies(role_task_keys, aur.roleNames, external_role_names or set()),
+            )
+
+        task_results = scheduler.run()
+        _journal.flush()
+        migration_report = EurekaMigrationReport(
+            roles=self.__collect_results(completed_roles, task_results, self._roles_stage, len(roles)),
+            roleCapabilities=self.__collect_results(
+                completed_rcs, task_results, self._rc_stage, len(role_capabilities)
+            ),
+            roleUsers=self.__collect_results(completed_urs, task_results, self._user_roles_stage, len(user_roles)),
         )
+        self._role_service.log_cache_stats()
+        self._role_capability_facade.log_cache_stats()
+        return migration_report
+
+    def __create_role(self, ar: AnalyzedRole, existing_role_names: Set[str]) -> Callable[[], List[HttpRequestResult]]:
+        return lambda: [self._role_service.create_role(ar, existing_role_names)]
+
+    def __assign_role(
+        self, arc: AnalyzedRoleCapabilities, context: RoleCapabilityContext
+    ) -> Callable[[], List[HttpRequestResult]]:
+        return lambda: self._role_capability_facade.assign_role(arc, context)
+
+    def __assign_user(
+        self, aur: AnalyzedUserRoles, assigned_role_ids: Optional[Set[str]]
+    ) -> Callable[[], List[HttpRequestResult]]:
+        return lambda: self._role_users_service.assign_user(aur, assigned_role_ids)
+
+    def __log_progress(self, processed: int, total: int) -> None:
+        self._log.info("Migration tasks processed: %s/%s", processed, total)
+
+    def __load_existing_relations(self) -> EurekaLoadResult:
+        if not Env().get_bool_cached("MIGRATION_PRE_DIFF_ENABLED", default_value=True):
+            self._log.info("Pre-diff against existing Eureka relations is disabled.")
+            return EurekaLoadResult()
+
+        concurrency = Env().get_int_cached("RESOURCE_LOAD_CONCURRENCY", default_value=1)
+        self._log.info("Loading existing role and user relations [concurrency=%s]...", concurrency)
+        loaders = [
+            RoleCapabilityService().find_all_role_entities,
+            RoleCapabilitySetService().find_all_role_entities,
+            self._role_users_service.find_all_user_roles,
+        ]
+        role_capabilities, role_capability_sets, user_roles = ConcurrencyUtils.map_ordered(
+            self.__call_loader, loaders, concurrency
+        )
+        self._log.info(
+            "Existing relations loaded: roleCapabilities=%s, roleCapabilitySets=%s, roleUsers=%s",
+            len(role_capabilities),
+            len(role_capability_sets),
+            len(user_roles),
+        )
+        return EurekaLoadResult(
+            roleCapabilities=role_capabilities,
+            roleCapabilitySets=role_capability_sets,
+            roleUsers=user_roles,
+        )
+
+    @staticmethod
+    def __journaled(
+        journal: MigrationJournal, stage: str, key: str, task: Callable[[], List[HttpRequestResult]]
+    ) -> Callable[[], List[HttpRequestResult]]:
+        def journaled_task() -> List[HttpRequestResult]:
+            results = task()
+            journal.record(stage, key, results)
+            return results
+
+        return journaled_task
+
+    @staticmethod
+    def __get_role_task_keys(
+        role_task_keys: Dict[str, Tuple[str, int]], role_names: List[str]
+    ) -> List[Tuple[str, int]]:
+        return [role_task_keys[role_name] for role_name in role_names if role_name in role_task_keys]
+
+    @staticmethod
+    def __get_user_dependencies(
+        role_task_keys: Dict[str, Tuple[str, int]], role_names: List[str], external_role_names: Set[str]
+    ) -> List[Tuple[str, int]]:
+        # roles of other shards are created concurrently, so the user waits for all roles of this shard instead
+        if any(role_name in external_role_names for role_name in role_names):
+            return list(role_task_keys.values())
+        return EurekaMigrationService.__get_role_task_keys(role_task_keys, role_names)
+
+    @staticmethod
+    def __collect_results(
+        completed_results: Dict[str, List[HttpRequestResult]],
+        task_results: Dict[Hashable, List[HttpRequestResult]],
+        stage: str,
+        total_tasks: int,
+    ) -> List[HttpRequestResult]:
+        journaled_results = [result for key_results in completed_results.values() for result in key_results]
+        return journaled_results + [result for i in range(total_tasks) for result in task_results[(stage, i)]]
+
+    @staticmethod
+    def __call_loader(loader: Callable[[], Any]) -> Any:
+        return loader()
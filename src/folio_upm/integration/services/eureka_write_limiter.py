@@ -0,0 +1,32 @@
+from contextlib import AbstractContextManager
+
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.utils import log_factory
+from folio_upm.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+from folio_upm.utils.upm_env import Env
+
+
+class EurekaWriteLimiter(metaclass=SingletonMeta):
+    """
+    Adaptive concurrency limiter, shared by services creating roles and role/user relations in Eureka.
+
+    The limiter is bound to the thread for a write call, so HttpClient limits each request attempt and reports
+    5xx, 429 responses and timeouts as overload signals before retrying. The limiter is disabled if
+    WRITE_CONCURRENCY_LIMIT_MAX is not positive.
+    """
+
+    def __init__(self):
+        self._log = log_factory.get_logger(self.__class__.__name__)
+        max_limit = Env().get_int_cached("WRITE_CONCURRENCY_LIMIT_MAX", default_value=0)
+        self._limiter = AdaptiveConcurrencyLimiter(
+            "eureka-writes",
+            max_limit=max_limit,
+            min_limit=Env().get_int_cached("WRITE_CONCURRENCY_LIMIT_MIN", default_value=1),
+            target_latency=Env().get_float_cached("WRITE_LATENCY_P95_TARGET", default_value=2.0),
+            target_overload_rate=Env().get_float_cached("WRITE_OVERLOAD_RATE_TARGET", default_value=0.05),
+        )
+        if self._limiter.is_enabled():
+            self._log.info("Adaptive concurrency limiter enabled for Eureka writes [maxLimit=%s]", max_limit)
+
+    def limit(self) -> AbstractContextManager[None]:
+        return self._limiter.bind()
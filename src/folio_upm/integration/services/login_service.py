@@ -1,6 +1,8 @@
-import os
+import threading
+import time
+from typing import Callable, Dict, Optional
 
-from cachetools import TTLCache, cached
+import jwt
 
 from folio_upm.integration.clients.login_client import LoginClient
 from folio_upm.model.cls_support import SingletonMeta
@@ -9,21 +11,100 @@ from folio_upm.utils.upm_env import Env
 
 
 class LoginService(metaclass=SingletonMeta):
-    """Service for managing login tokens for Okapi and Eureka."""
+    """
+    Service for managing login tokens for Okapi and Eureka.
+
+    Tokens are refreshed shortly before the expiration time from the 'exp' claim (ACCESS_TOKEN_TTL is used if the
+    token does not provide it), only one login request per token is performed at the same time.
+    """
+
+    _okapi = "okapi"
+    _eureka = "eureka"
 
     def __init__(self):
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._log.debug("LoginService initialized.")
         self._login_client = LoginClient()
+        self._default_ttl = Env().get_int_cached("ACCESS_TOKEN_TTL", default_value=60)
+        self._refresh_skew = Env().get_int_cached("ACCESS_TOKEN_REFRESH_SKEW", default_value=30)
+        self._tokens: Dict[str, str] = {}
+        self._refresh_times: Dict[str, float] = {}
+        self._locks = {self._okapi: threading.Lock(), self._eureka: threading.Lock()}
+
+    def get_okapi_token(self) -> str:
+        return self.__get_token(self._okapi, self.__login_to_okapi)
+
+    def get_eureka_token(self) -> str:
+        return self.__get_token(self._eureka, self.__login_to_eureka)
+
+    def invalidate_okapi_token(self, token: Optional[str] = None):
+        """
+        Invalidates cached Okapi token, so the next token request performs login.
+
+        :param token: rejected token, if it is already refreshed by another thread - it will be kept.
+        """
+        self.__invalidate_token(self._okapi, token)
+
+    def invalidate_eureka_token(self, token: Optional[str] = None):
+        """
+        Invalidates cached Eureka token, so the next token request performs login.
+
+        :param token: rejected token, if it is already refreshed by another thread - it will be kept.
+        """
+        self.__invalidate_token(self._eureka, token)
+
+    def __get_token(self, key: str, login_func: Callable[[], str]) -> str:
+        token = self.__get_valid_token(key)
+        if token is not None:
+            return token
+
+        with self._locks[key]:
+            token = self.__get_valid_token(key)
+            if token is not None:
+                return token
+            token = login_func()
+            refresh_time = self.__get_refresh_time(token)
+            self._log.debug("Token '%s' will be refreshed in %.0fs", key, refresh_time - time.time())
+            self._tokens[key] = token
+            self._refresh_times[key] = refresh_time
+            return token
+
+    def __get_valid_token(self, key: str) -> Optional[str]:
+        token = self._tokens.get(key)
+        if token is not None and time.time() < self._refresh_times.get(key, 0):
+            return token
+        return None
+
+    def __invalidate_token(self, key: str, token: Optional[str]):
+        with self._locks[key]:
+            if token is None or self._tokens.get(key) == token:
+                self._log.info("Token '%s' is invalidated.", key)
+                self._tokens.pop(key, None)
+                self._refresh_times.pop(key, None)
+
+    def __get_refresh_time(self, token: str) -> float:
+        now = time.time()
+        expiration_time = self.__get_expiration_time(token)
+        if expiration_time is None or expiration_time <= now:
+            return now + self._default_ttl
+        token_lifetime = expiration_time - now
+        return now + max(token_lifetime - self._refresh_skew, token_lifetime / 2)
+
+    def __get_expiration_time(self, token: str) -> Optional[float]:
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+        except jwt.PyJWTError as e:
+            self._log.debug("Failed to decode access token, default TTL is used: %s", e)
+            return None
+        expiration_time = claims.get("exp")
+        return float(expiration_time) if isinstance(expiration_time, (int, float)) else None
 
-    @cached(cache=TTLCache(maxsize=10, ttl=int(os.getenv("ACCESS_TOKEN_TTL", "60"))))
-    def get_okapi_token(self):
+    def __login_to_okapi(self) -> str:
         username = Env().require_env("OKAPI_ADMIN_USERNAME", log_result=False)
         password = Env().require_env("OKAPI_ADMIN_PASSWORD", log_result=False)
         return self._login_client.login_as_admin(Env().get_okapi_url(), username, password)
 
-    @cached(cache=TTLCache(maxsize=10, ttl=int(os.getenv("ACCESS_TOKEN_TTL", "60"))))
-    def get_eureka_token(self):
+    def __login_to_eureka(self) -> str:
         username = Env().require_env("EUREKA_ADMIN_USERNAME", log_result=False)
         password = Env().require_env("EUREKA_ADMIN_PASSWORD", log_result=False)
         return self._login_client.login_as_admin(Env().get_eureka_url(), username, password)
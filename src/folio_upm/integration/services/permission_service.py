@@ -1,3 +1,5 @@
+from typing import Any, Dict, List
+
 from folio_upm.integration.clients.permissions_client import PermissionsClient
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.utils import log_factory
@@ -17,21 +19,43 @@ class PermissionService(metaclass=SingletonMeta):
         data_loader = PagedDataLoader("permissions", self.__load_ps_page(expanded), query, batch_limit=100000)
         return data_loader.load()
 
-    def load_permission_users(self, permissions):
+    def load_permission_users(self, permission_lists: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Loads permission users granted to the permissions from each of the given lists.
+
+        Permission user identifiers are deduplicated across all lists, so each permission user is requested once.
+
+        :param permission_lists: lists of permissions (dicts with 'grantedTo' values).
+        :return: list of loaded permission users per each provided permission list (in the same order).
+        """
         self._log.info("Loading permission users...")
-        all_granted_to_unique = OrderedSet()
-        for permission in permissions:
-            granted_to = permission.get("grantedTo", [])
-            all_granted_to_unique += granted_to
+        granted_to_id_lists = [self.__collect_granted_to_ids(permissions) for permissions in permission_lists]
+        all_granted_to_unique = OrderedSet[str]()
+        for granted_to_ids in granted_to_id_lists:
+            all_granted_to_unique += granted_to_ids
 
         partitioned_data_loader = PartitionedDataLoader(
             "permission users",
-            list(all_granted_to_unique),
+            all_granted_to_unique.to_list(),
             lambda q: self._client.load_user_permissions_by_ids(q),
             lambda ids: CQL.any_match_by_field("id", ids),
         )
 
-        return partitioned_data_loader.load()
+        permission_users = partitioned_data_loader.load()
+        permission_users_by_id = {pu.get("id"): pu for pu in permission_users if isinstance(pu, dict)}
+        self._log.info("Permission users loaded: %s", len(permission_users_by_id))
+        return [self.__get_permission_users(ids, permission_users_by_id) for ids in granted_to_id_lists]
+
+    @staticmethod
+    def __collect_granted_to_ids(permissions: List[Dict[str, Any]]) -> OrderedSet[str]:
+        granted_to_ids = OrderedSet[str]()
+        for permission in permissions:
+            granted_to_ids += permission.get("grantedTo", [])
+        return granted_to_ids
+
+    @staticmethod
+    def __get_permission_users(granted_to_ids: OrderedSet[str], permission_users_by_id: Dict[str, Any]) -> List[Any]:
+        return [permission_users_by_id[pu_id] for pu_id in granted_to_ids if pu_id in permission_users_by_id]
 
     def __load_ps_page(self, expanded=False):
         return lambda query, limit, offset: self._client.load_perms_page(query, limit, offset, expanded)
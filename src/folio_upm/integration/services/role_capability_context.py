@@ -0,0 +1,21 @@
+from typing import Dict, Optional, Set
+
+from folio_upm.integration.services.capability_index import CapabilityIndex
+
+
+class RoleCapabilityContext:
+    """
+    Data shared by role capability assignments of a single migration run.
+
+    Contains capability index and IDs of capabilities and capability sets, already assigned to roles.
+    """
+
+    def __init__(
+        self,
+        capability_index: Optional[CapabilityIndex],
+        assigned_capability_ids: Dict[str, Set[str]],
+        assigned_capability_set_ids: Dict[str, Set[str]],
+    ):
+        self.capability_index = capability_index
+        self.assigned_capability_ids = assigned_capability_ids
+        self.assigned_capability_set_ids = assigned_capability_set_ids
@@ -1,18 +1,23 @@
-from typing import Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from folio_upm.integration.services.capability_index import CapabilityIndex
+from folio_upm.integration.services.role_capability_context import RoleCapabilityContext
 from folio_upm.integration.services.role_capability_service import RoleCapabilityService
 from folio_upm.integration.services.role_capability_set_service import RoleCapabilitySetService
+from folio_upm.integration.services.role_entity_service import RoleEntityService
 from folio_upm.integration.services.role_service import RoleService
 from folio_upm.model.analysis.analyzed_role_capabilities import AnalyzedRoleCapabilities
 from folio_upm.model.cleanup.hash_role_cleanup_record import HashRoleCleanupRecord
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.model.eureka.capability import Capability
 from folio_upm.model.eureka.capability_set import CapabilitySet
+from folio_upm.model.load.eureka_load_result import EurekaLoadResult
 from folio_upm.model.report.http_request_result import HttpRequestResult
 from folio_upm.utils import log_factory
-from folio_upm.utils.cql import CQL
+from folio_upm.utils.concurrency_utils import ConcurrencyUtils
 from folio_upm.utils.iterable_utils import IterableUtils
 from folio_upm.utils.ordered_set import OrderedSet
+from folio_upm.utils.upm_env import Env
 
 
 class RoleCapabilityFacade(metaclass=SingletonMeta):
@@ -24,71 +29,157 @@ class RoleCapabilityFacade(metaclass=SingletonMeta):
         self._rc_service = RoleCapabilityService()
         self._rcs_service = RoleCapabilitySetService()
 
-    def assign_role_entities(self, arc_list: List[AnalyzedRoleCapabilities]) -> List[HttpRequestResult]:
-        migration_results = list[HttpRequestResult]()
-        role_capabilities_counter = 1
-        total_role_capabilities = len(arc_list)
-        self._log.info("Total role capabilities to assign: %s", total_role_capabilities)
-        for analyzed_role_capabilities in arc_list:
-            role_name = analyzed_role_capabilities.roleName
-
-            try:
-                role_by_name = self._role_service.find_role_by_name(role_name)
-            except Exception as e:
-                self._log.error("Unexpected error while finding role by name: %s", role_name, e)
-                err_message = f"Failed to find role by name: {role_name}, {str(e)}"
-                http_request_result = HttpRequestResult(
-                    status="error",
-                    srcEntityName="role",
-                    srcEntityId=role_name,
-                    tarEntityName="role-capability | role-capability-set",
-                    tarEntityId=None,
-                    reason=err_message,
-                )
-
-                migration_results.append(http_request_result)
-                continue
-
-            if role_by_name is None:
-                self._log.warning("Role '%s' not found by name, skipping capability assignment...", role_name)
-                migration_results.append(HttpRequestResult.role_capability_not_found_result(role_name))
-                continue
-
-            capability_sets, capabilities, issues = self.__find_role_entities(analyzed_role_capabilities)
-            migration_results += [self.__create_unmatched_result(role_by_name, i) for i in issues]
-            role_capability_assign_rs = self._rc_service.assign_to_role(role_by_name, capabilities)
-            role_set_assign_rs = self._rcs_service.assign_to_role(role_by_name, capability_sets)
-            migration_results += role_capability_assign_rs
-            migration_results += role_set_assign_rs
-            self._log.info("Role capabilities processed: %s/%s", role_capabilities_counter, total_role_capabilities)
-            role_capabilities_counter += 1
-
-        self._log.info("Role capabilities assigned: %s", total_role_capabilities)
-        return migration_results
-
-    def update_role_capabilities(self, cleanup_records: List[HashRoleCleanupRecord]) -> List[HttpRequestResult]:
-        cleanup_result = list[HttpRequestResult]()
-        total_records = len(cleanup_records)
-        self._log.info("Number of cleanup records: %s", total_records)
+    def create_context(
+        self,
+        eureka_load_result: Optional[EurekaLoadResult] = None,
+        existing_relations: Optional[EurekaLoadResult] = None,
+    ) -> RoleCapabilityContext:
+        """
+        Creates context for role capability assignments.
+
+        :param eureka_load_result: previously collected Eureka data, used to resolve capabilities by name.
+        :param existing_relations: existing role-capabilities and role-capability-sets, which are not sent again.
+        :return: context to be used in role capability assignments.
+        """
+        relations = existing_relations or EurekaLoadResult()
+        return RoleCapabilityContext(
+            capability_index=self.__create_capability_index(eureka_load_result),
+            assigned_capability_ids=self.__group_by_role(relations.roleCapabilities, self._rc_service),
+            assigned_capability_set_ids=self.__group_by_role(relations.roleCapabilitySets, self._rcs_service),
+        )
 
-        record_counter = 0
-        for hr in cleanup_records:
-            cleanup_result += self._rcs_service.update(hr.role, hr.capabilitySets)
-            record_counter += 1
-            self._log.info("Role-capability-sets processed: %s/%s", record_counter, total_records)
-        self._log.info("Role-capability-sets updated: %s", record_counter)
+    def assign_role(self, arc: AnalyzedRoleCapabilities, context: RoleCapabilityContext) -> List[HttpRequestResult]:
+        """
+        Assigns capabilities and capability sets to a single role.
+
+        :param arc: analyzed role capabilities.
+        :param context: context, created by create_context method.
+        :return: list of HttpRequestResult for each assignment.
+        """
+        role_name = arc.roleName
+        try:
+            role_by_name = self._role_service.find_role_by_name(role_name)
+        except Exception as e:
+            self._log.error("Unexpected error while finding role by name: %s", role_name, e)
+            err_message = f"Failed to find role by name: {role_name}, {str(e)}"
+            http_request_result = HttpRequestResult(
+                status="error",
+                srcEntityName="role",
+                srcEntityId=role_name,
+                tarEntityName="role-capability | role-capability-set",
+                tarEntityId=None,
+                reason=err_message,
+            )
+            return [http_request_result]
+
+        if role_by_name is None:
+            self._log.warning("Role '%s' not found by name, skipping capability assignment...", role_name)
+            return [HttpRequestResult.role_capability_not_found_result(role_name)]
+
+        capability_sets, capabilities, issues = self.__find_role_entities(arc, context.capability_index)
+        role_results = [self.__create_unmatched_result(role_by_name, i) for i in issues]
+        role_id = role_by_name.id
+        role_results += self._rc_service.assign_to_role(
+            role_by_name, capabilities, context.assigned_capability_ids.get(role_id)
+        )
+        role_results += self._rcs_service.assign_to_role(
+            role_by_name, capability_sets, context.assigned_capability_set_ids.get(role_id)
+        )
+        return role_results
+
+    def update_role_capabilities(
+        self,
+        cleanup_records: List[HashRoleCleanupRecord],
+        current_relations: Optional[EurekaLoadResult] = None,
+    ) -> List[HttpRequestResult]:
+        """
+        Replaces capability sets and capabilities of hash roles with values from cleanup records.
+
+        Roles are processed concurrently, capability sets are updated before capabilities within each role.
+
+        :param cleanup_records: list of hash role cleanup records.
+        :param current_relations: current role-capabilities and role-capability-sets, update requests are skipped
+            for roles, which already have the target relations.
+        :return: list of HttpRequestResult for each update.
+        """
+        context = self.create_update_context(current_relations)
+        return self.update_role_capabilities_in_context(cleanup_records, context)
+
+    def update_role_capabilities_in_context(
+        self, cleanup_records: List[HashRoleCleanupRecord], context: Optional[RoleCapabilityContext]
+    ) -> List[HttpRequestResult]:
+        """
+        Replaces capability sets and capabilities of hash roles, using the context created once for all batches.
+
+        :param cleanup_records: list of hash role cleanup records.
+        :param context: update context, created by create_update_context.
+        :return: list of HttpRequestResult for each update.
+        """
+        total_records = len(cleanup_records)
+        concurrency = Env().get_int_cached("CLEANUP_CONCURRENCY", default_value=1)
+        self._log.info("Number of cleanup records: %s [concurrency=%s]", total_records, concurrency)
+        update_rs = ConcurrencyUtils.map_ordered(
+            lambda hr: self.__update_role(hr, context),
+            cleanup_records,
+            concurrency,
+            lambda processed, total: self._log.info("Role capabilities processed: %s/%s", processed, total),
+        )
+        self._log.info("Role capabilities updated: %s", total_records)
+        return [result for role_results in update_rs for result in role_results]
+
+    def log_cache_stats(self) -> None:
+        self._rcs_service.log_cache_stats()
+        self._rc_service.log_cache_stats()
+
+    def create_update_context(self, current_relations: Optional[EurekaLoadResult]) -> Optional[RoleCapabilityContext]:
+        """
+        Creates context for hash role updates, grouping current relations by role.
+
+        :param current_relations: current role-capabilities and role-capability-sets, None to update all roles.
+        :return: update context or None if current relations are not provided.
+        """
+        if current_relations is None:
+            return None
+        return RoleCapabilityContext(
+            capability_index=None,
+            assigned_capability_ids=self.__group_by_role(current_relations.roleCapabilities, self._rc_service),
+            assigned_capability_set_ids=self.__group_by_role(current_relations.roleCapabilitySets, self._rcs_service),
+        )
 
-        record_counter = 0
-        for hr in cleanup_records:
-            cleanup_result += self._rc_service.update(hr.role, hr.capabilities)
-            record_counter += 1
-            self._log.info("Role-capabilities processed: %s/%s", record_counter, total_records)
-        self._log.info("Role-capabilities updated: %s", record_counter)
+    def __update_role(
+        self, hr: HashRoleCleanupRecord, context: Optional[RoleCapabilityContext]
+    ) -> List[HttpRequestResult]:
+        assigned_cs_ids, assigned_c_ids = None, None
+        if context is not None:
+            assigned_cs_ids = context.assigned_capability_set_ids.get(hr.role.id, set())
+            assigned_c_ids = context.assigned_capability_ids.get(hr.role.id, set())
+        role_results = self._rcs_service.update(hr.role, hr.capabilitySets, assigned_cs_ids)
+        role_results += self._rc_service.update(hr.role, hr.capabilities, assigned_c_ids)
+        return role_results
 
-        return cleanup_result
+    @staticmethod
+    def __group_by_role(role_entities: List[Any], role_entity_service: RoleEntityService) -> Dict[str, Set[str]]:
+        entity_ids_by_role = dict[str, Set[str]]()
+        for role_entity in role_entities:
+            target_entity_id = role_entity_service.get_target_entity_id(role_entity)
+            entity_ids_by_role.setdefault(role_entity.roleId, set()).add(target_entity_id)
+        return entity_ids_by_role
+
+    def __create_capability_index(self, eureka_load_result: Optional[EurekaLoadResult]) -> CapabilityIndex:
+        if eureka_load_result is not None:
+            capabilities = eureka_load_result.capabilities
+            capability_sets = eureka_load_result.capabilitySets
+            self._log.info("Creating capability index from collected Eureka data...")
+        else:
+            self._log.info("Eureka data is not provided, loading capabilities for capability index...")
+            capabilities = self._rc_service.find_all()
+            capability_sets = self._rcs_service.find_all()
+        msg_template = "Capability index created: capabilities=%s, capabilitySets=%s"
+        self._log.info(msg_template, len(capabilities), len(capability_sets))
+        return CapabilityIndex(capabilities, capability_sets)
 
     def __find_role_entities(
-        self, arc: AnalyzedRoleCapabilities
+        self, arc: AnalyzedRoleCapabilities, capability_index: Optional[CapabilityIndex]
     ) -> Tuple[List[CapabilitySet], List[Capability], List[str]]:
         found_capability_sets = list[CapabilitySet]()
         found_capabilities = list[Capability]()
@@ -98,14 +189,14 @@ class RoleCapabilityFacade(metaclass=SingletonMeta):
 
         # gather capabilities by permission name
         ps_names = [x.permissionName for x in arc.capabilities if x.permissionName]
-        entities_by_ps_name = self.__find_by(ps_names, CQL.any_match_by_permission, lambda x: x.permission)
+        entities_by_ps_name = self.__find_by(ps_names, "permission", lambda x: x.permission, capability_index)
         found_capabilities += entities_by_ps_name[1]
         found_capability_sets += entities_by_ps_name[0]
         unmatched_values += entities_by_ps_name[2]
 
         # gather extra capabilities by name (if eureka load result was not provided)
         capability_names = [x.name for x in arc.capabilities if not x.permissionName and x.name]
-        entities_by_name = self.__find_by(capability_names, CQL.any_match_by_name, lambda x: x.name)
+        entities_by_name = self.__find_by(capability_names, "name", lambda x: x.name, capability_index)
         found_capabilities += entities_by_name[1]
         found_capability_sets += entities_by_name[0]
         unmatched_values += entities_by_name[2]
@@ -123,18 +214,29 @@ class RoleCapabilityFacade(metaclass=SingletonMeta):
     def __find_by(
         self,
         identifiers: List[str],
-        query_builder_func: Callable[[List[str]], str],
+        field: str,
         value_accessor: Callable[[Capability | CapabilitySet], str],
+        capability_index: Optional[CapabilityIndex],
     ) -> Tuple[List[CapabilitySet], List[Capability], List[str]]:
 
         found_capability_sets = list[CapabilitySet]()
-        unmatched_values = OrderedSet[str](identifiers)
-        found_capability_sets += self._rcs_service.find_by(unmatched_values.to_list(), query_builder_func)
-        unmatched_values.remove_all([value_accessor(cs) for cs in found_capability_sets])
-
         found_capabilities = list[Capability]()
-        found_capabilities += self._rc_service.find_by(unmatched_values.to_list(), query_builder_func)
-        unmatched_values.remove_all([value_accessor(c) for c in found_capabilities])
+        unmatched_values = OrderedSet[str](identifiers)
+        if capability_index is not None:
+            found_capability_sets += capability_index.find_capability_sets(field, unmatched_values.to_list())
+            unmatched_values.remove_all([value_accessor(cs) for cs in found_capability_sets])
+            found_capabilities += capability_index.find_capabilities(field, unmatched_values.to_list())
+            unmatched_values.remove_all([value_accessor(c) for c in found_capabilities])
+            if not unmatched_values:
+                return found_capability_sets, found_capabilities, []
+
+        capability_sets = self._rcs_service.find_by_field(field, unmatched_values.to_list())
+        found_capability_sets += capability_sets
+        unmatched_values.remove_all([value_accessor(cs) for cs in capability_sets])
+
+        capabilities = self._rc_service.find_by_field(field, unmatched_values.to_list())
+        found_capabilities += capabilities
+        unmatched_values.remove_all([value_accessor(c) for c in capabilities])
 
         return found_capability_sets, found_capabilities, unmatched_values.to_list()
 
@@ -1,11 +1,12 @@
 import re
-from typing import Callable, Generic, List, TypeVar
+from typing import Generic, List, Optional, Set, TypeVar
 
 import requests
 
 from folio_upm.integration.clients.eureka.absract_role_entity_client import AbstractRoleEntityClient
 from folio_upm.integration.clients.eureka.abstract_entity_client import AbstractEntityClient
 from folio_upm.integration.clients.eureka_client import EurekaClient
+from folio_upm.integration.services.eureka_write_limiter import EurekaWriteLimiter
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.model.eureka.capability import Capability
 from folio_upm.model.eureka.capability_set import CapabilitySet
@@ -16,8 +17,10 @@ from folio_upm.model.report.detailed_http_error import DetailedHttpError
 from folio_upm.model.report.http_request_result import HttpRequestResult
 from folio_upm.utils import log_factory
 from folio_upm.utils.cql import CQL
-from folio_upm.utils.loading_utils import PartitionedDataLoader
+from folio_upm.utils.entity_cache import EntityCache
+from folio_upm.utils.loading_utils import PagedDataLoader, PartitionedDataLoader
 from folio_upm.utils.ordered_set import OrderedSet
+from folio_upm.utils.upm_env import Env
 
 C_TYPE = TypeVar("C_TYPE", Capability, CapabilitySet)
 RC_TYPE = TypeVar("RC_TYPE", RoleCapability, RoleCapabilitySet)
@@ -38,35 +41,76 @@ class RoleEntityService(Generic[C_TYPE, RC_TYPE], metaclass=SingletonMeta):
         self._entity_client = entity_client
         self._role_entity_client = role_entity_client
         self._client = EurekaClient()
+        self._cache = EntityCache[C_TYPE](resource_name)
+        self._write_limiter = EurekaWriteLimiter()
 
-    def find_by(self, permission_names: List[str], query_builder: Callable[[List[str]], str]) -> List[C_TYPE]:
+    def find_by_ps_names(self, permission_names: List[str]) -> List[C_TYPE]:
         """
         Find entities (Capabilities or CapabilitySets) by permission names.
 
         :param permission_names: List of permission names to search for.
-        :param query_builder: query builder function to create the CQL query.
         :return: List of entities (Capabilities or CapabilitySets) that match the permission names.
         """
-        entity_loader = self._entity_client.find_by_query
-        return PartitionedDataLoader(self._name, permission_names, entity_loader, query_builder).load()
+        return self.find_by_field("permission", permission_names)
 
-    def find_by_ps_names(self, permission_names: List[str]) -> List[C_TYPE]:
+    def find_by_field(self, field: str, values: List[str]) -> List[C_TYPE]:
         """
-        Find entities (Capabilities or CapabilitySets) by permission names.
+        Find entities (Capabilities or CapabilitySets) by field values using cache.
 
-        :param permission_names: List of permission names to search for.
-        :return: List of entities (Capabilities or CapabilitySets) that match the permission names.
+        Only values missing in the cache are requested by CQL queries.
+
+        :param field: Field name to search by (e.g. name, permission, id).
+        :param values: List of field values to search for.
+        :return: List of entities (Capabilities or CapabilitySets) that match the field values.
+        """
+        cached_entities, missing_values = self._cache.get_all(field, values)
+        if not missing_values:
+            return cached_entities
+
+        loaded_entities = PartitionedDataLoader(
+            self._name,
+            missing_values,
+            self._entity_client.find_by_query,
+            lambda partition: CQL.any_match_by_field(field, partition),
+            on_partition_loaded=lambda partition, entities: self._cache.put_all(field, partition, entities),
+        ).load()
+        return cached_entities + loaded_entities
+
+    def log_cache_stats(self) -> None:
+        self._cache.log_stats()
+
+    def find_all(self) -> List[C_TYPE]:
+        """
+        Find all entities (Capabilities or CapabilitySets) using paged queries.
+
+        :return: List of all entities (Capabilities or CapabilitySets).
+        """
+        page_size = Env().get_int_cached("PAGE_LOAD_LIMIT", default_value=500)
+        page_loader = self._entity_client.find_page_by_query
+        return PagedDataLoader(self._name, page_loader, "cql.allRecords=1", page_size).load()
+
+    def find_all_role_entities(self) -> List[RC_TYPE]:
+        """
+        Find all role-entities (RoleCapabilities or RoleCapabilitySets) using paged queries.
+
+        :return: List of all role-entities (RoleCapabilities or RoleCapabilitySets).
         """
-        qb = CQL.any_match_by_permission
-        entity_loader = self._entity_client.find_by_query
-        return PartitionedDataLoader(self._name, permission_names, entity_loader, qb).load()
+        page_size = Env().get_int_cached("PAGE_LOAD_LIMIT", default_value=500)
+        page_loader = self._role_entity_client.find_by_query
+        return PagedDataLoader(f"role-{self._name}", page_loader, "cql.allRecords=1", page_size).load()
 
-    def assign_to_role(self, role: Role, entities: List[C_TYPE]) -> List[HttpRequestResult]:
+    def get_target_entity_id(self, role_entity: RC_TYPE) -> str:
+        return self._role_entity_client.get_target_entity_id(role_entity)
+
+    def assign_to_role(
+        self, role: Role, entities: List[C_TYPE], assigned_entity_ids: Optional[Set[str]] = None
+    ) -> List[HttpRequestResult]:
         """
          Assign entities to a role.
 
         :param role: The role to which entities will be assigned.
         :param entities: List of entities (Capabilities or CapabilitySets) to assign to the role.
+        :param assigned_entity_ids: IDs of entities already assigned to the role, they are skipped without requests.
         :return: List of HttpRequestResult indicating the result of the assignment operation.
         """
         if role.id is None:
@@ -77,37 +121,54 @@ class RoleEntityService(Generic[C_TYPE, RC_TYPE], metaclass=SingletonMeta):
             self._log.info("No entities provided for role '%s': %s.", role.name, self._name)
             return []
 
-        entity_ids = [entity.id for entity in entities]
+        _assigned_entity_ids = assigned_entity_ids or set()
+        skipped_results = [self._create_skipped_result(role, e.id) for e in entities if e.id in _assigned_entity_ids]
+        entity_ids = [entity.id for entity in entities if entity.id not in _assigned_entity_ids]
+        if not entity_ids:
+            self._log.info("All '%s' are already assigned to role '%s'.", self._name, role.name)
+            return skipped_results
+
         self._log.info("Assigning '%s' to role '%s': %s", self._name, role.name, entity_ids)
         try:
-            return self.__assign_entity_ids_to_role(role, entity_ids)
+            return skipped_results + self.__assign_entity_ids_to_role(role, entity_ids)
         except requests.HTTPError as http_error:
-            return self.__handle_error_http_response(role, entity_ids, http_error)
+            return skipped_results + self.__handle_error_http_response(role, entity_ids, http_error)
         except requests.RequestException as req_error:
             self._log.error("Request error while updating role-%s for role '%s': %s", self._name, role.name, req_error)
             error_rs = DetailedHttpError(message=str(req_error), status=0)
-            return [self._create_error_assignment_result(role, entity_id, error_rs) for entity_id in entity_ids]
+            return skipped_results + [self._create_error_assignment_result(role, i, error_rs) for i in entity_ids]
         except Exception as e:
             self._log.error("Error while assigning role-%s for role '%s': %s", self._name, role.name, entity_ids, e)
             error_msg = f"Error while assigning role-{self._name} for role '{role.name}': {entity_ids}: {str(e)}"
             error = DetailedHttpError(message=error_msg, status=-1, responseBody="")
-            return [self._create_error_assignment_result(role, entity_id, error) for entity_id in entity_ids]
+            return skipped_results + [self._create_error_assignment_result(role, i, error) for i in entity_ids]
 
-    def update(self, role: Role, entity_ids: List[str]) -> List[HttpRequestResult]:
+    def update(
+        self, role: Role, entity_ids: List[str], assigned_entity_ids: Optional[Set[str]] = None
+    ) -> List[HttpRequestResult]:
         """
         Update the role with the provided entity IDs.
 
         :param role: The role to update.
         :param entity_ids: List of entity IDs to update the role with.
+        :param assigned_entity_ids: Set of entity IDs currently assigned to the role, the update request is
+            skipped if it is equal to the provided entity IDs.
         :return: List of HttpRequestResult indicating the result of the update operation.
         """
         if role.id is None:
             self._log.error("Role has no ID, cannot update role-%s: %s -> %s", self._name, role, entity_ids)
             return []
 
+        if assigned_entity_ids is not None and set(entity_ids) == assigned_entity_ids:
+            self._log.debug(
+                "Role-%s for role '%s' is up to date, skipping update: %s", self._name, role.name, entity_ids
+            )
+            return self._create_skipped_update_results(role, entity_ids)
+
         try:
             self._log.debug("Updating role-%s: '%s' with: %s", self._name, role.name, entity_ids)
-            self._role_entity_client.update_role_entity(role.id, entity_ids)
+            with self._write_limiter.limit():
+                self._role_entity_client.update_role_entity(role.id, entity_ids)
             self._log.debug("Successfully updated role-%s: '%s' with: %s", self._name, role.name, entity_ids)
             return self._create_success_update_results(role, entity_ids)
         except requests.HTTPError as http_error:
@@ -133,7 +194,8 @@ class RoleEntityService(Generic[C_TYPE, RC_TYPE], metaclass=SingletonMeta):
             return []
 
         self._log.debug("Assigning role-%s: '%s' with: %s", self._name, role.name, entity_ids)
-        assigned_resources = self._role_entity_client.create_role_entity(role_id, entity_ids)
+        with self._write_limiter.limit():
+            assigned_resources = self._role_entity_client.create_role_entity(role_id, entity_ids)
         unassigned_ids = self.__find_unassigned_entities(entity_ids, assigned_resources)
         success_results = [self._create_success_result(role, entity_id) for entity_id in entity_ids]
         if unassigned_ids:
@@ -230,6 +292,22 @@ class RoleEntityService(Generic[C_TYPE, RC_TYPE], metaclass=SingletonMeta):
             tarEntityId=entity_id,
         )
 
+    def _create_skipped_update_results(self, role: Role, entity_ids: List[str]) -> List[HttpRequestResult]:
+        if not entity_ids:
+            return [self._create_skipped_update_result(role, "[]")]
+        return [self._create_skipped_update_result(role, entity_id) for entity_id in entity_ids]
+
+    def _create_skipped_update_result(self, role: Role, entity_id: str) -> HttpRequestResult:
+        return HttpRequestResult(
+            status="skipped",
+            srcEntityName="role",
+            srcEntityId=role.id,
+            srcEntityDisplayName=role.name,
+            tarEntityName=self._entity_name,
+            tarEntityId=entity_id,
+            reason="already up to date",
+        )
+
     def _create_error_update_results(self, role: Role, entity_ids: List[str], error) -> List[HttpRequestResult]:
         return [self._create_error_update_result(role, entity_id, error) for entity_id in entity_ids]
 
@@ -1,8 +1,11 @@
-from typing import List, Set
+import threading
+from typing import Dict, List, Optional, Set
 
 import requests
 
 from folio_upm.integration.clients.eureka.roles_client import RolesClient
+from folio_upm.integration.clients.eureka_client import EurekaClient
+from folio_upm.integration.services.eureka_write_limiter import EurekaWriteLimiter
 from folio_upm.model.analysis.analyzed_role import AnalyzedRole
 from folio_upm.model.cleanup.hash_role_cleanup_record import HashRoleCleanupRecord
 from folio_upm.model.cls_support import SingletonMeta
@@ -10,9 +13,12 @@ from folio_upm.model.eureka.role import Role
 from folio_upm.model.report.detailed_http_error import DetailedHttpError
 from folio_upm.model.report.http_request_result import HttpRequestResult
 from folio_upm.utils import log_factory
+from folio_upm.utils.concurrency_utils import ConcurrencyUtils
 from folio_upm.utils.cql import CQL
+from folio_upm.utils.entity_cache import EntityCache
 from folio_upm.utils.iterable_utils import IterableUtils
-from folio_upm.utils.loading_utils import PartitionedDataLoader
+from folio_upm.utils.loading_utils import PagedDataLoader, PartitionedDataLoader
+from folio_upm.utils.upm_env import Env
 
 
 class RoleService(metaclass=SingletonMeta):
@@ -21,58 +27,72 @@ class RoleService(metaclass=SingletonMeta):
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._log.debug("RoleService initialized.")
         self._role_client = RolesClient()
+        self._eureka_client = EurekaClient()
+        self._roles_by_name: Optional[Dict[str, Role]] = None
+        self._roles_index_lock = threading.Lock()
+        self._roles_cache = EntityCache[Role]("roles")
+        self._write_limiter = EurekaWriteLimiter()
 
     def find_role_by_name(self, role_name: str) -> Role | None:
+        indexed_role = self.__get_indexed_role(role_name)
+        if indexed_role is not None:
+            return indexed_role
+        cached_roles, missing_role_names = self._roles_cache.get_all("name", [role_name])
+        if not missing_role_names:
+            return IterableUtils.first(cached_roles)
         try:
             query = CQL.any_match_by_name([role_name])
             found_roles = self._role_client.find_by_query(query)
-            return IterableUtils.first(found_roles)
+            self._roles_cache.put_all("name", [role_name], found_roles, cache_missing=False)
+            found_role = IterableUtils.first(found_roles)
+            self.__index_roles([found_role] if found_role else [])
+            return found_role
         except requests.HTTPError as e:
             self._log.warning("Failed to find role by name '%s': %s", role_name, e)
             return None
 
     def find_roles_by_names(self, role_names: List[str]) -> List[Role]:
-        qb = CQL.any_match_by_name
-        loader = self._role_client.find_by_query
-        return PartitionedDataLoader("roles", role_names, loader, qb).load()
-
-    def create_roles(self, analyzed_roles: List[AnalyzedRole]) -> List[HttpRequestResult]:
-        total_roles = len(analyzed_roles)
-        self._log.info("Creating %s role(s)...", total_roles)
-        existing_role_names = self.__find_existing_roles(analyzed_roles)
-        load_rs = list[HttpRequestResult]()
-        role_counter = 1
-        for ar in analyzed_roles:
-            load_rs.append(self.__verify_and_create_role(ar, existing_role_names))
-            self._log.info("Roles created: %s/%s", role_counter, total_roles)
-            role_counter += 1
-        self._log.info("Roles created: %s", role_counter)
-        return load_rs
+        roles_by_name = self._roles_by_name
+        if roles_by_name is None:
+            return self.__load_roles_by_names(role_names)
 
-    def delete_roles(self, cleanup_records: List[HashRoleCleanupRecord]) -> List[HttpRequestResult]:
-        role_ids_to_delete = [hash_role.role.id for hash_role in cleanup_records if self.__should_delete(hash_role)]
-        role_ids_to_delete = [rid for rid in role_ids_to_delete if rid is not None]
-        total_roles = len(role_ids_to_delete)
-        if not role_ids_to_delete:
-            self._log.info("No roles to remove.")
-            return []
+        unique_role_names = IterableUtils.unique_values(role_names)
+        missing_role_names = [name for name in unique_role_names if name not in roles_by_name]
+        if missing_role_names:
+            self._log.debug("Roles not found in the index, loading from server: %s", missing_role_names)
+            self.__index_roles(self.__load_roles_by_names(missing_role_names))
+        return [roles_by_name[name] for name in unique_role_names if name in roles_by_name]
 
-        self._log.debug("Removing roles %s: %s ...", total_roles, role_ids_to_delete)
-        roles_counter = 0
-        remove_rs = list[HttpRequestResult]()
-        for role_id in role_ids_to_delete:
-            remove_rs.append(self.__delete_role_safe(role_id))
-            roles_counter += 1
-            self._log.info("Roles remove processed: %s/%s", roles_counter, total_roles)
-        self._log.info("Roles removed successfully %s: %s", roles_counter, role_ids_to_delete)
-        return remove_rs
+    def load_roles_index(self) -> None:
+        """
+        Loads all roles and keeps them in memory, so roles can be resolved by name without a request per role.
+
+        Roles missing in the index are still requested from the server on demand.
+        """
+        self._log.info("Loading roles index...")
+        page_size = Env().get_int_cached("PAGE_LOAD_LIMIT", default_value=500)
+        page_loader = self.__load_roles_page()
+        counted_page_loader = self.__load_counted_roles_page()
+        query = "cql.allRecords=1"
+        loaded_roles = PagedDataLoader("roles", page_loader, query, page_size, counted_page_loader).load()
+        roles_by_name = {role.name: role for role in [Role(**role_dict) for role_dict in loaded_roles]}
+        with self._roles_index_lock:
+            self._roles_by_name = roles_by_name
+        self._log.info("Roles index loaded: %s role(s)", len(roles_by_name))
 
-    def __find_existing_roles(self, analyzed_roles):
+    def find_existing_role_names(self, analyzed_roles: List[AnalyzedRole]) -> Set[str]:
         role_names = [ar.role.name for ar in analyzed_roles if ar.role.name]
         found_roles = self.find_roles_by_names(role_names)
         return set([role.name for role in found_roles])
 
-    def __verify_and_create_role(self, ar: AnalyzedRole, existing_role_names: Set[str]) -> HttpRequestResult:
+    def create_role(self, ar: AnalyzedRole, existing_role_names: Set[str]) -> HttpRequestResult:
+        """
+        Creates a role, skipping system-generated and already existing ones.
+
+        :param ar: analyzed role to create.
+        :param existing_role_names: names of roles, that already exist in Eureka.
+        :return: HttpRequestResult for the role.
+        """
         role = ar.role
         role_name = role.name
         if ar.systemGenerated:
@@ -84,18 +104,84 @@ class RoleService(metaclass=SingletonMeta):
             self._log.warning("Role '%s' already exists, skipping creation.", role_name)
             return HttpRequestResult.for_role(role, "skipped", "already exists")
 
+    def delete_roles(self, cleanup_records: List[HashRoleCleanupRecord]) -> List[HttpRequestResult]:
+        role_ids_to_delete = [hash_role.role.id for hash_role in cleanup_records if self.__should_delete(hash_role)]
+        role_ids_to_delete = [rid for rid in role_ids_to_delete if rid is not None]
+        total_roles = len(role_ids_to_delete)
+        if not role_ids_to_delete:
+            self._log.info("No roles to remove.")
+            return []
+
+        concurrency = Env().get_int_cached("CLEANUP_CONCURRENCY", default_value=1)
+        self._log.debug("Removing roles %s [concurrency=%s]: %s ...", total_roles, concurrency, role_ids_to_delete)
+        remove_rs = ConcurrencyUtils.map_ordered(
+            self.__delete_role_safe,
+            role_ids_to_delete,
+            concurrency,
+            lambda processed, total: self._log.info("Roles remove processed: %s/%s", processed, total),
+        )
+        self._log.info("Roles removed successfully %s: %s", total_roles, role_ids_to_delete)
+        return remove_rs
+
+    def log_cache_stats(self) -> None:
+        self._roles_cache.log_stats()
+
+    def __load_roles_by_names(self, role_names: List[str]) -> List[Role]:
+        cached_roles, missing_role_names = self._roles_cache.get_all("name", role_names)
+        if not missing_role_names:
+            return cached_roles
+
+        qb = CQL.any_match_by_name
+        loader = self._role_client.find_by_query
+        cache_roles = self.__cache_roles_by_names
+        loaded_roles = PartitionedDataLoader("roles", missing_role_names, loader, qb, on_partition_loaded=cache_roles)
+        return cached_roles + loaded_roles.load()
+
+    def __cache_roles_by_names(self, role_names: List[str], roles: List[Role]) -> None:
+        # missing roles are not cached, because they can be created by another migration shard at any time
+        self._roles_cache.put_all("name", role_names, roles, cache_missing=False)
+
+    def __load_roles_page(self):
+        return lambda query, limit, offset: self._eureka_client.load_page_by_query(
+            "roles", "/roles", query, limit, offset
+        )
+
+    def __load_counted_roles_page(self):
+        client = self._eureka_client
+        return lambda query, limit, offset: client.load_counted_page_by_query("roles", "/roles", query, limit, offset)
+
+    def __get_indexed_role(self, role_name: str) -> Optional[Role]:
+        roles_by_name = self._roles_by_name
+        return roles_by_name.get(role_name) if roles_by_name is not None else None
+
+    def __index_roles(self, roles: List[Role]) -> None:
+        with self._roles_index_lock:
+            if self._roles_by_name is not None:
+                self._roles_by_name.update({role.name: role for role in roles})
+
+    def __remove_indexed_role(self, role_id: str) -> None:
+        with self._roles_index_lock:
+            if self._roles_by_name is not None:
+                removed_role_names = [name for name, role in self._roles_by_name.items() if role.id == role_id]
+                for role_name in removed_role_names:
+                    del self._roles_by_name[role_name]
+
     def __create_role_safe(self, role):
         role_name = role.name
         try:
             self._log.debug("Creating role: name='%s'...", role.name)
             role_to_create = Role(name=role_name, description=role.description or "")
-            created_role = self._role_client.create_role(role_to_create)
+            with self._write_limiter.limit():
+                created_role = self._role_client.create_role(role_to_create)
+            self._roles_cache.put_all("name", [role_name], [created_role])
+            self.__index_roles([created_role])
             self._log.info("Role is created: id=%s, name='%s'", created_role.id, role_name)
             return HttpRequestResult.for_role(created_role, "success", "Role created successfully")
         except requests.HTTPError as e:
             resp = e.response
             error = DetailedHttpError(message=str(e), status=resp.status_code, responseBody=resp.text)
             status = "skipped" if resp.status_code == 409 else "error"
+            self._roles_cache.invalidate("name", role_name)
             if status == "skipped":
                 self._log.info("Role '%s' already exists in 'mod-roles-keycloak'.", role_name)
             self._log.warning("Failed to create role '%s': %s, responseBody: %s", role_name, e, e.response.text)
@@ -108,7 +194,10 @@ class RoleService(metaclass=SingletonMeta):
     def __delete_role_safe(self, role_id: str) -> HttpRequestResult:
         try:
             self._log.debug("Removing role: %s...", role_id)
-            self._role_client.delete_role(role_id)
+            with self._write_limiter.limit():
+                self._role_client.delete_role(role_id)
+            self.__remove_indexed_role(role_id)
+            self._roles_cache.invalidate_if(lambda cached_role: cached_role.id == role_id)
             self._log.info("Role is removed: %s", role_id)
             return HttpRequestResult.for_removed_role(role_id, "success", "Role removed successfully")
         except requests.HTTPError as e:
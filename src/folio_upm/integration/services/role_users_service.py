@@ -1,18 +1,22 @@
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 import requests
 
 from folio_upm.integration.clients.eureka.user_roles_client import UserRolesClient
 from folio_upm.integration.clients.eureka_client import EurekaClient
+from folio_upm.integration.services.eureka_write_limiter import EurekaWriteLimiter
 from folio_upm.integration.services.role_service import RoleService
 from folio_upm.model.analysis.analyzed_user_roles import AnalyzedUserRoles
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.model.eureka.role import Role
+from folio_upm.model.eureka.user_role import UserRole
 from folio_upm.model.report.detailed_http_error import DetailedHttpError
 from folio_upm.model.report.http_request_result import HttpRequestResult
 from folio_upm.utils import log_factory
+from folio_upm.utils.loading_utils import PagedDataLoader
 from folio_upm.utils.ordered_set import OrderedSet
+from folio_upm.utils.upm_env import Env
 
 
 class RoleUsersService(metaclass=SingletonMeta):
@@ -23,20 +27,33 @@ class RoleUsersService(metaclass=SingletonMeta):
         self._client = EurekaClient()
         self._roles_service = RoleService()
         self._role_user_service = UserRolesClient()
+        self._write_limiter = EurekaWriteLimiter()
 
-    def assign_users(self, analyzed_user_role_records: List[AnalyzedUserRoles]) -> List[HttpRequestResult]:
-        migration_result = list[HttpRequestResult]()
-        total_user_roles = len(analyzed_user_role_records)
-        self._log.info("Total user-roles to assign: %s", total_user_roles)
-        user_roles_counter = 0
-        for ur in analyzed_user_role_records:
-            migration_result += self.__assign(ur)
-            user_roles_counter += 1
-            self._log.info("User roles processed: %s/%s", user_roles_counter, total_user_roles)
-        self._log.info("User-roles assigned: %s", user_roles_counter)
-        return migration_result
-
-    def __assign(self, analyzed_user_roles: AnalyzedUserRoles) -> List[HttpRequestResult]:
+    def find_all_user_roles(self) -> List[UserRole]:
+        page_size = Env().get_int_cached("PAGE_LOAD_LIMIT", default_value=500)
+        page_loader = self._role_user_service.find_by_query
+        return PagedDataLoader("user-roles", page_loader, "cql.allRecords=1", page_size).load()
+
+    def assign_user(
+        self, analyzed_user_roles: AnalyzedUserRoles, assigned_role_ids: Optional[Set[str]] = None
+    ) -> List[HttpRequestResult]:
+        """
+        Assigns a user to roles.
+
+        :param analyzed_user_roles: analyzed user roles.
+        :param assigned_role_ids: IDs of roles, already assigned to the user, they are skipped without requests.
+        :return: list of HttpRequestResult for each user-role.
+        """
+        return self.__assign(analyzed_user_roles, assigned_role_ids or set())
+
+    @staticmethod
+    def group_role_ids_by_user(user_roles: List[UserRole]) -> Dict[str, Set[str]]:
+        role_ids_by_user = dict[str, Set[str]]()
+        for user_role in user_roles:
+            role_ids_by_user.setdefault(user_role.userId, set()).add(user_role.roleId)
+        return role_ids_by_user
+
+    def __assign(self, analyzed_user_roles: AnalyzedUserRoles, assigned_role_ids: Set[str]) -> List[HttpRequestResult]:
         user_id = analyzed_user_roles.userId
         role_names = analyzed_user_roles.roleNames
         if not role_names:
@@ -66,6 +83,19 @@ class RoleUsersService(metaclass=SingletonMeta):
         if unmatched_roles:
             self._log.warning("Roles not found by name, skipping user assignment: %s -> %s", user_id, unmatched_roles)
             return [HttpRequestResult.user_role_not_found_result(user_id, r) for r in unmatched_roles]
+
+        skipped_results = [
+            self._create_skipped_result(user_id, roles_by_ids.get(i)) for i in role_ids if i in assigned_role_ids
+        ]
+        role_ids = [role_id for role_id in role_ids if role_id not in assigned_role_ids]
+        if not role_ids:
+            self._log.info("User is already assigned to all roles: %s", user_id)
+            return skipped_results
+        return skipped_results + self.__assign_missing_roles(user_id, role_ids, roles_by_ids)
+
+    def __assign_missing_roles(
+        self, user_id: str, role_ids: List[str], roles_by_ids: Dict[str, Role]
+    ) -> List[HttpRequestResult]:
         try:
             return self.__assign_role_users(user_id, role_ids, roles_by_ids)
         except requests.HTTPError as err:
@@ -78,10 +108,11 @@ class RoleUsersService(metaclass=SingletonMeta):
 
     def __assign_role_users(self, user_id: str, role_ids: List[str], roles_dict: dict[str, Role]) -> List:
         self._log.debug("Assigning user to roles '%s': %s", user_id, role_ids)
-        created_ur = self._role_user_service.post_user_roles(user_id, role_ids)
+        with self._write_limiter.limit():
+            created_ur = self._role_user_service.post_user_roles(user_id, role_ids)
         success_results = [self.__create_success_result(ur.userId, roles_dict.get(ur.roleId)) for ur in created_ur]
 
-        unassigned_ids = self.__find_unassigned_role_ids(roles_dict, created_ur)
+        unassigned_ids = self.__find_unassigned_role_ids(role_ids, created_ur)
         if unassigned_ids:
             self._log.warning("Unassigned roles found for user '%s': %s", user_id, unassigned_ids)
             unassigned_ids_result = [self._create_skipped_result(user_id, roles_dict.get(i)) for i in unassigned_ids]
@@ -1,16 +1,15 @@
 from typing import List
 
-from pydantic import BaseModel
-
 from folio_upm.model.eureka.capability import Capability
 from folio_upm.model.eureka.capability_set import CapabilitySet
 from folio_upm.model.eureka.role import Role
 from folio_upm.model.eureka.role_capability import RoleCapability
 from folio_upm.model.eureka.role_capability_set import RoleCapabilitySet
 from folio_upm.model.eureka.user_role import UserRole
+from folio_upm.model.load.sectioned_model import SectionedModel
 
 
-class EurekaLoadResult(BaseModel):
+class EurekaLoadResult(SectionedModel):
     roles: List[Role] = []
     roleCapabilities: List[RoleCapability] = []
     roleCapabilitySets: List[RoleCapabilitySet] = []
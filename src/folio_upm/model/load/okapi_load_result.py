@@ -1,13 +1,12 @@
 from typing import List
 
-from pydantic import BaseModel
-
+from folio_upm.model.load.sectioned_model import SectionedModel
 from folio_upm.model.okapi.module_descriptor import ModuleDescriptor
 from folio_upm.model.okapi.permission_set import PermissionSet
 from folio_upm.model.okapi.user_permission import UserPermission
 
 
-class OkapiLoadResult(BaseModel):
+class OkapiLoadResult(SectionedModel):
     okapiPermissions: List[ModuleDescriptor] = []
     allPermissions: List[PermissionSet] = []
     allPermissionsExpanded: List[PermissionSet] = []
@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, PrivateAttr, SerializerFunctionWrapHandler, model_serializer
+
+
+class SectionedModel(BaseModel):
+    """
+    Base model for load results stored as sectioned snapshots.
+
+    Deferred fields are not validated with the model, each of them is loaded by the section loader when it is
+    accessed for the first time. Serialization (including serialization as a nested model), iteration, comparison
+    and representation load all deferred fields first, so a partially loaded model is never exposed as complete.
+    """
+
+    _section_loader: Optional[Callable[[str], Any]] = PrivateAttr(default=None)
+    _section_locks: Dict[str, threading.Lock] = PrivateAttr(default_factory=dict)
+
+    def defer_fields(self, field_names: List[str], section_loader: Callable[[str], Any]) -> None:
+        """
+        Removes field values from the model, so they are loaded on first access.
+
+        Deferred fields are considered as set, because they are present in the snapshot.
+
+        :param field_names: names of the fields to defer.
+        :param section_loader: function, returning validated field value by field name.
+        """
+        for field_name in field_names:
+            self.__dict__.pop(field_name, None)
+            self._section_locks[field_name] = threading.Lock()
+        self.__pydantic_fields_set__.update(field_names)
+        self._section_loader = section_loader
+
+    def load_deferred_fields(self) -> None:
+        for field_name in type(self).model_fields:
+            if field_name not in self.__dict__:
+                getattr(self, field_name)
+
+    @model_serializer(mode="wrap")
+    def _serialize_sections(self, handler: SerializerFunctionWrapHandler) -> Any:
+        self.load_deferred_fields()
+        return handler(self)
+
+    def __iter__(self):
+        self.load_deferred_fields()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self.load_deferred_fields()
+        return super().__repr_args__()
+
+    def __eq__(self, other: Any) -> bool:
+        # section loader is not compared, so models are equal regardless of how their fields were loaded
+        if not isinstance(other, SectionedModel):
+            return NotImplemented
+        self.load_deferred_fields()
+        other.load_deferred_fields()
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __getattr__(self, name: str) -> Any:
+        private_attributes = object.__getattribute__(self, "__pydantic_private__")
+        section_lock = private_attributes["_section_locks"].get(name) if private_attributes else None
+        if section_lock is None:
+            return super().__getattr__(name)
+        # concurrent readers wait for the section, loaded by the first of them, instead of loading it again
+        with section_lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = private_attributes["_section_loader"](name)
+        return self.__dict__[name]
@@ -3,9 +3,38 @@ from typing import List
 from pydantic import BaseModel
 
 from folio_upm.model.report.http_request_result import HttpRequestResult
+from folio_upm.utils.ordered_set import OrderedSet
 
 
 class EurekaMigrationReport(BaseModel):
     roles: List[HttpRequestResult]
     roleUsers: List[HttpRequestResult]
     roleCapabilities: List[HttpRequestResult]
+
+    def get_touched_role_ids(self) -> List[str]:
+        """
+        Collects IDs of roles, changed by the migration: created roles and roles with assigned
+        capabilities or users, results with 'skipped' status are ignored.
+        """
+        role_ids = OrderedSet[str]()
+        for result in self.roles + self.roleCapabilities:
+            if result.status != "skipped" and result.srcEntityName == "role" and result.srcEntityId:
+                role_ids.add(result.srcEntityId)
+        for result in self.roleUsers:
+            if result.status != "skipped" and result.tarEntityName == "role" and result.tarEntityId:
+                role_ids.add(result.tarEntityId)
+        return role_ids.to_list()
+
+    @staticmethod
+    def merge(reports: List["EurekaMigrationReport"]) -> "EurekaMigrationReport":
+        """
+        Merges reports of migration shards, keeping the order of shards.
+
+        Each role is created by a single shard (the one, owning it by role name hash, along with its
+        capabilities), so shard results do not overlap and are concatenated without deduplication.
+        """
+        return EurekaMigrationReport(
+            roles=[result for report in reports for result in report.roles],
+            roleUsers=[result for report in reports for result in report.roleUsers],
+            roleCapabilities=[result for report in reports for result in report.roleCapabilities],
+        )
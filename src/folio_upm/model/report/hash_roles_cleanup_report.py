@@ -8,3 +8,10 @@ from folio_upm.model.report.http_request_result import HttpRequestResult
 class HashRolesCleanupReport(BaseModel):
     roles: List[HttpRequestResult]
     roleCapabilities: List[HttpRequestResult]
+
+    @staticmethod
+    def merge(reports: List["HashRolesCleanupReport"]) -> "HashRolesCleanupReport":
+        return HashRolesCleanupReport(
+            roles=[result for report in reports for result in report.roles],
+            roleCapabilities=[result for report in reports for result in report.roleCapabilities],
+        )
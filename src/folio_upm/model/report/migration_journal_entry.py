@@ -0,0 +1,11 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from folio_upm.model.report.http_request_result import HttpRequestResult
+
+
+class MigrationJournalEntry(BaseModel):
+    stage: str
+    key: str
+    results: List[HttpRequestResult]
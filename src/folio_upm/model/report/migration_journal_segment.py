@@ -0,0 +1,10 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from folio_upm.model.report.migration_journal_entry import MigrationJournalEntry
+
+
+class MigrationJournalSegment(BaseModel):
+    runId: str
+    entries: List[MigrationJournalEntry]
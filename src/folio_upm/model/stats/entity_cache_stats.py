@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class EntityCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class HttpConnectionStats(BaseModel):
+    totalRequests: int = 0
+    newConnections: int = 0
+    reusedConnections: int = 0
+    retries: int = 0
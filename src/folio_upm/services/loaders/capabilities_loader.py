@@ -1,44 +1,115 @@
-from typing import Any, Dict
+import time
+from typing import Any, Callable, Dict, List, Set, Tuple
 
 from folio_upm.integration.clients.eureka_client import EurekaClient
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.utils import log_factory
-from folio_upm.utils.loading_utils import PagedDataLoader
+from folio_upm.utils.concurrency_utils import ConcurrencyUtils
+from folio_upm.utils.cql import CQL
+from folio_upm.utils.loading_utils import PagedDataLoader, PartitionedDataLoader
+from folio_upm.utils.upm_env import Env
 
 
 class CapabilitiesLoader(metaclass=SingletonMeta):
 
+    # (result key, response resource name, path)
+    _resources = [
+        ("roles", "roles", "/roles"),
+        ("capabilities", "capabilities", "/capabilities"),
+        ("capabilitySets", "capabilitySets", "/capability-sets"),
+        ("roleUsers", "userRoles", "/roles/users"),
+        ("roleCapabilities", "roleCapabilities", "/roles/capabilities"),
+        ("userCapabilities", "userCapabilities", "/users/capabilities"),
+        ("roleCapabilitySets", "roleCapabilitySets", "/roles/capability-sets"),
+        ("userCapabilitySets", "userCapabilitySets", "/users/capability-sets"),
+    ]
+
+    # (result key, response resource name, path, role identifier field)
+    _role_resources = [
+        ("roles", "roles", "/roles", "id"),
+        ("roleUsers", "userRoles", "/roles/users", "roleId"),
+        ("roleCapabilities", "roleCapabilities", "/roles/capabilities", "roleId"),
+        ("roleCapabilitySets", "roleCapabilitySets", "/roles/capability-sets", "roleId"),
+    ]
+
     def __init__(self):
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._eureka_client = EurekaClient()
 
     def load_capabilities(self) -> Dict[str, Any]:
-        self._log.info("Starting eureka data loading...")
-        cql_all_query = "cql.allRecords=1"
-        roles = self.__load_data_by_query("roles", "/roles", cql_all_query)
-        capabilities = self.__load_data_by_query("capabilities", "/capabilities", cql_all_query)
-        capability_sets = self.__load_data_by_query("capabilitySets", "/capability-sets", cql_all_query)
-        role_users = self.__load_data_by_query("userRoles", "/roles/users", cql_all_query)
-        role_capabilities = self.__load_data_by_query("roleCapabilities", "/roles/capabilities", cql_all_query)
-        role_capability_sets = self.__load_data_by_query("roleCapabilitySets", "/roles/capability-sets", cql_all_query)
-        user_capabilities = self.__load_data_by_query("userCapabilities", "/users/capabilities", cql_all_query)
-        user_capability_sets = self.__load_data_by_query("userCapabilitySets", "/users/capability-sets", cql_all_query)
-
+        concurrency = Env().get_int_cached("RESOURCE_LOAD_CONCURRENCY", default_value=1)
+        self._log.info("Starting eureka data loading [concurrency=%s]...", concurrency)
+        loaded_resources = ConcurrencyUtils.map_ordered(self.__load_resource, self._resources, concurrency)
         self._log.info("Eureka data loaded successfully.")
+        return {result_key: records for (result_key, _, _), records in zip(self._resources, loaded_resources)}
+
+    def reload_roles(self, load_result: Dict[str, Any], role_ids: List[str]) -> Dict[str, Any]:
+        """
+        Reloads roles and their users, capabilities and capability sets by role IDs.
+
+        Reloaded records replace records of the same roles in the previously loaded Eureka data, other resources
+        are kept as is. Page loading errors fail the whole partition, so records of roles, which partitions failed
+        to load, are kept from the previous data.
 
-        return {
-            "roles": roles,
-            "capabilities": capabilities,
-            "capabilitySets": capability_sets,
-            "roleUsers": role_users,
-            "roleCapabilities": role_capabilities,
-            "userCapabilities": user_capabilities,
-            "roleCapabilitySets": role_capability_sets,
-            "userCapabilitySets": user_capability_sets,
-        }
+        :param load_result: previously loaded Eureka data.
+        :param role_ids: IDs of roles to reload.
+        :return: Eureka data with reloaded role records.
+        """
+        concurrency = Env().get_int_cached("RESOURCE_LOAD_CONCURRENCY", default_value=1)
+        self._log.info("Reloading eureka data for %s role(s) [concurrency=%s]...", len(role_ids), concurrency)
+        reloaded_resources = ConcurrencyUtils.map_ordered(
+            lambda resource_definition: self.__reload_role_resource(resource_definition, role_ids),
+            self._role_resources,
+            concurrency,
+        )
 
-    def __load_data_by_query(self, resource: str, path: str, query: str):
-        return PagedDataLoader(resource, self.__load_resource_page(resource, path), query).load()
+        result = dict(load_result)
+        for (result_key, _, _, field), (loaded_role_ids, records) in zip(self._role_resources, reloaded_resources):
+            retained_records = [r for r in load_result.get(result_key, []) if r.get(field) not in loaded_role_ids]
+            result[result_key] = retained_records + records
+        self._log.info("Eureka data reloaded successfully for %s role(s).", len(role_ids))
+        return result
+
+    def __reload_role_resource(
+        self, resource_definition: Tuple[str, str, str, str], role_ids: List[str]
+    ) -> Tuple[Set[str], List[Any]]:
+        _, resource, path, field = resource_definition
+        start_time = time.perf_counter()
+        loaded_role_ids = set[str]()
+        records = PartitionedDataLoader(
+            resource,
+            role_ids,
+            lambda query: self.__load_data_by_query(resource, path, query, raise_on_error=True),
+            self.__any_match_by_field(field),
+            on_partition_loaded=lambda partition, _: loaded_role_ids.update(partition),
+        ).load()
+        time_taken = time.perf_counter() - start_time
+        self._log.info("Resource '%s' reloaded: records=%s, time=%.2fs", resource, len(records), time_taken)
+        return loaded_role_ids, records
+
+    def __load_resource(self, resource_definition: Tuple[str, str, str]) -> List[Any]:
+        _, resource, path = resource_definition
+        start_time = time.perf_counter()
+        records = self.__load_data_by_query(resource, path, "cql.allRecords=1")
+        time_taken = time.perf_counter() - start_time
+        self._log.info("Resource '%s' loaded: records=%s, time=%.2fs", resource, len(records), time_taken)
+        return records
+
+    def __load_data_by_query(self, resource: str, path: str, query: str, raise_on_error: bool = False):
+        page_loader = self.__load_resource_page(resource, path)
+        counted_page_loader = self.__load_counted_resource_page(resource, path)
+        page_size = Env().get_int_cached("PAGE_LOAD_LIMIT", default_value=500)
+        return PagedDataLoader(
+            resource, page_loader, query, page_size, counted_page_loader, raise_on_error=raise_on_error
+        ).load()
 
     def __load_resource_page(self, resource: str, path: str):
         return lambda query, limit, offset: self._eureka_client.load_page_by_query(resource, path, query, limit, offset)
+
+    def __load_counted_resource_page(self, resource: str, path: str):
+        client = self._eureka_client
+        return lambda query, limit, offset: client.load_counted_page_by_query(resource, path, query, limit, offset)
+
+    @staticmethod
+    def __any_match_by_field(field: str) -> Callable[[List[str]], str]:
+        return lambda values: CQL.any_match_by_field(field, values)
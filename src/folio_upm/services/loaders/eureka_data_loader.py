@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from folio_upm.model.load.eureka_load_result import EurekaLoadResult
 from folio_upm.storage.tenant_storage_service import TenantStorageService
@@ -8,11 +8,23 @@ from folio_upm.utils.upm_env import Env
 
 class EurekaDataLoader:
 
-    def __init__(self, use_ref_file: bool = True, src_file_name: str = "eureka-capabilities"):
+    def __init__(
+        self,
+        use_ref_file: bool = True,
+        src_file_name: str = "eureka-capabilities",
+        fields: Optional[List[str]] = None,
+    ):
+        """
+        :param use_ref_file: if True, the reference capabilities file is loaded when there is no stored result.
+        :param src_file_name: name of the stored eureka load result.
+        :param fields: load result fields loaded up front, other fields of sectioned snapshots are loaded on
+            first access, None to load all fields.
+        """
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._tenant_storage_service = TenantStorageService()
         self._use_ref_file = use_ref_file
         self._src_file_name = src_file_name
+        self._fields = fields
         self._eureka_load_result = self.__load_eureka_capabilities()
 
     def get_load_result(self) -> EurekaLoadResult:
@@ -24,9 +36,10 @@ class EurekaDataLoader:
         return self._eureka_load_result
 
     def __load_eureka_capabilities(self) -> Optional[EurekaLoadResult]:
-        eureka_load_result_dict = self._tenant_storage_service.find_object(self._src_file_name, "json.gz")
-        if eureka_load_result_dict is not None:
-            return EurekaLoadResult(**eureka_load_result_dict)
+        storage_service = self._tenant_storage_service
+        eureka_load_result = storage_service.find_snapshot(self._src_file_name, EurekaLoadResult, self._fields)
+        if eureka_load_result is not None:
+            return eureka_load_result
 
         if not self._use_ref_file:
             return None
@@ -37,8 +50,9 @@ class EurekaDataLoader:
             return None
 
         self._log.info("Loading reference capabilities from: '%s' ...", ref_capabilities_file_path)
-        ref_eureka_load_result_dict = self._tenant_storage_service.find_object_by_key(ref_capabilities_file_path)
-        if ref_eureka_load_result_dict is None:
+        ref_eureka_load_result = storage_service.find_model_by_key(
+            ref_capabilities_file_path, EurekaLoadResult, self._fields
+        )
+        if ref_eureka_load_result is None:
             self._log.warning("Reference capabilities file not found: '%s'", ref_capabilities_file_path)
-            return None
-        return EurekaLoadResult(**ref_eureka_load_result_dict)
+        return ref_eureka_load_result
@@ -1,9 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from folio_upm.integration.services.okapi_service import OkapiService
 from folio_upm.integration.services.permission_service import PermissionService
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.utils import log_factory
+from folio_upm.utils.concurrency_utils import ConcurrencyUtils
+from folio_upm.utils.upm_env import Env
 
 
 class OkapiDataLoader(metaclass=SingletonMeta):
@@ -13,13 +15,19 @@ class OkapiDataLoader(metaclass=SingletonMeta):
         self._okapi_service = OkapiService()
 
     def load_okapi_data(self) -> Dict[str, Any]:
-        self._log.info("Permission loading started...")
+        concurrency = Env().get_int_cached("RESOURCE_LOAD_CONCURRENCY", default_value=1)
+        self._log.info("Permission loading started [concurrency=%s]...", concurrency)
         all_records_query = "cql.allRecords=1"
-        okapi_permissions = self._okapi_service.get_okapi_defined_permissions()
-        all_perms = self._permission_service.load_all_permissions_by_query(all_records_query, expanded=False)
-        all_perms_expanded = self._permission_service.load_all_permissions_by_query(all_records_query, expanded=True)
-        all_perm_users = self._permission_service.load_permission_users(all_perms)
-        all_perm_users_expanded = self._permission_service.load_permission_users(all_perms_expanded)
+        loaders = [
+            self._okapi_service.get_okapi_defined_permissions,
+            lambda: self._permission_service.load_all_permissions_by_query(all_records_query, expanded=False),
+            lambda: self._permission_service.load_all_permissions_by_query(all_records_query, expanded=True),
+        ]
+
+        loaded_values = ConcurrencyUtils.map_ordered(self.__call_loader, loaders, concurrency)
+        okapi_permissions, all_perms, all_perms_expanded = loaded_values
+        permission_users = self._permission_service.load_permission_users([all_perms, all_perms_expanded])
+        all_perm_users, all_perm_users_expanded = permission_users
 
         self._log.info("Permissions are loaded successfully.")
         return {
@@ -29,3 +37,7 @@ class OkapiDataLoader(metaclass=SingletonMeta):
             "allPermissionUsers": all_perm_users,
             "allPermissionUsersExpanded": all_perm_users_expanded,
         }
+
+    @staticmethod
+    def __call_loader(loader: Callable[[], Any]) -> Any:
+        return loader()
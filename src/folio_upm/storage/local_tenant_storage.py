@@ -1,5 +1,6 @@
+import os
 from io import BytesIO
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterator, List, Optional
 
 from openpyxl.workbook import Workbook
 from typing_extensions import override
@@ -9,6 +10,7 @@ from folio_upm.storage.tenant_storage import TenantStorage
 from folio_upm.utils import log_factory
 from folio_upm.utils.file_utils import FileUtils
 from folio_upm.utils.json_utils import JsonUtils
+from folio_upm.utils.sectioned_snapshot import SectionedSnapshot
 from folio_upm.utils.xlsx_utils import XlsxUtils
 
 
@@ -21,17 +23,48 @@ class LocalTenantStorage(TenantStorage, metaclass=SingletonMeta):
 
     @override
     def _get_json_gz(self, object_name: str) -> Optional[Any]:
-        json_bytes_buffer = self.__read_binary_data(object_name)
-        return json_bytes_buffer and JsonUtils.from_json_gz(json_bytes_buffer)
+        with FileUtils.open_mapped(f"{self._out_folder}/{object_name}") as mapped_file:
+            return JsonUtils.from_json_gz(mapped_file) if mapped_file is not None else None
+
+    @override
+    def _get_gz_bytes(self, object_name: str) -> Optional[bytes]:
+        with FileUtils.open_mapped(f"{self._out_folder}/{object_name}") as mapped_file:
+            return JsonUtils.read_gz_bytes(mapped_file) if mapped_file is not None else None
+
+    @override
+    def _get_sections(self, object_name: str) -> Optional[SectionedSnapshot]:
+        file = f"{self._out_folder}/{object_name}"
+        if not FileUtils.exists(file):
+            self._log.warning("File '%s' not found", file)
+            return None
+        return SectionedSnapshot(lambda offset, size: FileUtils.read_range(file, offset, size))
+
+    @override
+    def _iter_json_gz_items(self, object_name: str, field: Optional[str]) -> Optional[Iterator[Any]]:
+        file = f"{self._out_folder}/{object_name}"
+        if not FileUtils.exists(file):
+            self._log.warning("File '%s' not found", file)
+            return None
+        return self.__iter_mapped_json_gz_items(file, field)
 
     @override
     def _find_latest_object_by_name(self, prefix: str, object_ext: str) -> Optional[str]:
         return FileUtils.find_latest_key_by_prefix(self._out_folder, prefix, object_ext)
 
+    @override
+    def _find_object_keys_by_name(self, prefix: str, object_ext: str) -> List[str]:
+        return FileUtils.find_keys_by_prefix(self._out_folder, prefix, object_ext)
+
     @override
     def _save_json_gz(self, object_name: str, object_data: Any) -> None:
-        data_bytes = JsonUtils.to_json_gz(object_data)
-        self.__save_file_with_latest_included(object_name, data_bytes)
+        with self._get_json_gz_stream(object_data) as json_gz_stream:
+            self._save_stream(object_name, json_gz_stream)
+
+    @override
+    def _save_stream(self, object_name: str, stream: BinaryIO) -> None:
+        file = f"{self._out_folder}/{object_name}"
+        FileUtils.create_directory_safe(os.path.dirname(file))
+        FileUtils.write_stream(file, stream)
 
     @override
     def _save_xlsx(self, object_name: str, object_data: Workbook) -> None:
@@ -46,10 +79,14 @@ class LocalTenantStorage(TenantStorage, metaclass=SingletonMeta):
         self.__write_binary_data(file_key, object_data)
 
     def __write_binary_data(self, file_key, binary_data: BytesIO):
-        FileUtils.create_directory_safe(self._out_folder)
         file = f"{self._out_folder}/{file_key}"
+        FileUtils.create_directory_safe(os.path.dirname(file))
         FileUtils.write_binary_data(file, binary_data)
 
+    def __iter_mapped_json_gz_items(self, file: str, field: Optional[str]) -> Iterator[Any]:
+        with FileUtils.open_mapped(file) as mapped_file:
+            yield from JsonUtils.iter_json_gz_items(mapped_file, field, self._get_json_gz_chunk_size())
+
     def __read_binary_data(self, file_key) -> Optional[BytesIO]:
         file = f"{self._out_folder}/{file_key}"
         return FileUtils.read_binary_data(file)
@@ -0,0 +1,103 @@
+import threading
+from datetime import UTC, datetime
+from typing import Dict, List
+
+from folio_upm.model.report.http_request_result import HttpRequestResult
+from folio_upm.model.report.migration_journal_entry import MigrationJournalEntry
+from folio_upm.model.report.migration_journal_segment import MigrationJournalSegment
+from folio_upm.storage.tenant_storage_service import TenantStorageService
+from folio_upm.utils import log_factory
+from folio_upm.utils.upm_env import Env
+
+
+class MigrationJournal:
+    """
+    Append-only checkpoint journal of the Eureka migration.
+
+    Processed entries (created roles, assigned role capabilities and user roles) are buffered and saved as
+    separate journal segments, so an interrupted migration can be resumed, skipping already processed entries.
+    """
+
+    _json_gz_ext = "json.gz"
+    _completed_statuses = {"success", "skipped"}
+
+    def __init__(self, journal_name: str, resume: bool = False):
+        self._log = log_factory.get_logger(self.__class__.__name__)
+        self._storage_service = TenantStorageService()
+        self._journal_name = journal_name
+        self._flush_size = Env().get_int_cached("MIGRATION_JOURNAL_FLUSH_SIZE", default_value=100)
+        self._lock = threading.Lock()
+        self._buffer = list[MigrationJournalEntry]()
+        self._completed = dict[str, Dict[str, List[HttpRequestResult]]]()
+        self._run_id = self.__generate_run_id()
+        if resume:
+            self.__load_previous_run()
+
+    def get_completed_results(self, stage: str) -> Dict[str, List[HttpRequestResult]]:
+        """
+        Returns results of journaled entries, completed in the previous run (all results are successful or skipped).
+
+        :param stage: migration stage (one of: roles, roleCapabilities, roleUsers).
+        :return: dictionary with entry key as key and list of entry results as value.
+        """
+        return self._completed.get(stage, {})
+
+    def record(self, stage: str, key: str, results: List[HttpRequestResult]) -> None:
+        """
+        Adds processed entry to the journal, the journal segment is saved when the flush size is reached.
+
+        :param stage: migration stage (one of: roles, roleCapabilities, roleUsers).
+        :param key: entry key (role name or user id).
+        :param results: list of request results for the entry.
+        """
+        with self._lock:
+            self._buffer.append(MigrationJournalEntry(stage=stage, key=key, results=results))
+            entries = self.__take_buffer() if len(self._buffer) >= self._flush_size else []
+        self.__save_segment(entries)
+
+    def flush(self) -> None:
+        with self._lock:
+            entries = self.__take_buffer()
+        self.__save_segment(entries)
+
+    def __take_buffer(self) -> List[MigrationJournalEntry]:
+        entries = self._buffer
+        self._buffer = list[MigrationJournalEntry]()
+        return entries
+
+    def __save_segment(self, entries: List[MigrationJournalEntry]) -> None:
+        # segments are saved outside the lock, so workers recording entries are not blocked by the upload
+        if not entries:
+            return
+        segment = MigrationJournalSegment(runId=self._run_id, entries=entries)
+        segment_name = f"{self._journal_name}-{self._run_id}"
+        self._storage_service.save_object(segment_name, self._json_gz_ext, segment)
+        self._log.debug("Journal segment saved: %s entries", len(entries))
+
+    def __load_previous_run(self) -> None:
+        storage_service = self._storage_service
+        latest_segment = storage_service.find_model(self._journal_name, self._json_gz_ext, MigrationJournalSegment)
+        if latest_segment is None:
+            self._log.warning("Migration journal is not found, starting migration from the beginning.")
+            return
+
+        self._run_id = latest_segment.runId
+        segment_name = f"{self._journal_name}-{self._run_id}"
+        segments = storage_service.find_models(segment_name, self._json_gz_ext, MigrationJournalSegment)
+        for segment in segments:
+            for entry in segment.entries:
+                self.__add_completed_entry(entry)
+
+        completed_entries = {stage: len(entries) for stage, entries in self._completed.items()}
+        self._log.info("Resuming migration run '%s', completed entries: %s", self._run_id, completed_entries)
+
+    def __add_completed_entry(self, entry: MigrationJournalEntry) -> None:
+        completed_stage_entries = self._completed.setdefault(entry.stage, {})
+        if any(result.status not in self._completed_statuses for result in entry.results):
+            completed_stage_entries.pop(entry.key, None)
+            return
+        completed_stage_entries[entry.key] = entry.results
+
+    @staticmethod
+    def __generate_run_id() -> str:
+        return datetime.now(tz=UTC).strftime("%Y%m%d%H%M%S%f")
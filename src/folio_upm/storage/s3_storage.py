@@ -1,5 +1,5 @@
 from io import BytesIO
-from typing import Optional
+from typing import BinaryIO, List, Optional
 
 import boto3
 from botocore.exceptions import ClientError
@@ -33,6 +33,25 @@ class S3Storage(metaclass=SingletonMeta):
         except ClientError as e:
             self._log.error("Failed to upload file to S3 bucket '%s' -> '%s': %s", bucket, path, e)
 
+    def upload_stream(self, path, stream: BinaryIO, override: bool = True):
+        """
+        Uploads data from a non-seekable stream, large streams are uploaded as multipart uploads
+        part by part, so only the parts being uploaded are kept in memory.
+
+        :param path: object key.
+        :param stream: readable stream with object data.
+        :param override: if False, FileExistsError is raised for an existing object.
+        """
+        bucket = self._bucket
+        if self.check_file_exists(path):
+            self._log.warning("Object exists in S3 bucket '%s': %s, overriding it", bucket, path)
+            if not override:
+                raise FileExistsError(f"File already exists in S3 bucket '{bucket}': {path}")
+        try:
+            self._s3_client.upload_fileobj(stream, Bucket=bucket, Key=path)
+        except ClientError as e:
+            self._log.error("Failed to upload file to S3 bucket '%s' -> '%s': %s", bucket, path, e)
+
     def check_file_exists(self, file):
         try:
             self._s3_client.head_object(Bucket=self._bucket, Key=file)
@@ -54,7 +73,34 @@ class S3Storage(metaclass=SingletonMeta):
 
         return self.__get_object(file_key)
 
+    def read_object_range(self, file_key: str, offset: int, size: int) -> bytes:
+        """
+        Reads a byte range of an object with a ranged GET request.
+
+        :param file_key: object key.
+        :param offset: offset of the first byte.
+        :param size: number of bytes to read, a range exceeding the object is truncated to the object size.
+        :return: bytes of the requested range.
+        """
+        bucket_name = self._bucket
+        byte_range = f"bytes={offset}-{offset + size - 1}"
+        try:
+            response = self._s3_client.get_object(Bucket=bucket_name, Key=file_key, Range=byte_range)
+        except Exception as e:
+            raise ValueError(f"Failed to read object range from S3: bucket={bucket_name}, path={file_key}, error={e}")
+        body = response["Body"]
+        try:
+            return body.read()
+        finally:
+            body.close()
+
     def find_latest_key_by_prefix(self, prefix: str, object_ext: str) -> Optional[str]:
+        matching_keys = self.find_keys_by_prefix(prefix, object_ext)
+        latest_key = FileUtils.get_latest_file_key(matching_keys)
+        self._log.debug(f"Found files with prefix '{prefix}', latest: {latest_key}, files: {matching_keys}")
+        return latest_key
+
+    def find_keys_by_prefix(self, prefix: str, object_ext: str) -> List[str]:
         try:
             paginator = self._s3_client.get_paginator("list_objects_v2")
             page_iterator = paginator.paginate(Bucket=self._bucket, Prefix=prefix)
@@ -66,16 +112,14 @@ class S3Storage(metaclass=SingletonMeta):
 
             if not matching_keys:
                 self._log.debug(f"No files found with prefix: {prefix}")
-                return None
+                return []
 
             matching_keys = [key for key in matching_keys if key.endswith(object_ext)]
-            latest_key = FileUtils.get_latest_file_key(matching_keys)
-            self._log.debug(f"Found files with prefix '{prefix}', latest: {latest_key}, files: {matching_keys}")
-            return latest_key
+            return sorted(matching_keys, key=FileUtils.get_file_sort_key)
 
         except Exception as e:
-            self._log.error("Error finding latest file with prefix '%s': %s", prefix, e)
-            return None
+            self._log.error("Error finding files with prefix '%s': %s", prefix, e)
+            return []
 
     def __get_object(self, file_key):
         bucket_name = self._bucket
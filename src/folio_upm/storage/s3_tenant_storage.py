@@ -1,5 +1,5 @@
 import io
-from typing import Any, Callable, Optional
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional
 
 from openpyxl.workbook import Workbook
 from typing_extensions import override
@@ -9,6 +9,7 @@ from folio_upm.storage.s3_storage import S3Storage
 from folio_upm.storage.tenant_storage import TenantStorage
 from folio_upm.utils import log_factory
 from folio_upm.utils.json_utils import JsonUtils
+from folio_upm.utils.sectioned_snapshot import SectionedSnapshot
 from folio_upm.utils.xlsx_utils import XlsxUtils
 
 
@@ -24,16 +25,47 @@ class S3TenantStorage(TenantStorage, metaclass=SingletonMeta):
     def _get_json_gz(self, object_name: str) -> Optional[Any]:
         return self.__get_s3_object(object_name, lambda body: JsonUtils.from_json_gz(body))
 
+    @override
+    def _get_gz_bytes(self, object_name: str) -> Optional[bytes]:
+        return self.__get_s3_object(object_name, lambda body: JsonUtils.read_gz_bytes(body))
+
+    @override
+    def _get_sections(self, object_name: str) -> Optional[SectionedSnapshot]:
+        if not self._storage.check_file_exists(object_name):
+            self._log.warning("Object is not found in S3 bucket: '%s'", object_name)
+            return None
+        return SectionedSnapshot(lambda offset, size: self._storage.read_object_range(object_name, offset, size))
+
+    @override
+    def _iter_json_gz_items(self, object_name: str, field: Optional[str]) -> Optional[Iterator[Any]]:
+        self._log.debug(f"Streaming file from s3: {object_name}...")
+        object_body = self._storage.read_object(object_name)
+        if object_body is None:
+            self._log.warning("Object is not found in S3 bucket: '%s'", object_name)
+            return None
+        return self.__iter_json_gz_items(object_body, field)
+
     @override
     def _find_latest_object_by_name(self, prefix: str, object_ext: str) -> Optional[str]:
         return self._storage.find_latest_key_by_prefix(prefix, object_ext)
 
+    @override
+    def _find_object_keys_by_name(self, prefix: str, object_ext: str) -> List[str]:
+        return self._storage.find_keys_by_prefix(prefix, object_ext)
+
     @override
     def _save_json_gz(self, object_name: str, object_data: Any) -> None:
         self._log.debug(f"Uploading compressed JSON to s3: {object_name}...")
-        self._storage.upload_file(object_name, JsonUtils.to_json_gz(object_data))
+        with self._get_json_gz_stream(object_data) as json_gz_stream:
+            self._storage.upload_stream(object_name, json_gz_stream)
         self._log.info(f"Compressed JSON saved to s3: {object_name}")
 
+    @override
+    def _save_stream(self, object_name: str, stream: BinaryIO) -> None:
+        self._log.debug(f"Uploading file to s3: {object_name}...")
+        self._storage.upload_stream(object_name, stream)
+        self._log.info(f"File saved to s3: {object_name}")
+
     @override
     def _get_xlsx(self, object_name: str) -> Optional[io.BytesIO]:
         return self.__get_s3_object(object_name, lambda body: body)
@@ -44,6 +76,12 @@ class S3TenantStorage(TenantStorage, metaclass=SingletonMeta):
         self._storage.upload_file(object_name, XlsxUtils.get_bytes(object_data))
         self._log.info(f"xlsx file saved to s3: {object_name}")
 
+    def __iter_json_gz_items(self, object_body: Any, field: Optional[str]) -> Iterator[Any]:
+        try:
+            yield from JsonUtils.iter_json_gz_items(object_body, field, self._get_json_gz_chunk_size())
+        finally:
+            object_body.close()
+
     def __get_s3_object(self, file_key: str, mapper_func: Callable[[Any], Any]) -> Any:
         self._log.debug(f"Downloading file from s3: {file_key}...")
         object_body = self._storage.read_object(file_key)
@@ -1,18 +1,29 @@
+import gzip
 import io
 from datetime import UTC, datetime
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterator, List, Optional, Tuple, Type, TypeVar
 
 from openpyxl import Workbook
+from pydantic import BaseModel
 
 from folio_upm.utils import log_factory
+from folio_upm.utils.file_utils import FileUtils
+from folio_upm.utils.json_gz_stream import JsonGzStream
+from folio_upm.utils.json_utils import JsonUtils
+from folio_upm.utils.sectioned_snapshot import SectionedSnapshot
+from folio_upm.utils.snapshot_codec import SnapshotCodec
 from folio_upm.utils.upm_env import Env
 
+M = TypeVar("M", bound=BaseModel)
+
 
 class TenantStorage:
 
     _xlsx_ext = "xlsx"
     _json_ext = "json"
     _json_gz_ext = "json.gz"
+    _bin_gz_ext = "bin.gz"
+    _sections_ext = "sections.bin"
 
     def __init__(self):
         self._tenant_id = Env().get_tenant_id()
@@ -22,6 +33,10 @@ class TenantStorage:
         file_key = self._get_file_key(object_name, object_ext, include_ts=True)
         if object_ext == "json.gz":
             self._save_json_gz(file_key, object_data)
+        elif object_ext == "bin.gz":
+            self._save_bin_gz(file_key, object_data)
+        elif object_ext == "sections.bin":
+            self._save_sections(file_key, object_data)
         elif object_ext == "json":
             self._save_json(file_key, object_data)
         elif object_ext == "xlsx":
@@ -37,6 +52,10 @@ class TenantStorage:
             return None
         if object_ext == "json.gz":
             return self._get_json_gz(object_key)
+        elif object_ext == "bin.gz":
+            return self._get_bin_gz(object_key)
+        elif object_ext == "sections.bin":
+            return self.__get_all_sections(object_key)
         elif object_ext == "json":
             return self._get_json(object_key)
         elif object_ext == "xlsx":
@@ -45,9 +64,93 @@ class TenantStorage:
             self._log.error("Unsupported object type: %s, file=%s", object_ext, object_name)
             return None
 
+    def find_model(
+        self, object_name: str, object_ext: str, model_type: Type[M], fields: Optional[List[str]] = None
+    ) -> Optional[M]:
+        """
+        Finds the latest object by name and validates it directly from JSON bytes as a pydantic model,
+        without building intermediate Python dictionaries.
+
+        :param object_name: object name.
+        :param object_ext: object extension, json.gz, bin.gz or sections.bin (validated from decoded snapshots).
+        :param model_type: pydantic model type.
+        :param fields: model fields loaded up front from sections.bin objects, other fields are loaded on first
+            access (SectionedModel types only), objects in other formats are always loaded fully.
+        :return: validated model or None if the object is not found.
+        """
+        object_key_prefix = self._get_file_prefix(object_name)
+        object_key = self._find_latest_object_by_name(object_key_prefix, object_ext)
+        if object_key is None:
+            self._log.warning("Object not found by prefix: %s", object_key_prefix)
+            return None
+        return self.find_model_by_key(object_key, model_type, fields)
+
+    def find_models(self, object_name: str, object_ext: str, model_type: Type[M]) -> List[M]:
+        object_key_prefix = self._get_file_prefix(object_name)
+        object_keys = self._find_object_keys_by_name(object_key_prefix, object_ext)
+        found_models = [self.find_model_by_key(object_key, model_type) for object_key in object_keys]
+        return [found_model for found_model in found_models if found_model is not None]
+
+    def find_model_by_key(self, ref_key: str, model_type: Type[M], fields: Optional[List[str]] = None) -> Optional[M]:
+        if ref_key.endswith("sections.bin"):
+            sectioned_snapshot = self._get_sections(ref_key)
+            return sectioned_snapshot.to_model(model_type, fields) if sectioned_snapshot is not None else None
+        if ref_key.endswith("bin.gz"):
+            snapshot_value = self._get_bin_gz(ref_key)
+            return model_type.model_validate(snapshot_value) if snapshot_value is not None else None
+        if not ref_key.endswith("json.gz"):
+            self._log.error("Unsupported object type for model validation: %s", ref_key)
+            return None
+        json_bytes = self._get_gz_bytes(ref_key)
+        return model_type.model_validate_json(json_bytes) if json_bytes is not None else None
+
+    def find_object_items(
+        self, object_name: str, object_ext: str, field: Optional[str] = None
+    ) -> Optional[Iterator[Any]]:
+        """
+        Finds the latest object by name and iterates over items of its JSON array, decoding one item at a time.
+
+        :param object_name: object name.
+        :param object_ext: object extension, only json.gz is supported.
+        :param field: name of the top-level object field with array value, None for top-level arrays.
+        :return: iterator of array items or None if the object is not found.
+        """
+        object_key_prefix = self._get_file_prefix(object_name)
+        if object_ext != "json.gz":
+            self._log.error("Unsupported object type for item iteration: %s, file=%s", object_ext, object_name)
+            return None
+        object_key = self._find_latest_object_by_name(object_key_prefix, object_ext)
+        if object_key is None:
+            self._log.warning("Object not found by prefix: %s", object_key_prefix)
+            return None
+        return self._iter_json_gz_items(object_key, field)
+
+    def find_latest_object_key(self, object_name: str, object_exts: List[str]) -> Optional[str]:
+        """
+        Finds the key of the latest object by name across the given extensions.
+
+        :param object_name: object name.
+        :param object_exts: object extensions to check (e.g. snapshot formats).
+        :return: key of the latest object or None if the object is not found in any of the extensions.
+        """
+        object_key_prefix = self._get_file_prefix(object_name)
+        object_keys = self._find_object_keys_by_name(object_key_prefix, "")
+        matching_keys = [key for key in object_keys if any(key.endswith(f".{ext}") for ext in object_exts)]
+        return FileUtils.get_latest_file_key(matching_keys)
+
+    def find_objects(self, object_name: str, object_ext: str) -> List[Any]:
+        object_key_prefix = self._get_file_prefix(object_name)
+        object_keys = self._find_object_keys_by_name(object_key_prefix, object_ext)
+        found_objects = [self.find_object_by_key(object_key) for object_key in object_keys]
+        return [found_object for found_object in found_objects if found_object is not None]
+
     def find_object_by_key(self, ref_key) -> Optional[Any]:
         if ref_key.endswith("json.gz"):
             return self._get_json_gz(ref_key)
+        elif ref_key.endswith("bin.gz"):
+            return self._get_bin_gz(ref_key)
+        elif ref_key.endswith("sections.bin"):
+            return self.__get_all_sections(ref_key)
         elif ref_key.endswith("json"):
             return self._get_json(ref_key)
         else:
@@ -57,6 +160,9 @@ class TenantStorage:
     def _find_latest_object_by_name(self, prefix: str, object_ext: str) -> Optional[str]:
         return None
 
+    def _find_object_keys_by_name(self, prefix: str, object_ext: str) -> List[str]:
+        return []
+
     def _get_json(self, file_key: str):
         pass
 
@@ -69,12 +175,62 @@ class TenantStorage:
     def _save_json_gz(self, object_name: str, object_data: Any) -> None:
         pass
 
+    def _get_gz_bytes(self, object_name: str) -> Optional[bytes]:
+        pass
+
+    def _get_bin_gz(self, object_name: str) -> Optional[Any]:
+        snapshot_bytes = self._get_gz_bytes(object_name)
+        return SnapshotCodec.decode(snapshot_bytes) if snapshot_bytes is not None else None
+
+    def _save_bin_gz(self, object_name: str, object_data: Any) -> None:
+        snapshot_value = object_data
+        if isinstance(object_data, BaseModel):
+            snapshot_value = object_data.model_dump(mode="json", by_alias=True)
+        self._save_stream(object_name, io.BytesIO(gzip.compress(SnapshotCodec.encode(snapshot_value))))
+
+    def _save_sections(self, object_name: str, object_data: Any) -> None:
+        sectioned_snapshot_bytes = SectionedSnapshot.encode(self.__iter_sections(object_data))
+        self._save_stream(object_name, io.BytesIO(sectioned_snapshot_bytes))
+
+    def _get_sections(self, object_name: str) -> Optional[SectionedSnapshot]:
+        pass
+
+    def _save_stream(self, object_name: str, stream: BinaryIO) -> None:
+        pass
+
+    def _iter_json_gz_items(self, object_name: str, field: Optional[str]) -> Optional[Iterator[Any]]:
+        pass
+
     def _get_xlsx(self, object_name: str) -> Optional[io.BytesIO]:
         pass
 
     def _save_xlsx(self, object_name: str, object_data: Workbook) -> None:
         pass
 
+    def __get_all_sections(self, object_name: str) -> Optional[Any]:
+        sectioned_snapshot = self._get_sections(object_name)
+        return sectioned_snapshot.get_sections() if sectioned_snapshot is not None else None
+
+    @staticmethod
+    def __iter_sections(object_data: Any) -> Iterator[Tuple[str, Any]]:
+        if isinstance(object_data, dict):
+            yield from object_data.items()
+            return
+        if not isinstance(object_data, BaseModel):
+            raise ValueError(f"Unsupported sectioned object type: {type(object_data).__name__}")
+        # fields are dumped one at a time, so only one field is kept as Python values at once
+        for field_name in type(object_data).model_fields:
+            dumped_field = object_data.model_dump(mode="json", by_alias=True, include={field_name})
+            yield from dumped_field.items()
+
+    @staticmethod
+    def _get_json_gz_stream(object_data: Any) -> JsonGzStream:
+        return JsonUtils.to_json_gz_stream(object_data, TenantStorage._get_json_gz_chunk_size())
+
+    @staticmethod
+    def _get_json_gz_chunk_size() -> int:
+        return Env().get_int_cached("JSON_GZ_CHUNK_SIZE", default_value=1024 * 1024)
+
     def _get_file_key(self, file_name, extension, include_ts: bool = False) -> str:
         _file_name = f"{self._tenant_id}-{file_name}"
         if include_ts:
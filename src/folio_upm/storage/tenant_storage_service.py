@@ -1,9 +1,9 @@
-from typing import Any, Optional
+from typing import Any, Iterator, List, Optional, Type
 
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.storage.local_tenant_storage import LocalTenantStorage
 from folio_upm.storage.s3_tenant_storage import S3TenantStorage
-from folio_upm.storage.tenant_storage import TenantStorage
+from folio_upm.storage.tenant_storage import M, TenantStorage
 from folio_upm.utils import log_factory
 from folio_upm.utils.upm_env import Env
 
@@ -40,6 +40,120 @@ class TenantStorageService(metaclass=SingletonMeta):
                 return found_object
         raise FileNotFoundError(f"File not found in storages {self._storage_names}: {object_name}.{object_ext}.")
 
+    def find_model(
+        self, object_name: str, object_ext: str, model_type: Type[M], fields: Optional[List[str]] = None
+    ) -> Optional[M]:
+        """
+        Finds the latest object by name and validates it directly from JSON bytes as a pydantic model.
+
+        :param object_name: object name.
+        :param object_ext: object extension, json.gz, bin.gz or sections.bin.
+        :param model_type: pydantic model type.
+        :param fields: model fields to load from sections.bin objects, None to load all fields.
+        :return: validated model from the first storage containing the object, None if it's not found.
+        """
+        for storage in self._storages:
+            found_model = storage.find_model(object_name, object_ext, model_type, fields)
+            if found_model is not None:
+                return found_model
+        return None
+
+    def require_model(self, object_name: str, object_ext: str, model_type: Type[M]) -> M:
+        found_model = self.find_model(object_name, object_ext, model_type)
+        if found_model is None:
+            raise FileNotFoundError(f"File not found in storages {self._storage_names}: {object_name}.{object_ext}.")
+        return found_model
+
+    def find_models(self, object_name: str, object_ext: str, model_type: Type[M]) -> List[M]:
+        """
+        Finds all objects with the given name prefix, sorted by the object key (oldest first), and validates
+        them as pydantic models.
+        """
+        for storage in self._storages:
+            found_models = storage.find_models(object_name, object_ext, model_type)
+            if found_models:
+                return found_models
+        return []
+
+    def find_model_by_key(
+        self, object_key: str, model_type: Type[M], fields: Optional[List[str]] = None
+    ) -> Optional[M]:
+        for storage in self._storages:
+            found_model = storage.find_model_by_key(object_key, model_type, fields)
+            if found_model is not None:
+                return found_model
+        return None
+
+    def save_snapshot(self, object_name: str, object_data: Any) -> None:
+        """
+        Saves a load result snapshot in the format, configured by the SNAPSHOT_FORMAT environment variable.
+
+        :param object_name: object name.
+        :param object_data: pydantic model, dictionary or list to save.
+        """
+        self.save_object(object_name, Env().get_snapshot_format(), object_data)
+
+    def find_snapshot(self, object_name: str, model_type: Type[M], fields: Optional[List[str]] = None) -> Optional[M]:
+        """
+        Finds the latest load result snapshot and validates it as a pydantic model.
+
+        The latest snapshot is resolved across all snapshot formats, so snapshots saved before or after
+        the SNAPSHOT_FORMAT change are never shadowed by older ones in the configured format.
+
+        :param object_name: object name.
+        :param model_type: pydantic model type.
+        :param fields: model fields loaded up front, other fields of sections.bin snapshots are loaded from their
+            sections on first access.
+        :return: validated model, None if the snapshot is not found in any format.
+        """
+        for storage in self._storages:
+            snapshot_key = storage.find_latest_object_key(object_name, Env.snapshot_formats)
+            if snapshot_key is not None:
+                return storage.find_model_by_key(snapshot_key, model_type, fields)
+        return None
+
+    def require_snapshot(self, object_name: str, model_type: Type[M], fields: Optional[List[str]] = None) -> M:
+        found_model = self.find_snapshot(object_name, model_type, fields)
+        if found_model is None:
+            raise FileNotFoundError(f"Snapshot not found in storages {self._storage_names}: {object_name}.")
+        return found_model
+
+    def find_snapshot_object(self, object_name: str) -> Optional[Any]:
+        for storage in self._storages:
+            snapshot_key = storage.find_latest_object_key(object_name, Env.snapshot_formats)
+            if snapshot_key is not None:
+                return storage.find_object_by_key(snapshot_key)
+        return None
+
+    def require_object_items(self, object_name: str, object_ext: str, field: Optional[str] = None) -> Iterator[Any]:
+        """
+        Iterates over items of the JSON array stored in the latest object, decoding one item at a time.
+
+        :param object_name: object name.
+        :param object_ext: object extension, only json.gz is supported.
+        :param field: name of the top-level object field with array value, None for top-level arrays.
+        :return: iterator of array items from the first storage containing the object.
+        """
+        for storage in self._storages:
+            found_items = storage.find_object_items(object_name, object_ext, field)
+            if found_items is not None:
+                return found_items
+        raise FileNotFoundError(f"File not found in storages {self._storage_names}: {object_name}.{object_ext}.")
+
+    def find_objects(self, object_name: str, object_ext: str) -> List[Any]:
+        """
+        Finds all objects with the given name prefix, sorted by the object key (oldest first).
+
+        :param object_name: object name prefix.
+        :param object_ext: object extension.
+        :return: list of objects from the first storage containing them.
+        """
+        for storage in self._storages:
+            found_objects = storage.find_objects(object_name, object_ext)
+            if found_objects:
+                return found_objects
+        return []
+
     def find_object_by_key(self, object_key: str) -> Optional[Any]:
         for storage in self._storages:
             found_object = storage.find_object_by_key(object_key)
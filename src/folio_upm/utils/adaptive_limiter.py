@@ -0,0 +1,154 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from folio_upm.utils import log_factory
+
+_thread_context = threading.local()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe adaptive (AIMD) limiter of concurrent requests.
+
+    The limit is increased by one after a window of requests, if the limit was reached, p95 latency and overload
+    rate are within targets. The limit is decreased multiplicatively (at most once per window) on overload signals
+    or if the window p95 latency exceeds the target.
+
+    Requests are limited by HttpClient, when the limiter is bound to the current thread, each attempt acquires its
+    own slot, so overload responses are observed before retries and backoff delays are not counted as latency.
+    """
+
+    _min_window_size = 10
+    _log_interval = 30.0
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        min_limit: int = 1,
+        target_latency: float = 2.0,
+        target_overload_rate: float = 0.05,
+        backoff_ratio: float = 0.5,
+    ):
+        self._log = log_factory.get_logger(self.__class__.__name__)
+        self._name = name
+        self._max_limit = max_limit
+        self._min_limit = max(min(min_limit, max_limit), 1)
+        self._target_latency = target_latency
+        self._target_overload_rate = target_overload_rate
+        self._backoff_ratio = backoff_ratio
+        self._condition = threading.Condition()
+        self._limit = self._min_limit
+        self._in_flight = 0
+        self._window = _LimiterWindow()
+        self._completed = 0
+        self._logged_at = time.monotonic()
+        self._logged_completed = 0
+
+    def is_enabled(self) -> bool:
+        return self._max_limit > 0
+
+    def get_limit(self) -> int:
+        return self._limit
+
+    def acquire(self) -> None:
+        """
+        Acquires a slot for a request, blocking while the number of in-flight requests reaches the limit.
+        """
+        if not self.is_enabled():
+            return
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+            self._window.peak_in_flight = max(self._window.peak_in_flight, self._in_flight)
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Releases a slot acquired by acquire() and adjusts the limit.
+
+        :param latency: request latency in seconds.
+        :param overloaded: True if the request failed with an overload signal (5xx, 429, timeout).
+        """
+        if not self.is_enabled():
+            return
+        with self._condition:
+            self._in_flight -= 1
+            self._completed += 1
+            window = self._window
+            window.latencies.append(latency)
+            if overloaded:
+                window.overloads += 1
+                if not window.decreased:
+                    self.__decrease_limit("overload")
+                    window.decreased = True
+            if len(window.latencies) >= max(self._limit, self._min_window_size):
+                self.__complete_window(window)
+            self.__log_stats()
+            self._condition.notify_all()
+
+    @contextmanager
+    def bind(self) -> Iterator[None]:
+        """
+        Binds the limiter to the current thread, HTTP requests sent by the wrapped block are limited by it.
+        """
+        previous_limiter = AdaptiveConcurrencyLimiter.get_bound()
+        _thread_context.limiter = self
+        try:
+            yield
+        finally:
+            _thread_context.limiter = previous_limiter
+
+    @staticmethod
+    def get_bound() -> Optional["AdaptiveConcurrencyLimiter"]:
+        return getattr(_thread_context, "limiter", None)
+
+    def __complete_window(self, window: "_LimiterWindow") -> None:
+        p95_latency = self.__get_p95(window.latencies)
+        overload_rate = window.overloads / len(window.latencies)
+        if not window.decreased:
+            if p95_latency > self._target_latency or overload_rate > self._target_overload_rate:
+                self.__decrease_limit(f"p95={p95_latency:.3f}s, overloadRate={overload_rate:.3f}")
+            elif window.peak_in_flight >= self._limit and self._limit < self._max_limit:
+                self._limit += 1
+        self._window = _LimiterWindow()
+
+    def __decrease_limit(self, reason: str) -> None:
+        new_limit = max(int(self._limit * self._backoff_ratio), self._min_limit)
+        if new_limit < self._limit:
+            self._log.warning(
+                "Concurrency limit for '%s' decreased: %s -> %s (%s)", self._name, self._limit, new_limit, reason
+            )
+        self._limit = new_limit
+
+    def __log_stats(self) -> None:
+        now = time.monotonic()
+        elapsed_time = now - self._logged_at
+        if elapsed_time < self._log_interval:
+            return
+        self._log.info(
+            "Concurrency limit for '%s': limit=%s, inFlight=%s, throughput=%.2f req/s",
+            self._name,
+            self._limit,
+            self._in_flight,
+            (self._completed - self._logged_completed) / elapsed_time,
+        )
+        self._logged_at = now
+        self._logged_completed = self._completed
+
+    @staticmethod
+    def __get_p95(latencies: List[float]) -> float:
+        sorted_latencies = sorted(latencies)
+        return sorted_latencies[max(math.ceil(len(sorted_latencies) * 0.95) - 1, 0)]
+
+
+class _LimiterWindow:
+
+    def __init__(self):
+        self.latencies = list[float]()
+        self.overloads = 0
+        self.peak_in_flight = 0
+        self.decreased = False
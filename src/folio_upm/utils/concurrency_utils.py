@@ -0,0 +1,49 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ConcurrencyUtils:
+
+    @staticmethod
+    def map_ordered(
+        func: Callable[[T], R],
+        items: Sequence[T],
+        max_workers: int = 1,
+        on_completed: Optional[Callable[[int, int], None]] = None,
+    ) -> List[R]:
+        """
+        Applies the function to every item using a bounded thread pool.
+
+        Items are processed sequentially in the caller thread if max_workers is less than 2.
+
+        :param func: function to apply to each item.
+        :param items: items to process.
+        :param max_workers: max number of worker threads.
+        :param on_completed: optional callback, called with number of processed and total items after each item.
+        :return: list of results in the same order as the provided items.
+        """
+        _func = func if on_completed is None else ConcurrencyUtils.__with_progress(func, len(items), on_completed)
+        if max_workers < 2 or len(items) < 2:
+            return [_func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(_func, items))
+
+    @staticmethod
+    def __with_progress(func: Callable[[T], R], total: int, on_completed: Callable[[int, int], None]):
+        lock = threading.Lock()
+        completed = 0
+
+        def func_with_progress(item: T) -> R:
+            nonlocal completed
+            result = func(item)
+            with lock:
+                completed += 1
+                on_completed(completed, total)
+            return result
+
+        return func_with_progress
@@ -0,0 +1,108 @@
+import threading
+from typing import Any, Callable, Dict, Generic, List, Tuple, TypeVar
+
+from cachetools import TTLCache
+
+from folio_upm.model.stats.entity_cache_stats import EntityCacheStats
+from folio_upm.utils import log_factory
+from folio_upm.utils.iterable_utils import IterableUtils
+from folio_upm.utils.upm_env import Env
+
+T = TypeVar("T")
+
+
+class EntityCache(Generic[T]):
+    """
+    Thread-safe read-through cache of entities by lookup field value (e.g. name, permission, id).
+
+    Values that were requested, but not found are cached as well (as an empty list of entities), unless
+    the caller disables it for entities, that can be created concurrently by other processes.
+    Cache is bounded by ENTITY_CACHE_SIZE entries and ENTITY_CACHE_TTL seconds, 0 for size disables the cache.
+    """
+
+    def __init__(self, name: str):
+        self._log = log_factory.get_logger(self.__class__.__name__)
+        self._name = name
+        self._max_size = Env().get_int_cached("ENTITY_CACHE_SIZE", default_value=10000)
+        self._ttl = Env().get_int_cached("ENTITY_CACHE_TTL", default_value=600)
+        self._cache = TTLCache[Tuple[str, Any], List[T]](maxsize=max(self._max_size, 1), ttl=self._ttl)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_all(self, field: str, values: List[Any]) -> Tuple[List[T], List[Any]]:
+        """
+        Finds cached entities by field values.
+
+        :param field: lookup field name.
+        :param values: lookup field values.
+        :return: tuple with list of cached entities and list of values, missing in the cache.
+        """
+        unique_values = IterableUtils.unique_values(values)
+        if not self.__is_enabled():
+            return [], unique_values
+
+        found_entities = list[T]()
+        missing_values = list[Any]()
+        with self._lock:
+            for value in unique_values:
+                cached_entities = self._cache.get((field, value))
+                if cached_entities is None:
+                    missing_values.append(value)
+                else:
+                    found_entities += cached_entities
+            self._hits += len(unique_values) - len(missing_values)
+            self._misses += len(missing_values)
+        return found_entities, missing_values
+
+    def put_all(self, field: str, values: List[Any], entities: List[T], cache_missing: bool = True) -> None:
+        """
+        Caches loaded entities for the requested field values.
+
+        :param field: lookup field name.
+        :param values: requested field values.
+        :param entities: entities, loaded for the requested field values.
+        :param cache_missing: if True, values without entities are cached as not found.
+        """
+        if not self.__is_enabled():
+            return
+        entities_by_value = self.__group_by_field(field, entities)
+        with self._lock:
+            for value in values:
+                found_entities = entities_by_value.get(value, [])
+                if found_entities or cache_missing:
+                    self._cache[(field, value)] = found_entities
+
+    def invalidate(self, field: str, value: Any) -> None:
+        with self._lock:
+            self._cache.pop((field, value), None)
+
+    def invalidate_if(self, predicate: Callable[[T], bool]) -> None:
+        """
+        Removes all cache entries, containing at least one entity, matching the predicate.
+
+        :param predicate: entity predicate.
+        """
+        with self._lock:
+            keys_to_remove = [key for key, entities in self._cache.items() if any(predicate(e) for e in entities)]
+            for key in keys_to_remove:
+                self._cache.pop(key, None)
+
+    def get_stats(self) -> EntityCacheStats:
+        with self._lock:
+            return EntityCacheStats(hits=self._hits, misses=self._misses, size=len(self._cache))
+
+    def log_stats(self) -> None:
+        stats = self.get_stats()
+        msg_template = "Entity cache stats for '%s': hits=%s, misses=%s, size=%s"
+        self._log.info(msg_template, self._name, stats.hits, stats.misses, stats.size)
+
+    def __is_enabled(self) -> bool:
+        return self._max_size > 0
+
+    @staticmethod
+    def __group_by_field(field: str, entities: List[T]) -> Dict[Any, List[T]]:
+        entities_by_value = dict[Any, List[T]]()
+        for entity in entities:
+            entities_by_value.setdefault(getattr(entity, field, None), []).append(entity)
+        return entities_by_value
@@ -1,9 +1,12 @@
 import glob
+import mmap
 import os
 import re
+import shutil
+from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, List, Optional, cast
 
 from folio_upm.utils import log_factory
 
@@ -25,6 +28,34 @@ class FileUtils:
             _log.debug("Returning file: '%s'", file_key)
             return file_bytes_buffer
 
+    @staticmethod
+    @contextmanager
+    def open_mapped(file_key) -> Iterator[Optional[BinaryIO]]:
+        """
+        Opens a file as a read-only memory-mapped stream, yields None if the file does not exist.
+        """
+        if not os.path.exists(file_key):
+            _log.warning("File '%s' not found", file_key)
+            yield None
+            return
+
+        with open(file_key, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield BytesIO()
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                _log.debug("Returning memory-mapped file: '%s'", file_key)
+                yield cast(BinaryIO, mapped_file)
+
+    @staticmethod
+    def read_range(file_key, offset: int, size: int) -> bytes:
+        """
+        Reads up to the given number of bytes from a file, starting from the given offset.
+        """
+        with open(file_key, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
     @staticmethod
     def write_binary_data(file_key, binary_data: BytesIO) -> None:
         _log.debug("Saving file: '%s' ...", file_key)
@@ -37,6 +68,23 @@ class FileUtils:
             f.write(binary_data.getbuffer())
             _log.debug("Data saved to file '%s'", file_key)
 
+    @staticmethod
+    def write_stream(file_key, stream: BinaryIO, chunk_size: int = 1024 * 1024) -> None:
+        """
+        Writes data from a stream chunk by chunk into a temporary file, which replaces the target file once
+        the stream is fully written, so a partially written file is never visible under the target name.
+        """
+        _log.debug("Saving file from stream: '%s' ...", file_key)
+        temp_file_key = f"{file_key}.tmp"
+        try:
+            with open(temp_file_key, "wb") as f:
+                shutil.copyfileobj(stream, f, chunk_size)
+            os.replace(temp_file_key, file_key)
+        finally:
+            if os.path.exists(temp_file_key):
+                os.remove(temp_file_key)
+        _log.debug("Data saved to file '%s'", file_key)
+
     @staticmethod
     def exists(file_key: Path) -> bool:
         _log.debug("Checking if file exists: '%s'", file_key)
@@ -51,13 +99,20 @@ class FileUtils:
 
     @staticmethod
     def find_latest_key_by_prefix(out_folder: str, prefix: str, object_ext: str) -> Optional[str]:
+        matching_keys = FileUtils.find_keys_by_prefix(out_folder, prefix, object_ext)
+        latest_key = FileUtils.get_latest_file_key(matching_keys)
+        _log.debug(f"Found files with prefix '{prefix}', latest: {latest_key}, files: {matching_keys}")
+        return latest_key
+
+    @staticmethod
+    def find_keys_by_prefix(out_folder: str, prefix: str, object_ext: str) -> List[str]:
         try:
             search_pattern = os.path.join(out_folder, f"{prefix}*")
             matching_files = glob.glob(search_pattern)
 
             if not matching_files:
                 _log.debug(f"No files found with prefix: {prefix}")
-                return None
+                return []
 
             matching_keys = []
             for file_path in matching_files:
@@ -65,13 +120,11 @@ class FileUtils:
                 matching_keys.append(relative_key)
 
             matching_keys = [key for key in matching_keys if key.endswith(object_ext)]
-            latest_key = FileUtils.get_latest_file_key(matching_keys)
-            _log.debug(f"Found files with prefix '{prefix}', latest: {latest_key}, files: {matching_keys}")
-            return latest_key
+            return sorted(matching_keys, key=FileUtils.get_file_sort_key)
 
         except Exception as e:
-            _log.error("Error finding latest file with prefix '%s/%s'", out_folder, prefix, e)
-            return None
+            _log.error("Error finding files with prefix '%s/%s'", out_folder, prefix, e)
+            return []
 
     @staticmethod
     def get_latest_file_key(matching_object_keys: list[str]) -> Optional[str]:
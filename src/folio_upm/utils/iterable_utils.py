@@ -1,4 +1,5 @@
-from typing import Any, Callable, Iterable, List, Optional, Sequence, Set, TypeVar
+import itertools
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Set, TypeVar
 
 T = TypeVar("T")
 
@@ -10,6 +11,46 @@ class IterableUtils:
         _data = data
         return [list(_data[i : i + size]) for i in range(0, len(_data), size)]
 
+    @staticmethod
+    def iter_partitions(data: Iterable[T], size: int) -> Iterator[List[T]]:
+        """
+        Lazily partitions an iterable, only a single partition is kept in memory.
+        """
+        iterator = iter(data)
+        while partition := list(itertools.islice(iterator, size)):
+            yield partition
+
+    @staticmethod
+    def partition_by_weight(
+        data: Sequence[T], max_size: int, max_weight: int, weight_func: Callable[[T], int]
+    ) -> List[List[T]]:
+        """
+        Partitions data into chunks limited by both number of values and their total weight.
+
+        A value heavier than max_weight is placed into a separate partition.
+
+        :param data: values to partition.
+        :param max_size: max number of values per partition.
+        :param max_weight: max total weight of values per partition.
+        :param weight_func: function to calculate weight of a single value.
+        :return: list of partitions in the same order as the provided values.
+        """
+        partitions = list[List[T]]()
+        current_partition = list[T]()
+        current_weight = 0
+        for value in data:
+            weight = weight_func(value)
+            is_full = len(current_partition) >= max_size or current_weight + weight > max_weight
+            if current_partition and is_full:
+                partitions.append(current_partition)
+                current_partition = list[T]()
+                current_weight = 0
+            current_partition.append(value)
+            current_weight += weight
+        if current_partition:
+            partitions.append(current_partition)
+        return partitions
+
     @staticmethod
     def first(value: Sequence[Optional[Any]]):
         if value is not None and len(value) > 0:
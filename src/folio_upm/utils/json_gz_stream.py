@@ -0,0 +1,47 @@
+import io
+import zlib
+from typing import Iterator
+
+_gzip_wbits = 16 + zlib.MAX_WBITS
+
+
+class JsonGzStream(io.RawIOBase):
+    """
+    Readable stream of gzip-compressed JSON, produced lazily from JSON text chunks.
+
+    JSON chunks are accumulated up to the chunk size before compression, so memory used by the stream is bounded
+    by the chunk size and the size of the read requests, not by the size of the serialized object.
+    """
+
+    def __init__(self, json_chunks: Iterator[str], chunk_size: int = 1024 * 1024):
+        super().__init__()
+        self._json_chunks = json_chunks
+        self._chunk_size = max(chunk_size, 1)
+        self._compressor = zlib.compressobj(wbits=_gzip_wbits)
+        self._buffer = bytearray()
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        requested_size = len(buffer)
+        while len(self._buffer) < requested_size and not self._finished:
+            self.__compress_next_chunk()
+        size = min(requested_size, len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        del self._buffer[:size]
+        return size
+
+    def __compress_next_chunk(self) -> None:
+        raw_chunk = list[str]()
+        raw_chunk_size = 0
+        for json_chunk in self._json_chunks:
+            raw_chunk.append(json_chunk)
+            raw_chunk_size += len(json_chunk)
+            if raw_chunk_size >= self._chunk_size:
+                self._buffer += self._compressor.compress("".join(raw_chunk).encode("utf-8"))
+                return
+        self._buffer += self._compressor.compress("".join(raw_chunk).encode("utf-8"))
+        self._buffer += self._compressor.flush()
+        self._finished = True
@@ -0,0 +1,113 @@
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator, Optional
+
+_whitespace = " \t\n\r"
+
+
+class JsonItemIterator:
+    """
+    Iterates over items of a JSON array, read from a binary stream of UTF-8 JSON text.
+
+    The array can be the top-level value or the value of a top-level object field. Only the text of the item
+    being decoded is kept in memory, values of other fields are decoded and discarded one at a time.
+    """
+
+    def __init__(self, stream: BinaryIO, field: Optional[str] = None, chunk_size: int = 1024 * 1024):
+        """
+        :param stream: binary stream with JSON text.
+        :param field: name of the top-level object field with array value, None for top-level arrays.
+        :param chunk_size: number of bytes read from the stream at once.
+        """
+        self._stream = stream
+        self._field = field
+        self._chunk_size = max(chunk_size, 1)
+        self._json_decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._field is not None and not self.__find_field(self._field):
+            return
+        self.__expect("[")
+        if self.__peek() == "]":
+            return
+        while True:
+            yield self.__decode_value()
+            char = self.__next_char()
+            if char == "]":
+                return
+            self.__check_char(",", char)
+
+    def __find_field(self, field: str) -> bool:
+        self.__expect("{")
+        if self.__peek() == "}":
+            return False
+        while True:
+            key = self.__decode_value()
+            self.__expect(":")
+            if key == field:
+                return True
+            self.__decode_value()
+            char = self.__next_char()
+            if char == "}":
+                return False
+            self.__check_char(",", char)
+
+    def __decode_value(self) -> Any:
+        while True:
+            self.__skip_whitespace()
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+                # a number at the end of the buffer can be truncated, it's decoded again with more data
+                if end < len(self._buffer) or self._eof:
+                    self._position = end
+                    self.__compact()
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self.__read_more()
+
+    def __expect(self, expected_char: str) -> None:
+        self.__check_char(expected_char, self.__next_char())
+
+    def __check_char(self, expected_char: str, char: str) -> None:
+        if char != expected_char:
+            raise ValueError(f"Invalid JSON: expected '{expected_char}', found '{char}' at {self._position}")
+
+    def __next_char(self) -> str:
+        char = self.__peek()
+        self._position += 1
+        return char
+
+    def __peek(self) -> str:
+        self.__skip_whitespace()
+        if self._position >= len(self._buffer):
+            raise ValueError("Invalid JSON: unexpected end of data")
+        return self._buffer[self._position]
+
+    def __skip_whitespace(self) -> None:
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _whitespace:
+                self._position += 1
+            if self._position < len(self._buffer) or self._eof:
+                return
+            self.__read_more()
+
+    def __read_more(self) -> None:
+        # read size grows with the pending text, so a large item is not decoded again for every chunk
+        read_size = max(self._chunk_size, len(self._buffer) - self._position)
+        data = self._stream.read(read_size)
+        if not data:
+            self._eof = True
+            self._buffer += self._text_decoder.decode(b"", final=True)
+            return
+        self._buffer += self._text_decoder.decode(data)
+
+    def __compact(self) -> None:
+        if self._position >= self._chunk_size:
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
@@ -2,10 +2,14 @@ import gzip
 import io
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator, Optional
+
+from pydantic import BaseModel
 
 from folio_upm.model.cls_support import SingletonMeta
 from folio_upm.utils import log_factory
+from folio_upm.utils.json_gz_stream import JsonGzStream
+from folio_upm.utils.json_item_iterator import JsonItemIterator
 
 
 class JsonUtils(metaclass=SingletonMeta):
@@ -47,11 +51,102 @@ class JsonUtils(metaclass=SingletonMeta):
         return gzip_buffer
 
     @staticmethod
-    def from_json_gz(response_body: io.BytesIO) -> Any:
-        gzip_stream = io.BytesIO(response_body.read())
-        gzip_stream.seek(0)
-        with gzip.GzipFile(fileobj=gzip_stream, mode="r") as gzip_file:
-            return json.loads(gzip_file.read().decode("utf-8"))
+    def to_json_gz_stream(json_object, chunk_size: int = 1024 * 1024) -> JsonGzStream:
+        """
+        Creates a readable stream of gzip-compressed JSON, serialized incrementally from the given object.
+
+        :param json_object: pydantic model, dict or list (lists and dict values are serialized item by item).
+        :param chunk_size: size of JSON text compressed at once.
+        :return: readable stream with gzip-compressed JSON.
+        """
+        return JsonGzStream(JsonUtils.iter_json_chunks(json_object), chunk_size)
+
+    @staticmethod
+    def iter_json_chunks(json_object) -> Iterator[str]:
+        """
+        Serializes the given object to JSON text chunks.
+
+        Fields of pydantic models with list values (without custom serializers), lists and dict values are
+        serialized item by item, so an item is the largest value kept in memory at once.
+        Models are serialized by alias.
+
+        :param json_object: pydantic model, dict, list or any JSON-serializable value.
+        :return: iterator of JSON text chunks.
+        """
+        if isinstance(json_object, BaseModel):
+            yield from JsonUtils.__iter_model_chunks(json_object)
+        elif isinstance(json_object, dict):
+            yield "{"
+            for i, (key, value) in enumerate(json_object.items()):
+                yield f"{", " if i else ""}{json.dumps(key)}: "
+                yield from JsonUtils.iter_json_chunks(value)
+            yield "}"
+        elif isinstance(json_object, (list, tuple)):
+            yield from JsonUtils.__iter_list_chunks(json_object)
+        else:
+            yield json.dumps(json_object)
+
+    @staticmethod
+    def __iter_model_chunks(model: BaseModel) -> Iterator[str]:
+        custom_serialized_fields = {
+            field
+            for decorator in model.__pydantic_decorators__.field_serializers.values()
+            for field in decorator.info.fields
+        }
+        yield "{"
+        for i, (field_name, field_info) in enumerate(type(model).model_fields.items()):
+            field_key = field_info.alias or field_name
+            yield f"{", " if i else ""}{json.dumps(field_key)}: "
+            value = getattr(model, field_name)
+            if field_name in custom_serialized_fields:
+                yield json.dumps(model.model_dump(mode="json", by_alias=True, include={field_name})[field_key])
+            elif isinstance(value, list):
+                yield from JsonUtils.__iter_list_chunks(value)
+            elif isinstance(value, BaseModel):
+                yield value.model_dump_json(by_alias=True)
+            else:
+                yield json.dumps(model.model_dump(mode="json", by_alias=True, include={field_name})[field_key])
+        yield "}"
+
+    @staticmethod
+    def __iter_list_chunks(values) -> Iterator[str]:
+        yield "["
+        for i, value in enumerate(values):
+            if i:
+                yield ", "
+            if isinstance(value, BaseModel):
+                yield value.model_dump_json(by_alias=True)
+            else:
+                yield from JsonUtils.iter_json_chunks(value)
+        yield "]"
+
+    @staticmethod
+    def from_json_gz(response_body: BinaryIO) -> Any:
+        """
+        Decompresses gzip-compressed JSON directly from the given stream (file, memory-mapped file or S3 body)
+        and parses the decompressed UTF-8 bytes without copying them into a string.
+        """
+        return json.loads(JsonUtils.read_gz_bytes(response_body))
+
+    @staticmethod
+    def read_gz_bytes(response_body: BinaryIO) -> bytes:
+        with gzip.GzipFile(fileobj=response_body, mode="rb") as gzip_file:
+            return gzip_file.read()
+
+    @staticmethod
+    def iter_json_gz_items(
+        response_body: BinaryIO, field: Optional[str] = None, chunk_size: int = 1024 * 1024
+    ) -> Iterator[Any]:
+        """
+        Iterates over items of a gzip-compressed JSON array, decompressing and decoding one item at a time.
+
+        :param response_body: stream with gzip-compressed JSON.
+        :param field: name of the top-level object field with array value, None for top-level arrays.
+        :param chunk_size: number of decompressed bytes read at once.
+        :return: iterator of decoded array items.
+        """
+        with gzip.GzipFile(fileobj=response_body, mode="rb") as gzip_file:
+            yield from JsonItemIterator(gzip_file, field, chunk_size)
 
     @staticmethod
     def to_formatted_json_file(json_object, file):
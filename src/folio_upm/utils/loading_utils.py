@@ -1,12 +1,18 @@
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
+from urllib.parse import quote_plus
+
+import requests
 
 from folio_upm.utils import log_factory
+from folio_upm.utils.concurrency_utils import ConcurrencyUtils
 from folio_upm.utils.iterable_utils import IterableUtils
 from folio_upm.utils.upm_env import Env
 
 
 class PartitionedDataLoader:
 
+    _rejected_query_statuses = {400, 414}
+
     def __init__(
         self,
         resource: str,
@@ -14,39 +20,98 @@ class PartitionedDataLoader:
         data_loader: Callable[[str], List[Any]],
         query_builder: Callable[[List[Any]], str],
         partition_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        max_query_length: Optional[int] = None,
+        on_partition_loaded: Optional[Callable[[List[Any], List[Any]], None]] = None,
     ):
+        """
+        Creates a loader for data requested by CQL queries built from partitions of the provided values.
+
+        Partitions are limited by number of values and by the length of URL-encoded query, built for them.
+        If a query is rejected because of its size (400, 414), partition is split in half and loaded again.
+
+        :param resource: resource name, used for logging.
+        :param data: values to build CQL queries for.
+        :param data_loader: function to load records by CQL query.
+        :param query_builder: function to build CQL query for a partition of values.
+        :param partition_size: max number of values per query (QUERY_CHUNK_SIZE by default).
+        :param concurrency: max number of partitions loaded in parallel (QUERY_CONCURRENCY by default).
+        :param max_query_length: max length of URL-encoded query (QUERY_MAX_LENGTH by default).
+        :param on_partition_loaded: optional callback, called with partition values and loaded records
+            for each successfully loaded partition.
+        """
 
-        default_partition_size = "50"
-        cached = Env().getenv_cached("QUERY_CHUNK_SIZE", default_value=default_partition_size)
-        _partition_size = partition_size or int(cached or default_partition_size)
         self._resource = resource
         self._log = log_factory.get_logger(self.__class__.__name__)
-
-        self._partitioned_data = IterableUtils.partition(data, _partition_size)
         self._data_loader = data_loader
         self._query_builder = query_builder
+        self._on_partition_loaded = on_partition_loaded
+        self._concurrency = concurrency or Env().get_int_cached("QUERY_CONCURRENCY", default_value=1)
+        _partition_size = partition_size or Env().get_int_cached("QUERY_CHUNK_SIZE", default_value=500)
+        _max_query_length = max_query_length or Env().get_int_cached("QUERY_MAX_LENGTH", default_value=3500)
+        self._partitioned_data = self.__partition(data, _partition_size, _max_query_length)
 
     def load(self) -> List[Any]:
-        result = []
-
-        self._log.info("Loading partitioned data for '%s'", self._resource)
-        for partition in self._partitioned_data:
-
-            query = self._query_builder(partition)
-            self._log.debug("Loading partitioned data ('%s') for query: '%s'", self._resource, query)
-            try:
-                loaded_data = self._data_loader(query)
-            except Exception as e:
-                self._log.error(
-                    "Failed to load partitioned data for '%s' and query: '%s': %s", self._resource, query, e
-                )
-                loaded_data = []
-
-            self._log.debug("Partitioned data loaded '%s': records=%s", self._resource, len(loaded_data))
-            result += loaded_data
+        partitions = self._partitioned_data
+        self._log.info(
+            "Loading partitioned data for '%s': partitions=%s, concurrency=%s",
+            self._resource,
+            len(partitions),
+            self._concurrency,
+        )
+
+        loaded_partitions = ConcurrencyUtils.map_ordered(self.__load_partition, partitions, self._concurrency)
+        result = [value for loaded_partition in loaded_partitions for value in loaded_partition]
         self._log.info("Partitioned data loading finished for '%s': total=%d", self._resource, len(result))
         return result
 
+    def __partition(self, data: List[Any], max_size: int, max_query_length: int) -> List[List[Any]]:
+        if not data:
+            return []
+
+        base_length = self.__get_encoded_query_length([])
+        single_value_length = self.__get_encoded_query_length(data[:1])
+        two_values_length = self.__get_encoded_query_length([data[0], data[0]])
+        separator_length = max(two_values_length - 2 * single_value_length + base_length, 0)
+
+        def get_value_weight(value: Any) -> int:
+            return max(self.__get_encoded_query_length([value]) - base_length, 0) + separator_length
+
+        # separator is included into the weight of each value, so the last one is compensated in max_weight
+        max_weight = max_query_length - base_length + separator_length
+        return IterableUtils.partition_by_weight(data, max_size, max_weight, get_value_weight)
+
+    def __get_encoded_query_length(self, values: List[Any]) -> int:
+        return len(quote_plus(self._query_builder(values)))
+
+    def __load_partition(self, partition: List[Any]) -> List[Any]:
+        query = self._query_builder(partition)
+        self._log.debug("Loading partitioned data ('%s') for query: '%s'", self._resource, query)
+        try:
+            loaded_data = self._data_loader(query)
+        except requests.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if len(partition) > 1 and status_code in self._rejected_query_statuses:
+                return self.__load_bisected(partition, status_code)
+            response_text = e.response.text if e.response is not None else None
+            msg_template = "Failed to load partitioned data for '%s' and query: '%s': %s, response: %s"
+            self._log.error(msg_template, self._resource, query, e, response_text)
+            return []
+        except Exception as e:
+            self._log.error("Failed to load partitioned data for '%s' and query: '%s': %s", self._resource, query, e)
+            return []
+
+        self._log.debug("Partitioned data loaded '%s': records=%s", self._resource, len(loaded_data))
+        if self._on_partition_loaded is not None:
+            self._on_partition_loaded(partition, loaded_data)
+        return loaded_data
+
+    def __load_bisected(self, partition: List[Any], status_code: int) -> List[Any]:
+        middle = len(partition) // 2
+        msg_template = "Query rejected for '%s' (status=%s, values=%s), retrying with split partitions..."
+        self._log.warning(msg_template, self._resource, status_code, len(partition))
+        return self.__load_partition(partition[:middle]) + self.__load_partition(partition[middle:])
+
 
 class PagedDataLoader:
 
@@ -56,17 +121,71 @@ class PagedDataLoader:
         loader_func: Callable[[str, int, int], List[Any]],
         query: str = "cql.allRecords=1",
         batch_limit: int = 500,
+        counted_loader_func: Optional[Callable[[str, int, int], Tuple[List[Any], Optional[int]]]] = None,
+        concurrency: Optional[int] = None,
+        raise_on_error: bool = False,
     ):
+        """
+        Loads all records for a query page by page.
+
+        If counted_loader_func is provided and concurrency is greater than 1, the first page is loaded with it to
+        resolve totalRecords, and remaining offsets are loaded in parallel. Otherwise (or if totalRecords is not
+        reported), pages are loaded sequentially until a short page is returned.
+
+        :param resource: resource name (used for logging).
+        :param loader_func: function to load a page by query, limit and offset.
+        :param query: CQL query.
+        :param batch_limit: page size.
+        :param counted_loader_func: function to load a page together with the totalRecords value.
+        :param concurrency: max number of pages loaded in parallel.
+        :param raise_on_error: if True, page loading errors are raised, otherwise failed pages are loaded as empty.
+        """
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._resource = resource
         self._query = query
         self._loader_func = loader_func
+        self._counted_loader_func = counted_loader_func
         self._batch_limit = batch_limit
+        self._concurrency = concurrency or Env().get_int_cached("PAGE_LOAD_CONCURRENCY", default_value=1)
+        self._raise_on_error = raise_on_error
 
     def load(self) -> List[Any]:
         self._log.info("Loading paged data for '%s' and query: '%s'...", self._resource, self._query)
-        result = []
-        last_offset = 0
+        if self._counted_loader_func is None or self._concurrency < 2:
+            return self.__load_sequentially([], 0)
+        return self.__load_concurrently()
+
+    def load_page(self, last_offset: int = 0) -> List[Any]:
+        try:
+            return self._loader_func(self._query, self._batch_limit, last_offset)
+        except Exception as e:
+            self._log.error("Failed to load page for '%s': %s", self._resource, e)
+            if self._raise_on_error:
+                raise
+            return []
+
+    def __load_concurrently(self) -> List[Any]:
+        first_page, total_records = self.__load_counted_page()
+        limit = self._batch_limit
+        if len(first_page) < limit:
+            self._log.info("Paged data loading finished for '%s': total=%s", self._resource, len(first_page))
+            return first_page
+
+        if total_records is None:
+            self._log.debug("totalRecords is not provided for '%s', loading pages sequentially", self._resource)
+            return self.__load_sequentially(first_page, limit)
+
+        offsets = list(range(limit, total_records, limit))
+        msg_template = "Loading '%s' pages concurrently: totalRecords=%s, pages=%s, concurrency=%s"
+        self._log.debug(msg_template, self._resource, total_records, len(offsets) + 1, self._concurrency)
+        pages = ConcurrencyUtils.map_ordered(self.load_page, offsets, self._concurrency)
+        result = first_page + [record for page in pages for record in page]
+        self._log.info("Paged data loading finished for '%s': total=%s", self._resource, len(result))
+        return result
+
+    def __load_sequentially(self, loaded_records: List[Any], start_offset: int) -> List[Any]:
+        result = loaded_records
+        last_offset = start_offset
         while True:
             self._log.debug(
                 "Loading '%s' page: query='%s', limit=%s, offset=%s",
@@ -85,9 +204,13 @@ class PagedDataLoader:
                 break
         return result
 
-    def load_page(self, last_offset: int = 0) -> List[Any]:
+    def __load_counted_page(self) -> Tuple[List[Any], Optional[int]]:
+        if self._counted_loader_func is None:
+            return self.load_page(0), None
         try:
-            return self._loader_func(self._query, self._batch_limit, last_offset)
+            return self._counted_loader_func(self._query, self._batch_limit, 0)
         except Exception as e:
-            self._log.error("Failed to load page for '%s': %s", self._resource, e)
-            return []
+            self._log.error("Failed to load first page for '%s': %s", self._resource, e)
+            if self._raise_on_error:
+                raise
+            return [], None
@@ -0,0 +1,43 @@
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens are refilled continuously with the given rate (tokens per second) up to the bucket capacity, each call of
+    acquire() consumes a single token or blocks until it's available. Non-positive rate disables the limiter.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self._rate = rate
+        self._capacity = max(capacity, 1)
+        self._tokens = float(self._capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        return self._rate > 0
+
+    def acquire(self) -> float:
+        """
+        Acquires a single token, blocking until it's available.
+
+        :return: time in seconds spent waiting for the token.
+        """
+        if not self.is_enabled():
+            return 0.0
+
+        waited_time = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(float(self._capacity), self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited_time
+                wait_time = (1 - self._tokens) / self._rate
+            time.sleep(wait_time)
+            waited_time += wait_time
@@ -0,0 +1,106 @@
+import gzip
+import io
+import json
+import struct
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from folio_upm.model.load.sectioned_model import SectionedModel
+from folio_upm.utils.snapshot_codec import SnapshotCodec
+
+M = TypeVar("M", bound=BaseModel)
+
+_magic = b"UPMX"
+_version = 1
+_header_format = "<4sBI"
+_header_size = struct.calcsize(_header_format)
+_header_read_size = 64 * 1024
+
+
+class SectionedSnapshot:
+    """
+    Snapshot of a JSON object (e.g. dumped OkapiLoadResult or EurekaLoadResult), where the value of each top-level
+    field is stored as an independently compressed section.
+
+    Layout: magic, version, index size (uint32), index (JSON with section names, offsets and sizes), sections.
+    Section offsets are relative to the end of the index, each section is a gzip-compressed SnapshotCodec value.
+
+    The index is read when the snapshot is opened, sections are read and decoded only when they are requested,
+    so a command using a single field of a large snapshot does not read and decode the other fields.
+    """
+
+    def __init__(self, read_range: Callable[[int, int], bytes]):
+        """
+        :param read_range: function, returning the given number of bytes, starting from the given offset.
+        """
+        self._read_range = read_range
+        self._data_offset, self._sections = self.__read_index()
+
+    @staticmethod
+    def encode(sections: Iterable[Tuple[str, Any]]) -> bytes:
+        """
+        Encodes sections, provided as pairs of a field name and JSON-compatible field value.
+        """
+        index = list[Dict[str, Any]]()
+        compressed_sections = io.BytesIO()
+        for name, value in sections:
+            compressed_value = gzip.compress(SnapshotCodec.encode(value))
+            index.append({"name": name, "offset": compressed_sections.tell(), "size": len(compressed_value)})
+            compressed_sections.write(compressed_value)
+
+        index_bytes = json.dumps({"sections": index}).encode("utf-8")
+        header = struct.pack(_header_format, _magic, _version, len(index_bytes))
+        return header + index_bytes + compressed_sections.getvalue()
+
+    def get_section_names(self) -> List[str]:
+        return list(self._sections)
+
+    def get_section(self, name: str) -> Optional[Any]:
+        """
+        Reads and decodes a section, returns None if the snapshot does not contain it.
+        """
+        section = self._sections.get(name)
+        if section is None:
+            return None
+        offset, size = section
+        return SnapshotCodec.decode(gzip.decompress(self._read_range(self._data_offset + offset, size)))
+
+    def get_sections(self) -> Dict[str, Any]:
+        return {name: self.get_section(name) for name in self._sections}
+
+    def to_model(self, model_type: Type[M], fields: Optional[List[str]] = None) -> M:
+        """
+        Validates a pydantic model from the snapshot sections.
+
+        For SectionedModel types, only the listed fields are loaded with the model, other fields are loaded from
+        their sections on first access. Other model types are always loaded fully.
+
+        :param model_type: pydantic model type.
+        :param fields: names of the model fields to load with the model, None to load all fields.
+        :return: validated model.
+        """
+        if fields is None or not issubclass(model_type, SectionedModel):
+            return model_type.model_validate(self.get_sections())
+        model = model_type.model_validate({name: self.get_section(name) for name in fields if name in self._sections})
+        deferred_fields = [name for name in model_type.model_fields if name not in fields and name in self._sections]
+        model.defer_fields(deferred_fields, self.__get_field_loader(model_type))
+        return model
+
+    def __get_field_loader(self, model_type: Type[M]) -> Callable[[str], Any]:
+        return lambda name: getattr(model_type.model_validate({name: self.get_section(name)}), name)
+
+    def __read_index(self) -> Tuple[int, Dict[str, Tuple[int, int]]]:
+        header = self._read_range(0, _header_read_size)
+        if len(header) < _header_size or header[: len(_magic)] != _magic:
+            raise ValueError("Invalid sectioned snapshot: unknown format")
+        _, version, index_size = struct.unpack_from(_header_format, header)
+        if version != _version:
+            raise ValueError(f"Invalid sectioned snapshot: unsupported version {version}")
+
+        data_offset = _header_size + index_size
+        index_bytes = header[_header_size:data_offset]
+        if len(index_bytes) < index_size:
+            index_bytes = self._read_range(_header_size, index_size)
+        index = json.loads(index_bytes)
+        return data_offset, {s["name"]: (s["offset"], s["size"]) for s in index["sections"]}
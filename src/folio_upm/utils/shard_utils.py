@@ -0,0 +1,65 @@
+import hashlib
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+class ShardUtils:
+
+    @staticmethod
+    def validate(shard_index: int, shard_count: int) -> None:
+        if shard_count < 1:
+            raise ValueError(f"Shard count must be positive: {shard_count}")
+        if shard_index < 0 or shard_index >= shard_count:
+            raise ValueError(f"Shard index must be in range [0, {shard_count - 1}]: {shard_index}")
+
+    @staticmethod
+    def get_shard_index(key: str, shard_count: int) -> int:
+        """
+        Returns shard index for the key, the same key is mapped to the same shard in all processes.
+
+        :param key: value to get shard index for (e.g. user or role id).
+        :param shard_count: total number of shards.
+        :return: shard index in range [0, shard_count).
+        """
+        key_hash = hashlib.sha256(key.encode("utf-8")).digest()
+        return int.from_bytes(key_hash[:8], "big") % shard_count
+
+    @staticmethod
+    def filter_shard(data: Iterable[T], key_func: Callable[[T], str], shard_index: int, shard_count: int) -> List[T]:
+        """
+        Returns values of the data, belonging to the given shard.
+
+        :param data: values to partition.
+        :param key_func: function to get the shard key of a single value.
+        :param shard_index: index of the shard to return values for.
+        :param shard_count: total number of shards.
+        :return: list of shard values in the same order as the provided values.
+        """
+        return list(ShardUtils.iter_shard(data, key_func, shard_index, shard_count))
+
+    @staticmethod
+    def iter_shard(data: Iterable[T], key_func: Callable[[T], str], shard_index: int, shard_count: int) -> Iterator[T]:
+        """
+        Lazily filters values of the data, belonging to the given shard, see filter_shard.
+        """
+        ShardUtils.validate(shard_index, shard_count)
+        for value in data:
+            if shard_count == 1 or ShardUtils.get_shard_index(key_func(value), shard_count) == shard_index:
+                yield value
+
+    @staticmethod
+    def get_shard_file_name(file_name: str, strategy_name: str, shard_index: int, shard_count: int) -> str:
+        """
+        Returns file name for the shard, the shard suffix is placed before the strategy name, so the shard files are
+        not matched by the name prefix of the full (not sharded) file.
+
+        :param file_name: base file name.
+        :param strategy_name: migration strategy name.
+        :param shard_index: shard index.
+        :param shard_count: total number of shards, file name without shard suffix is returned if it's 1.
+        :return: file name with shard and strategy suffixes.
+        """
+        if shard_count == 1:
+            return f"{file_name}-{strategy_name}"
+        return f"{file_name}-shard-{shard_index}-of-{shard_count}-{strategy_name}"
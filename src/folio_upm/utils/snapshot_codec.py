@@ -0,0 +1,221 @@
+import io
+import json
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, List
+
+_magic = b"UPMS"
+_version = 1
+
+_none_kind = b"N"
+_str_kind = b"S"
+_bool_kind = b"B"
+_int_kind = b"I"
+_float_kind = b"F"
+_list_kind = b"L"
+_dict_kind = b"O"
+_json_kind = b"J"
+
+_min_int64 = -(2**63)
+_max_int64 = 2**63 - 1
+
+
+class SnapshotCodec:
+    """
+    Compact binary format for JSON-compatible snapshots (e.g. dumped OkapiLoadResult and EurekaLoadResult).
+
+    Values are stored in columns: a list of objects is stored as one column per object key, a list of lists as
+    a column of lengths and a column of flattened items. Strings (including object keys) are stored once in a
+    string table and referenced by index, decoded strings are interned, so every distinct string is kept in
+    memory once. Values, which cannot be stored in a typed column (mixed types), are stored as JSON strings.
+
+    Layout: magic, version, root column, string table, offset of the string table (uint64).
+    Arrays are length-prefixed (uint64 byte length), numbers are little-endian.
+    """
+
+    @staticmethod
+    def encode(value: Any) -> bytes:
+        """
+        Encodes a JSON-compatible value (dicts with string keys, lists, strings, numbers, booleans and None).
+        """
+        return _SnapshotWriter().write(value)
+
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        """
+        Decodes a value, encoded by the encode() method.
+        """
+        return _SnapshotReader(data).read()
+
+
+class _SnapshotWriter:
+
+    def __init__(self):
+        self._strings: Dict[str, int] = {}
+        self._output = io.BytesIO()
+
+    def write(self, value: Any) -> bytes:
+        self._output.write(_magic + struct.pack("<B", _version))
+        self.__write_column([value])
+        string_table_offset = self._output.tell()
+        self.__write_string_table()
+        self._output.write(struct.pack("<Q", string_table_offset))
+        return self._output.getvalue()
+
+    def __write_column(self, values: List[Any]) -> None:
+        kind = self.__get_kind(values)
+        self._output.write(kind)
+        if kind == _str_kind:
+            self.__write_array("I", [0 if v is None else self.__get_string_ref(v) for v in values])
+        elif kind == _bool_kind:
+            self.__write_bytes(bytes(2 if v is None else int(v) for v in values))
+        elif kind == _int_kind or kind == _float_kind:
+            self.__write_bytes(bytes(v is not None for v in values))
+            self.__write_array("q" if kind == _int_kind else "d", [v for v in values if v is not None])
+        elif kind == _list_kind:
+            self.__write_array("i", [-1 if v is None else len(v) for v in values])
+            self.__write_column([item for v in values if v is not None for item in v])
+        elif kind == _dict_kind:
+            self.__write_dict_column(values)
+        elif kind == _json_kind:
+            self.__write_array("I", [self.__get_string_ref(json.dumps(v)) for v in values])
+
+    def __write_dict_column(self, values: List[Any]) -> None:
+        self.__write_bytes(bytes(v is not None for v in values))
+        dicts = [v for v in values if v is not None]
+        keys = list(dict.fromkeys(key for d in dicts for key in d))
+        self.__write_array("I", [self.__get_string_ref(key) for key in keys])
+        for key in keys:
+            self.__write_bytes(bytes(key in d for d in dicts))
+            self.__write_column([d[key] for d in dicts if key in d])
+
+    def __write_string_table(self) -> None:
+        strings = list(self._strings)
+        self.__write_array("I", [len(s) for s in strings])
+        self.__write_bytes("".join(strings).encode("utf-8"))
+
+    def __write_array(self, type_code: str, values: List[Any]) -> None:
+        values_array = array(type_code, values)
+        if sys.byteorder == "big":
+            values_array.byteswap()
+        self.__write_bytes(values_array.tobytes())
+
+    def __write_bytes(self, data: bytes) -> None:
+        self._output.write(struct.pack("<Q", len(data)))
+        self._output.write(data)
+
+    def __get_string_ref(self, value: str) -> int:
+        ref = self._strings.get(value)
+        if ref is None:
+            ref = len(self._strings) + 1
+            self._strings[value] = ref
+        return ref
+
+    @staticmethod
+    def __get_kind(values: List[Any]) -> bytes:
+        value_types = {type(v) for v in values if v is not None}
+        if not value_types:
+            return _none_kind
+        if len(value_types) > 1:
+            return _json_kind
+        value_type = value_types.pop()
+        if value_type is int:
+            in_range = all(_min_int64 <= v <= _max_int64 for v in values if v is not None)
+            return _int_kind if in_range else _json_kind
+        kinds = {str: _str_kind, bool: _bool_kind, float: _float_kind, list: _list_kind, dict: _dict_kind}
+        return kinds.get(value_type, _json_kind)
+
+
+class _SnapshotReader:
+
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._position = 0
+        self._strings: List[Any] = [None]
+
+    def read(self) -> Any:
+        if bytes(self._data[: len(_magic)]) != _magic:
+            raise ValueError("Invalid snapshot: unknown format")
+        version = self._data[len(_magic)]
+        if version != _version:
+            raise ValueError(f"Invalid snapshot: unsupported version {version}")
+
+        (self._position,) = struct.unpack_from("<Q", self._data, len(self._data) - 8)
+        self.__read_string_table()
+        self._position = len(_magic) + 1
+        return self.__read_column(1)[0]
+
+    def __read_column(self, size: int) -> List[Any]:
+        kind = bytes(self._data[self._position : self._position + 1])
+        self._position += 1
+        if kind == _none_kind:
+            return [None] * size
+        if kind == _str_kind:
+            strings = self._strings
+            return [strings[ref] for ref in self.__read_array("I")]
+        if kind == _bool_kind:
+            return [None if v == 2 else v == 1 for v in self.__read_bytes()]
+        if kind == _int_kind or kind == _float_kind:
+            presence = self.__read_bytes()
+            values = iter(self.__read_array("q" if kind == _int_kind else "d"))
+            return [next(values) if present else None for present in presence]
+        if kind == _list_kind:
+            return self.__read_list_column()
+        if kind == _dict_kind:
+            return self.__read_dict_column()
+        if kind == _json_kind:
+            strings = self._strings
+            return [json.loads(strings[ref]) for ref in self.__read_array("I")]
+        raise ValueError(f"Invalid snapshot: unknown column type {kind!r}")
+
+    def __read_list_column(self) -> List[Any]:
+        lengths = self.__read_array("i")
+        items = self.__read_column(sum(length for length in lengths if length > 0))
+        values = list[Any]()
+        position = 0
+        for length in lengths:
+            if length < 0:
+                values.append(None)
+                continue
+            values.append(items[position : position + length])
+            position += length
+        return values
+
+    def __read_dict_column(self) -> List[Any]:
+        presence = self.__read_bytes()
+        dicts = [dict[str, Any]() for present in presence if present]
+        keys = [self._strings[ref] for ref in self.__read_array("I")]
+        for key in keys:
+            key_presence = self.__read_bytes()
+            key_values = self.__read_column(sum(key_presence))
+            if len(key_values) == len(dicts):
+                for d, value in zip(dicts, key_values):
+                    d[key] = value
+                continue
+            key_values_iter = iter(key_values)
+            for d, present in zip(dicts, key_presence):
+                if present:
+                    d[key] = next(key_values_iter)
+        dicts_iter = iter(dicts)
+        return [next(dicts_iter) if present else None for present in presence]
+
+    def __read_string_table(self) -> None:
+        lengths = self.__read_array("I")
+        text = bytes(self.__read_bytes()).decode("utf-8")
+        offsets = [0, *accumulate(lengths)]
+        self._strings += [sys.intern(text[offsets[i] : offsets[i + 1]]) for i in range(len(lengths))]
+
+    def __read_array(self, type_code: str) -> array:
+        values_array = array(type_code)
+        values_array.frombytes(self.__read_bytes())
+        if sys.byteorder == "big":
+            values_array.byteswap()
+        return values_array
+
+    def __read_bytes(self) -> memoryview:
+        (size,) = struct.unpack_from("<Q", self._data, self._position)
+        start = self._position + 8
+        self._position = start + size
+        return self._data[start : self._position]
@@ -0,0 +1,80 @@
+import heapq
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+class DependencyScheduler:
+    """
+    Runs tasks on a bounded worker pool, a task is started once all of its dependencies are completed.
+
+    Tasks unlocked by completed dependencies are started before other ready tasks, so dependent tasks do not wait
+    for all independent ones. Dependencies on unknown keys are considered as completed.
+    """
+
+    def __init__(self, max_workers: int = 1, on_completed: Optional[Callable[[int, int], None]] = None):
+        self._max_workers = max(max_workers, 1)
+        self._on_completed = on_completed
+        self._tasks: Dict[Hashable, Callable[[], Any]] = {}
+        self._dependencies: Dict[Hashable, Set[Hashable]] = {}
+
+    def add_task(self, key: Hashable, func: Callable[[], Any], dependencies: Iterable[Hashable] = ()) -> None:
+        """
+        Adds a task to the scheduler.
+
+        :param key: unique task key.
+        :param func: task function.
+        :param dependencies: keys of tasks, that must be completed before the task is started.
+        """
+        if key in self._tasks:
+            raise ValueError(f"Task is already added: {key}")
+        self._tasks[key] = func
+        self._dependencies[key] = set(dependencies)
+
+    def run(self) -> Dict[Hashable, Any]:
+        """
+        Runs all added tasks.
+
+        :return: dictionary with task key as key and task result as value.
+        """
+        total_tasks = len(self._tasks)
+        dependents, pending_dependencies = self.__build_dependency_graph()
+        ready_tasks = list[Tuple[int, int, Hashable]]()
+        task_order = {key: i for i, key in enumerate(self._tasks)}
+        for key, task_dependencies in pending_dependencies.items():
+            if not task_dependencies:
+                heapq.heappush(ready_tasks, (0, task_order[key], key))
+
+        results = dict[Hashable, Any]()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            running_tasks = dict[Future, Tuple[Hashable, int]]()
+            while ready_tasks or running_tasks:
+                while ready_tasks and len(running_tasks) < self._max_workers:
+                    priority, _, key = heapq.heappop(ready_tasks)
+                    running_tasks[executor.submit(self._tasks[key])] = (key, priority)
+
+                completed_futures, _ = wait(running_tasks, return_when=FIRST_COMPLETED)
+                for future in completed_futures:
+                    key, priority = running_tasks.pop(future)
+                    results[key] = future.result()
+                    for dependent_key in dependents.get(key, []):
+                        dependent_pending_dependencies = pending_dependencies[dependent_key]
+                        dependent_pending_dependencies.discard(key)
+                        if not dependent_pending_dependencies:
+                            heapq.heappush(ready_tasks, (priority - 1, task_order[dependent_key], dependent_key))
+                    if self._on_completed is not None:
+                        self._on_completed(len(results), total_tasks)
+
+        if len(results) != total_tasks:
+            unresolved_tasks = [key for key in self._tasks if key not in results]
+            raise ValueError(f"Tasks with cyclic dependencies cannot be scheduled: {unresolved_tasks}")
+        return results
+
+    def __build_dependency_graph(self) -> Tuple[Dict[Hashable, List[Hashable]], Dict[Hashable, Set[Hashable]]]:
+        dependents = dict[Hashable, List[Hashable]]()
+        pending_dependencies = dict[Hashable, Set[Hashable]]()
+        for key, task_dependencies in self._dependencies.items():
+            known_dependencies = {dependency for dependency in task_dependencies if dependency in self._tasks}
+            pending_dependencies[key] = known_dependencies
+            for dependency in known_dependencies:
+                dependents.setdefault(dependency, []).append(key)
+        return dependents, pending_dependencies
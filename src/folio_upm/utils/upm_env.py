@@ -20,6 +20,8 @@ def load_dotenv():
 
 class Env(metaclass=SingletonMeta):
 
+    snapshot_formats = ["json.gz", "bin.gz", "sections.bin"]
+
     def __init__(self):
         self._log = log_factory.get_logger(self.__class__.__name__)
         self._log.debug("Env class initialized.")
@@ -49,6 +51,9 @@ class Env(metaclass=SingletonMeta):
             return default_timeout
         return int(request_timeout)
 
+    def get_http_pool_size(self) -> int:
+        return self.get_int_cached("HTTP_POOL_SIZE", default_value=20)
+
     def get_bool_cached(self, env_variable_name: str, default_value: bool = False) -> bool:
         str_var = self.getenv_cached(env_variable_name, str(default_value))
         if str_var is None:
@@ -57,6 +62,22 @@ class Env(metaclass=SingletonMeta):
 
         return Utils.parse_bool(str_var, default_value)
 
+    def get_int_cached(self, env_variable_name: str, default_value: int) -> int:
+        str_var = self.getenv_cached(env_variable_name, str(default_value))
+        parsed_value = Utils.safe_cast(str_var, int)
+        if parsed_value is None:
+            self._log.warning("%s is not a valid integer, using default value: %s", env_variable_name, default_value)
+            return default_value
+        return parsed_value
+
+    def get_float_cached(self, env_variable_name: str, default_value: float) -> float:
+        str_var = self.getenv_cached(env_variable_name, str(default_value))
+        parsed_value = Utils.safe_cast(str_var, float)
+        if parsed_value is None:
+            self._log.warning("%s is not a valid number, using default value: %s", env_variable_name, default_value)
+            return default_value
+        return parsed_value
+
     def get_migration_strategy(self) -> EurekaLoadStrategy:
         resolved_strategy_name = self.getenv_cached("EUREKA_ROLE_LOAD_STRATEGY", default_value="distributed")
         eureka_load_strategy = EurekaLoadStrategy.from_string(resolved_strategy_name)
@@ -79,6 +100,12 @@ class Env(metaclass=SingletonMeta):
             raise ValueError(f"Invalid storages: '{parsed_storages}'. Allowed values are: {allowed_values}'.")
         return list(parsed_storages)
 
+    def get_snapshot_format(self) -> str:
+        snapshot_format = self.getenv_cached("SNAPSHOT_FORMAT", default_value="json.gz")
+        if snapshot_format not in self.snapshot_formats:
+            raise ValueError(f"Invalid snapshot format: '{snapshot_format}'. Allowed values: {self.snapshot_formats}.")
+        return snapshot_format
+
     @cache  # noqa: B019
     def getenv_cached(self, env_variable_name, default_value: str | None = None, log_result=True) -> Optional[str]:
         return self.getenv(env_variable_name, default_value, log_result)
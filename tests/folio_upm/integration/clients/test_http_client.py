@@ -0,0 +1,71 @@
+import io
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from folio_upm.integration.clients.base.http_client import HttpClient
+from folio_upm.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+
+
+class TestHttpClient:
+
+    def test_request_is_retried_once_with_new_token_on_401(self, test_tenant_env):
+        tokens = iter(["token-1", "token-2"])
+        invalidate_auth_func = Mock()
+        client = HttpClient("http://localhost", lambda: next(tokens), 10, invalidate_auth_func)
+        responses = [self.__response(401), self.__response(200, b'{"value": 1}')]
+
+        with patch.object(requests.Session, "request", side_effect=responses) as request:
+            assert client.get_json("/test") == {"value": 1}
+
+        invalidate_auth_func.assert_called_once_with("token-1")
+        sent_tokens = [call.kwargs["headers"]["x-okapi-token"] for call in request.call_args_list]
+        assert sent_tokens == ["token-1", "token-2"]
+
+    def test_request_fails_if_new_token_is_rejected(self, test_tenant_env):
+        invalidate_auth_func = Mock()
+        client = HttpClient("http://localhost", lambda: "token", 10, invalidate_auth_func)
+        responses = [self.__response(401), self.__response(401)]
+
+        with patch.object(requests.Session, "request", side_effect=responses) as request:
+            with pytest.raises(requests.HTTPError) as e:
+                client.get_json("/test")
+            assert e.value.response.status_code == 401
+
+        assert request.call_count == 2
+        invalidate_auth_func.assert_called_once_with("token")
+
+    def test_bound_limiter_observes_overload_before_retry(self, test_tenant_env):
+        client = HttpClient("http://localhost", lambda: "token", 10)
+        limiter = AdaptiveConcurrencyLimiter("test", max_limit=4)
+        limiter.release = Mock(wraps=limiter.release)
+        overload_response = self.__response(503, headers={"Retry-After": "0"})
+        responses = [overload_response, self.__response(200, b'{"id": "1"}')]
+
+        with patch.object(requests.Session, "request", side_effect=responses) as request, limiter.bind():
+            assert client.post_json("/test", {"name": "test"}) == {"id": "1"}
+
+        assert request.call_count == 2
+        overload_signals = [call.args[1] for call in limiter.release.call_args_list]
+        assert overload_signals == [True, False]
+
+    def test_bound_limiter_reports_timeouts(self, test_tenant_env):
+        client = HttpClient("http://localhost", lambda: "token", 10)
+        limiter = AdaptiveConcurrencyLimiter("test", max_limit=4)
+        limiter.release = Mock(wraps=limiter.release)
+
+        with patch.object(requests.Session, "request", side_effect=requests.ReadTimeout()), limiter.bind():
+            with pytest.raises(requests.ReadTimeout):
+                client.post_json("/test", {"name": "test"})
+
+        limiter.release.assert_called_once()
+        assert limiter.release.call_args.args[1] is True
+
+    @staticmethod
+    def __response(status_code: int, content: bytes = b"", headers: dict | None = None):
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        response.raw = io.BytesIO(content)
+        return response
@@ -0,0 +1,50 @@
+import requests
+
+from folio_upm.integration.clients.base.retry_policy import RetryPolicy
+
+
+class TestRetryPolicy:
+
+    def test_idempotent_request_is_retried_on_gateway_errors(self):
+        policy = RetryPolicy(max_retries=3)
+        for status in [429, 502, 503, 504]:
+            assert policy.should_retry_response("GET", self.__response(status), 0)
+            assert policy.should_retry_response("PUT", self.__response(status), 0)
+            assert policy.should_retry_response("DELETE", self.__response(status), 0)
+
+    def test_post_request_is_retried_only_if_not_processed(self):
+        policy = RetryPolicy(max_retries=3)
+        assert policy.should_retry_response("POST", self.__response(429), 0)
+        assert policy.should_retry_response("POST", self.__response(503), 0)
+        assert not policy.should_retry_response("POST", self.__response(502), 0)
+        assert not policy.should_retry_response("POST", self.__response(504), 0)
+        assert policy.should_retry_error("POST", requests.ConnectTimeout(), 0)
+        assert not policy.should_retry_error("POST", requests.ReadTimeout(), 0)
+
+    def test_client_errors_are_not_retried(self):
+        policy = RetryPolicy(max_retries=3)
+        for status in [400, 401, 404, 409, 414]:
+            assert not policy.should_retry_response("GET", self.__response(status), 0)
+
+    def test_retries_are_limited(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry_response("GET", self.__response(502), 1)
+        assert not policy.should_retry_response("GET", self.__response(502), 2)
+        assert not policy.should_retry_error("GET", requests.ConnectionError(), 2)
+
+    def test_delay_uses_retry_after_header(self):
+        policy = RetryPolicy(max_delay=10)
+        assert policy.get_delay(0, self.__response(429, {"Retry-After": "3"})) == 3.0
+        assert policy.get_delay(0, self.__response(429, {"Retry-After": "120"})) == 10.0
+
+    def test_delay_uses_exponential_backoff(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_delay=3)
+        assert all(0 <= policy.get_delay(1) <= 1.0 for _ in range(100))
+        assert all(0 <= policy.get_delay(10) <= 3.0 for _ in range(100))
+
+    @staticmethod
+    def __response(status_code: int, headers=None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        return response
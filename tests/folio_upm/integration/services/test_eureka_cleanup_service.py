@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+import pytest
+
+from folio_upm.integration.services.eureka_cleanup_service import EurekaCleanupService
+from folio_upm.model.cleanup.hash_role_cleanup_record import HashRoleCleanupRecord
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.eureka.role import Role
+from folio_upm.model.report.http_request_result import HttpRequestResult
+
+
+class TestEurekaCleanupService:
+
+    _module = "folio_upm.integration.services.eureka_cleanup_service"
+
+    @pytest.fixture(autouse=True)
+    def cleanup_env(self, monkeypatch):
+        monkeypatch.setenv("TENANT_ID", "test_tenant")
+        monkeypatch.setenv("CLEANUP_BATCH_SIZE", "2")
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_perform_cleanup_consumes_records_in_batches(self):
+        consumed_role_ids = list[str]()
+
+        def cleanup_records():
+            for i in range(5):
+                consumed_role_ids.append(f"role-{i}")
+                yield self.__cleanup_record(f"role-{i}", capabilities=["c1"] if i % 2 else [])
+
+        def update_role_capabilities(records, _):
+            assert len(consumed_role_ids) <= 2 * len(batches) + 2
+            batches.append([r.role.id for r in records])
+            return [HttpRequestResult(status="success", srcEntityId=r.role.id) for r in records]
+
+        batches = list[list[str]]()
+        with (
+            patch(f"{self._module}.RoleCapabilityFacade") as facade,
+            patch(f"{self._module}.RoleService") as role_service,
+        ):
+            facade.return_value.update_role_capabilities_in_context.side_effect = update_role_capabilities
+            role_service.return_value.delete_roles.side_effect = lambda records: [
+                HttpRequestResult(status="success", srcEntityId=r.role.id) for r in records if not r.capabilities
+            ]
+            report = EurekaCleanupService(cleanup_records()).perform_cleanup()
+
+            facade.return_value.create_update_context.assert_called_once_with(None)
+
+        assert batches == [["role-0", "role-1"], ["role-2", "role-3"], ["role-4"]]
+        assert [r.srcEntityId for r in report.roleCapabilities] == [f"role-{i}" for i in range(5)]
+        assert [r.srcEntityId for r in report.roles] == ["role-0", "role-2", "role-4"]
+
+    @staticmethod
+    def __cleanup_record(role_id, capabilities):
+        role = Role(id=role_id, name=f"{role_id}-name")
+        return HashRoleCleanupRecord(role=role, capabilities=capabilities, capabilitySets=[])
@@ -0,0 +1,159 @@
+import random
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from folio_upm.integration.services.eureka_migration_service import EurekaMigrationService
+from folio_upm.model.analysis.analyzed_role import AnalyzedRole
+from folio_upm.model.analysis.analyzed_role_capabilities import AnalyzedRoleCapabilities
+from folio_upm.model.analysis.analyzed_user_roles import AnalyzedUserRoles
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.eureka.role import Role
+from folio_upm.model.report.http_request_result import HttpRequestResult
+from folio_upm.model.result.eureka_migration_data import EurekaMigrationData
+from folio_upm.utils.ordered_set import OrderedSet
+
+
+class TestEurekaMigrationService:
+
+    _module = "folio_upm.integration.services.eureka_migration_service"
+
+    @pytest.fixture(autouse=True)
+    def migration_env(self, monkeypatch):
+        monkeypatch.setenv("TENANT_ID", "test_tenant")
+        monkeypatch.setenv("MIGRATION_PRE_DIFF_ENABLED", "false")
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_migrate_to_eureka_skips_journaled_entries(self):
+        completed_results = {
+            "roles": {"role1": [self.__result("role1")]},
+            "roleCapabilities": {"role1": [self.__result("role1-capabilities")]},
+            "roleUsers": {"user1": [self.__result("user1")]},
+        }
+        journal = MagicMock()
+        journal.get_completed_results.side_effect = lambda stage: completed_results[stage]
+
+        with (
+            patch(f"{self._module}.RoleService") as role_service,
+            patch(f"{self._module}.RoleCapabilityFacade") as facade,
+            patch(f"{self._module}.RoleUsersService") as role_users_service,
+        ):
+            role_service.return_value.find_existing_role_names.return_value = set()
+            role_service.return_value.create_role.side_effect = lambda ar, _: self.__result(f"roles:{ar.role.name}")
+            facade.return_value.assign_role.side_effect = lambda arc, _: [self.__result(f"rc:{arc.roleName}")]
+            role_users_service.return_value.assign_user.side_effect = lambda aur, _: [self.__result(f"ur:{aur.userId}")]
+            role_users_service.group_role_ids_by_user.return_value = {}
+
+            eureka_data = EurekaMigrationData(
+                roles=[self.__analyzed_role("role1"), self.__analyzed_role("role2")],
+                roleCapabilities=[self.__arc("role1"), self.__arc("role2")],
+                userRoles=[AnalyzedUserRoles(userId="user1"), AnalyzedUserRoles(userId="user2")],
+            )
+            report = EurekaMigrationService().migrate_to_eureka(eureka_data, journal=journal)
+
+        assert [r.srcEntityId for r in report.roles] == ["role1", "roles:role2"]
+        assert [r.srcEntityId for r in report.roleCapabilities] == ["role1-capabilities", "rc:role2"]
+        assert [r.srcEntityId for r in report.roleUsers] == ["user1", "ur:user2"]
+        recorded_entries = sorted((c.args[0], c.args[1]) for c in journal.record.call_args_list)
+        assert recorded_entries == [("roleCapabilities", "role2"), ("roleUsers", "user2"), ("roles", "role2")]
+        journal.flush.assert_called_once()
+
+    def test_migrate_to_eureka_runs_dependent_tasks_after_role_creation(self, monkeypatch):
+        monkeypatch.setenv("MIGRATION_CONCURRENCY", "4")
+        events = list[str]()
+        lock = threading.Lock()
+
+        def track(event, result):
+            time.sleep(random.uniform(0, 0.005))
+            with lock:
+                events.append(event)
+            return result
+
+        with (
+            patch(f"{self._module}.RoleService") as role_service,
+            patch(f"{self._module}.RoleCapabilityFacade") as facade,
+            patch(f"{self._module}.RoleUsersService") as role_users_service,
+        ):
+            role_service.return_value.find_existing_role_names.return_value = set()
+            role_service.return_value.create_role.side_effect = lambda ar, _: track(
+                f"role:{ar.role.name}", self.__result(ar.role.name)
+            )
+            facade.return_value.assign_role.side_effect = lambda arc, _: track(f"rc:{arc.roleName}", [])
+            role_users_service.return_value.assign_user.side_effect = lambda aur, _: track(f"ur:{aur.userId}", [])
+            role_users_service.group_role_ids_by_user.return_value = {}
+
+            role_names = [f"role{i}" for i in range(10)]
+            eureka_data = EurekaMigrationData(
+                roles=[self.__analyzed_role(name) for name in role_names],
+                roleCapabilities=[self.__arc(name) for name in role_names],
+                userRoles=[AnalyzedUserRoles(userId="user1", roleNames=["role1", "role8"])],
+            )
+            report = EurekaMigrationService().migrate_to_eureka(eureka_data, journal=self.__empty_journal())
+
+        assert [r.srcEntityId for r in report.roles] == role_names
+        for role_name in role_names:
+            assert events.index(f"rc:{role_name}") > events.index(f"role:{role_name}")
+        assert events.index("ur:user1") > max(events.index("role:role1"), events.index("role:role8"))
+
+    def test_migrate_to_eureka_assigns_users_of_external_roles_after_shard_roles(self, monkeypatch):
+        monkeypatch.setenv("MIGRATION_CONCURRENCY", "4")
+        events = list[str]()
+        lock = threading.Lock()
+
+        def track(event, result):
+            time.sleep(random.uniform(0, 0.005))
+            with lock:
+                events.append(event)
+            return result
+
+        with (
+            patch(f"{self._module}.RoleService") as role_service,
+            patch(f"{self._module}.RoleCapabilityFacade") as facade,
+            patch(f"{self._module}.RoleUsersService") as role_users_service,
+        ):
+            role_service.return_value.find_existing_role_names.return_value = set()
+            role_service.return_value.create_role.side_effect = lambda ar, _: track(
+                f"role:{ar.role.name}", self.__result(ar.role.name)
+            )
+            facade.return_value.assign_role.return_value = []
+            role_users_service.return_value.assign_user.side_effect = lambda aur, _: track(f"ur:{aur.userId}", [])
+            role_users_service.group_role_ids_by_user.return_value = {}
+
+            role_names = [f"role{i}" for i in range(10)]
+            eureka_data = EurekaMigrationData(
+                roles=[self.__analyzed_role(name) for name in role_names],
+                roleCapabilities=[],
+                userRoles=[
+                    AnalyzedUserRoles(userId="user1", roleNames=["role1", "external1"]),
+                    AnalyzedUserRoles(userId="user2", roleNames=["external2"]),
+                ],
+            )
+            EurekaMigrationService().migrate_to_eureka(
+                eureka_data, journal=self.__empty_journal(), external_role_names={"external1", "external2"}
+            )
+
+        last_role_index = max(events.index(f"role:{role_name}") for role_name in role_names)
+        assert events.index("ur:user1") > last_role_index
+        assert events.index("ur:user2") > last_role_index
+
+    @staticmethod
+    def __empty_journal():
+        journal = MagicMock()
+        journal.get_completed_results.return_value = {}
+        return journal
+
+    @staticmethod
+    def __analyzed_role(role_name):
+        return AnalyzedRole(role=Role(name=role_name), permissionSets=[], source="test", users=OrderedSet[str]())
+
+    @staticmethod
+    def __arc(role_name):
+        return AnalyzedRoleCapabilities(roleName=role_name, capabilities=[])
+
+    @staticmethod
+    def __result(entity_id):
+        return HttpRequestResult(status="success", srcEntityId=entity_id)
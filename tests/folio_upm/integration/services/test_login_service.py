@@ -0,0 +1,79 @@
+import threading
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from folio_upm.integration.services.login_service import LoginService
+from folio_upm.model.cls_support import SingletonMeta
+
+
+class TestLoginService:
+
+    _login_client = "folio_upm.integration.services.login_service.LoginClient"
+
+    @pytest.fixture(autouse=True)
+    def login_env(self, monkeypatch):
+        monkeypatch.setenv("TENANT_ID", "test_tenant")
+        monkeypatch.setenv("OKAPI_URL", "http://okapi:9130")
+        monkeypatch.setenv("OKAPI_ADMIN_USERNAME", "admin")
+        monkeypatch.setenv("OKAPI_ADMIN_PASSWORD", "admin")
+        SingletonMeta._instances.pop(LoginService, None)
+        yield
+        SingletonMeta._instances.pop(LoginService, None)
+
+    def test_get_okapi_token_cached_until_expiration(self):
+        with patch(self._login_client) as mocked_client:
+            token = self.__token(exp=time.time() + 600)
+            mocked_client.return_value.login_as_admin.return_value = token
+            login_service = LoginService()
+
+            assert login_service.get_okapi_token() == token
+            assert login_service.get_okapi_token() == token
+            assert mocked_client.return_value.login_as_admin.call_count == 1
+
+    def test_get_okapi_token_refreshed_before_expiration(self):
+        with patch(self._login_client) as mocked_client:
+            tokens = [self.__token(exp=time.time() + 10, sub="1"), self.__token(exp=time.time() + 600, sub="2")]
+            mocked_client.return_value.login_as_admin.side_effect = tokens
+            login_service = LoginService()
+
+            assert login_service.get_okapi_token() == tokens[0]
+            assert login_service.get_okapi_token() == tokens[0]
+            with patch("folio_upm.integration.services.login_service.time.time", return_value=time.time() + 6):
+                assert login_service.get_okapi_token() == tokens[1]
+
+    def test_get_okapi_token_single_flight(self):
+        with patch(self._login_client) as mocked_client:
+            token = self.__token(exp=time.time() + 600)
+
+            def login(*args):
+                time.sleep(0.05)
+                return token
+
+            mocked_client.return_value.login_as_admin.side_effect = login
+            login_service = LoginService()
+            threads = [threading.Thread(target=login_service.get_okapi_token) for _ in range(10)]
+            [thread.start() for thread in threads]
+            [thread.join() for thread in threads]
+
+            assert mocked_client.return_value.login_as_admin.call_count == 1
+
+    def test_invalidate_okapi_token(self):
+        with patch(self._login_client) as mocked_client:
+            tokens = [self.__token(exp=time.time() + 600, sub="1"), self.__token(exp=time.time() + 600, sub="2")]
+            mocked_client.return_value.login_as_admin.side_effect = tokens
+            login_service = LoginService()
+
+            assert login_service.get_okapi_token() == tokens[0]
+            login_service.invalidate_okapi_token(tokens[0])
+            assert login_service.get_okapi_token() == tokens[1]
+            login_service.invalidate_okapi_token(tokens[0])
+            assert login_service.get_okapi_token() == tokens[1]
+
+    @staticmethod
+    def __token(exp: float, sub: str = "admin"):
+        return jwt.encode(
+            {"sub": sub, "exp": int(exp)}, key="test-secret-key-with-sufficient-length", algorithm="HS256"
+        )
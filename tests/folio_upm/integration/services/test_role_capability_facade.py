@@ -0,0 +1,187 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from folio_upm.integration.services.role_capability_facade import RoleCapabilityFacade
+from folio_upm.model.analysis.analyzed_capability import AnalyzedCapability
+from folio_upm.model.analysis.analyzed_role_capabilities import AnalyzedRoleCapabilities
+from folio_upm.model.cleanup.hash_role_cleanup_record import HashRoleCleanupRecord
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.eureka.capability import Capability
+from folio_upm.model.eureka.capability_set import CapabilitySet
+from folio_upm.model.eureka.role import Role
+from folio_upm.model.eureka.role_capability import RoleCapability
+from folio_upm.model.eureka.role_capability_set import RoleCapabilitySet
+from folio_upm.model.load.eureka_load_result import EurekaLoadResult
+
+
+class TestRoleCapabilityFacade:
+
+    _module = "folio_upm.integration.services.role_capability_facade"
+    _role = Role(id="role-id", name="test-role")
+
+    @pytest.fixture(autouse=True)
+    def clear_services(self):
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_assign_role_resolves_from_eureka_load_result(self):
+        eureka_load_result = EurekaLoadResult(
+            capabilities=[self.__capability("c1", "perm.c1"), self.__capability("c2", "perm.c2")],
+            capabilitySets=[self.__capability_set("cs1", "perm.cs1")],
+        )
+
+        with (
+            patch(f"{self._module}.RoleService") as role_service,
+            patch(f"{self._module}.RoleCapabilityService") as rc_service,
+            patch(f"{self._module}.RoleCapabilitySetService") as rcs_service,
+        ):
+            role_service.return_value.find_role_by_name.return_value = self._role
+            rc_service.return_value.find_by_field.return_value = []
+            rcs_service.return_value.find_by_field.return_value = []
+            rc_service.return_value.assign_to_role.return_value = []
+            rcs_service.return_value.assign_to_role.return_value = []
+
+            arc = self.__analyzed_role_capabilities(["perm.c1", "perm.cs1", "perm.c2", "perm.unknown"])
+            facade = RoleCapabilityFacade()
+            facade.assign_role(arc, facade.create_context(eureka_load_result))
+
+            rcs_service.return_value.find_by_field.assert_called_once()
+            assert rcs_service.return_value.find_by_field.call_args.args == ("permission", ["perm.unknown"])
+            assert rc_service.return_value.find_by_field.call_args.args == ("permission", ["perm.unknown"])
+            assigned_capabilities = rc_service.return_value.assign_to_role.call_args.args[1]
+            assigned_capability_sets = rcs_service.return_value.assign_to_role.call_args.args[1]
+            assert [c.id for c in assigned_capabilities] == ["c1", "c2"]
+            assert [cs.id for cs in assigned_capability_sets] == ["cs1"]
+            rc_service.return_value.find_all.assert_not_called()
+
+    def test_assign_role_loads_capability_index(self):
+        with (
+            patch(f"{self._module}.RoleService") as role_service,
+            patch(f"{self._module}.RoleCapabilityService") as rc_service,
+            patch(f"{self._module}.RoleCapabilitySetService") as rcs_service,
+        ):
+            role_service.return_value.find_role_by_name.return_value = self._role
+            rc_service.return_value.find_all.return_value = [self.__capability("c1", "perm.c1")]
+            rcs_service.return_value.find_all.return_value = [self.__capability_set("cs1", "perm.cs1")]
+            rc_service.return_value.assign_to_role.return_value = []
+            rcs_service.return_value.assign_to_role.return_value = []
+
+            arcs = [self.__analyzed_role_capabilities(["perm.c1", "perm.cs1"]) for _ in range(3)]
+            facade = RoleCapabilityFacade()
+            context = facade.create_context()
+            for arc in arcs:
+                facade.assign_role(arc, context)
+
+            rc_service.return_value.find_all.assert_called_once()
+            rcs_service.return_value.find_all.assert_called_once()
+            rc_service.return_value.find_by_field.assert_not_called()
+            rcs_service.return_value.find_by_field.assert_not_called()
+            assert rc_service.return_value.assign_to_role.call_count == 3
+
+    def test_assign_role_passes_existing_relations(self):
+        existing_relations = EurekaLoadResult(
+            roleCapabilities=[RoleCapability(roleId="role-id", capabilityId="c1")],
+            roleCapabilitySets=[RoleCapabilitySet(roleId="other-role-id", capabilitySetId="cs1")],
+        )
+
+        with (
+            patch(f"{self._module}.RoleService") as role_service,
+            patch(f"{self._module}.RoleCapabilityService") as rc_service,
+            patch(f"{self._module}.RoleCapabilitySetService") as rcs_service,
+        ):
+            role_service.return_value.find_role_by_name.return_value = self._role
+            rc_service.return_value.find_all.return_value = [self.__capability("c1", "perm.c1")]
+            rcs_service.return_value.find_all.return_value = [self.__capability_set("cs1", "perm.cs1")]
+            rc_service.return_value.get_target_entity_id.side_effect = lambda rc: rc.capabilityId
+            rcs_service.return_value.get_target_entity_id.side_effect = lambda rcs: rcs.capabilitySetId
+            rc_service.return_value.assign_to_role.return_value = []
+            rcs_service.return_value.assign_to_role.return_value = []
+
+            arc = self.__analyzed_role_capabilities(["perm.c1", "perm.cs1"])
+            facade = RoleCapabilityFacade()
+            facade.assign_role(arc, facade.create_context(existing_relations=existing_relations))
+
+            assert rc_service.return_value.assign_to_role.call_args.args[2] == {"c1"}
+            assert rcs_service.return_value.assign_to_role.call_args.args[2] is None
+
+    def test_update_role_capabilities_skips_unchanged_relations(self):
+        current_relations = EurekaLoadResult(
+            roleCapabilities=[RoleCapability(roleId="role-1", capabilityId="c1")],
+            roleCapabilitySets=[RoleCapabilitySet(roleId="role-1", capabilitySetId="cs1")],
+        )
+        records = [
+            self.__cleanup_record("role-1", capabilities=["c1"], capability_sets=[]),
+            self.__cleanup_record("role-2", capabilities=[], capability_sets=[]),
+        ]
+
+        with (
+            patch("folio_upm.integration.services.role_capability_service.RoleCapabilitiesClient") as rc_client,
+            patch("folio_upm.integration.services.role_capability_set_service.RoleCapabilitySetClient") as rcs_client,
+            patch("folio_upm.integration.services.role_capability_service.CapabilityClient"),
+            patch("folio_upm.integration.services.role_capability_set_service.CapabilitySetClient"),
+            patch("folio_upm.integration.services.role_entity_service.EurekaClient"),
+            patch(f"{self._module}.RoleService"),
+        ):
+            rc_client.return_value.get_target_entity_id.side_effect = lambda rc: rc.capabilityId
+            rcs_client.return_value.get_target_entity_id.side_effect = lambda rcs: rcs.capabilitySetId
+            result = RoleCapabilityFacade().update_role_capabilities(records, current_relations)
+
+            rc_client.return_value.update_role_entity.assert_not_called()
+            rcs_client.return_value.update_role_entity.assert_called_once_with("role-1", [])
+
+        assert [(r.srcEntityId, r.tarEntityName, r.status) for r in result] == [
+            ("role-1", "capability-set", "success"),
+            ("role-1", "capability", "skipped"),
+            ("role-2", "capability-set", "skipped"),
+            ("role-2", "capability", "skipped"),
+        ]
+
+    def test_update_role_capabilities_concurrently(self, monkeypatch):
+        monkeypatch.setenv("CLEANUP_CONCURRENCY", "4")
+        events = list[str]()
+        lock = threading.Lock()
+
+        def update(entity_name, role, entity_ids, assigned_entity_ids):
+            time.sleep(0.002)
+            with lock:
+                events.append(f"{entity_name}:{role.id}")
+            return []
+
+        with (
+            patch(f"{self._module}.RoleService"),
+            patch(f"{self._module}.RoleCapabilityService") as rc_service,
+            patch(f"{self._module}.RoleCapabilitySetService") as rcs_service,
+        ):
+            rc_service.return_value.update.side_effect = lambda *args: update("rc", *args)
+            rcs_service.return_value.update.side_effect = lambda *args: update("rcs", *args)
+            records = [self.__cleanup_record(f"role-{i}", ["c1"], ["cs1"]) for i in range(10)]
+            RoleCapabilityFacade().update_role_capabilities(records)
+
+            assert rc_service.return_value.update.call_args.args[2] is None
+
+        for i in range(10):
+            assert events.index(f"rcs:role-{i}") < events.index(f"rc:role-{i}")
+
+    @staticmethod
+    def __cleanup_record(role_id, capabilities, capability_sets):
+        role = Role(id=role_id, name=f"{role_id}-name")
+        return HashRoleCleanupRecord(role=role, capabilities=capabilities, capabilitySets=capability_sets)
+
+    @staticmethod
+    def __analyzed_role_capabilities(permission_names):
+        capabilities = [AnalyzedCapability(resolvedType="capability", permissionName=p) for p in permission_names]
+        return AnalyzedRoleCapabilities(roleName="test-role", capabilities=capabilities)
+
+    @staticmethod
+    def __capability(capability_id: str, permission: str):
+        return Capability(id=capability_id, name=capability_id, resource="r", action="view", permission=permission)
+
+    @staticmethod
+    def __capability_set(capability_set_id: str, permission: str):
+        return CapabilitySet(
+            id=capability_set_id, name=capability_set_id, resource="r", action="view", permission=permission
+        )
@@ -0,0 +1,128 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from folio_upm.integration.services.role_service import RoleService
+from folio_upm.model.analysis.analyzed_role import AnalyzedRole
+from folio_upm.model.cleanup.hash_role_cleanup_record import HashRoleCleanupRecord
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.eureka.role import Role
+from folio_upm.utils.ordered_set import OrderedSet
+
+
+class TestRoleService:
+
+    _roles_client = "folio_upm.integration.services.role_service.RolesClient"
+    _eureka_client = "folio_upm.integration.services.role_service.EurekaClient"
+
+    @pytest.fixture(autouse=True)
+    def role_creation_env(self, monkeypatch):
+        monkeypatch.setenv("TENANT_ID", "test_tenant")
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_create_role(self):
+        def create_role(role: Role):
+            if role.name == "role-5":
+                response = requests.Response()
+                response.status_code = 409
+                raise requests.HTTPError("409 Conflict", response=response)
+            return Role(id=f"{role.name}-id", name=role.name)
+
+        with patch(self._roles_client) as mocked_client, patch(self._eureka_client):
+            mocked_client.return_value.find_by_query.return_value = [Role(id="role-2-id", name="role-2")]
+            mocked_client.return_value.create_role.side_effect = create_role
+            analyzed_roles = [self.__analyzed_role(f"role-{i}") for i in range(10)]
+            role_service = RoleService()
+            existing_role_names = role_service.find_existing_role_names(analyzed_roles)
+            result = [role_service.create_role(ar, existing_role_names) for ar in analyzed_roles]
+
+        assert [r.srcEntityDisplayName for r in result] == [f"role-{i}" for i in range(10)]
+        assert result[2].status == "skipped" and result[2].reason == "already exists"
+        assert result[5].status == "skipped" and result[5].error.status == 409
+        assert all(r.status == "success" for i, r in enumerate(result) if i not in (2, 5))
+        assert mocked_client.return_value.create_role.call_count == 9
+
+    def test_delete_roles_concurrently(self, monkeypatch):
+        monkeypatch.setenv("CLEANUP_CONCURRENCY", "4")
+        active_requests = 0
+        max_active_requests = 0
+        lock = threading.Lock()
+
+        def delete_role(role_id: str):
+            nonlocal active_requests, max_active_requests
+            with lock:
+                active_requests += 1
+                max_active_requests = max(max_active_requests, active_requests)
+            time.sleep(0.01)
+            with lock:
+                active_requests -= 1
+
+        records = [self.__cleanup_record(f"role-{i}", capabilities=[] if i % 2 == 0 else ["c1"]) for i in range(16)]
+        with patch(self._roles_client) as mocked_client, patch(self._eureka_client):
+            mocked_client.return_value.delete_role.side_effect = delete_role
+            result = RoleService().delete_roles(records)
+
+        assert [r.srcEntityId for r in result] == [f"role-{i}" for i in range(0, 16, 2)]
+        assert all(r.status == "success" for r in result)
+        assert 1 < max_active_requests <= 4
+
+    def test_find_roles_by_names_from_index(self):
+        indexed_roles = [{"id": "role-1-id", "name": "role-1"}, {"id": "role-2-id", "name": "role-2"}]
+        with patch(self._roles_client) as mocked_client, patch(self._eureka_client) as mocked_eureka_client:
+            mocked_eureka_client.return_value.load_counted_page_by_query.return_value = (indexed_roles, 2)
+            mocked_eureka_client.return_value.load_page_by_query.return_value = indexed_roles
+            mocked_client.return_value.find_by_query.return_value = [Role(id="role-3-id", name="role-3")]
+            role_service = RoleService()
+            role_service.load_roles_index()
+
+            assert role_service.find_role_by_name("role-2") == Role(id="role-2-id", name="role-2")
+            assert mocked_client.return_value.find_by_query.call_count == 0
+
+            found_roles = role_service.find_roles_by_names(["role-3", "role-1"])
+            assert [r.id for r in found_roles] == ["role-3-id", "role-1-id"]
+            mocked_client.return_value.find_by_query.assert_called_once_with('name==("role-3")')
+
+            assert role_service.find_role_by_name("role-3") == Role(id="role-3-id", name="role-3")
+            assert mocked_client.return_value.find_by_query.call_count == 1
+
+    def test_find_roles_by_names_cached(self):
+        with patch(self._roles_client) as mocked_client, patch(self._eureka_client):
+            mocked_client.return_value.find_by_query.return_value = [Role(id="role-1-id", name="role-1")]
+            mocked_client.return_value.create_role.return_value = Role(id="role-2-id", name="role-2")
+            role_service = RoleService()
+
+            assert [r.id for r in role_service.find_roles_by_names(["role-1", "role-2"])] == ["role-1-id"]
+            assert mocked_client.return_value.find_by_query.call_count == 1
+
+            mocked_client.return_value.find_by_query.return_value = []
+            assert [r.id for r in role_service.find_roles_by_names(["role-1", "role-2"])] == ["role-1-id"]
+            mocked_client.return_value.find_by_query.assert_called_with('name==("role-2")')
+
+            role_service.create_role(self.__analyzed_role("role-2"), set())
+            found_roles = role_service.find_roles_by_names(["role-1", "role-2"])
+            assert [r.id for r in found_roles] == ["role-1-id", "role-2-id"]
+            assert mocked_client.return_value.find_by_query.call_count == 2
+
+    def test_find_roles_by_names_resolves_roles_created_by_other_shards(self):
+        with patch(self._roles_client) as mocked_client, patch(self._eureka_client):
+            mocked_client.return_value.find_by_query.return_value = []
+            role_service = RoleService()
+            assert role_service.find_roles_by_names(["role-1"]) == []
+            assert role_service.find_role_by_name("role-1") is None
+
+            mocked_client.return_value.find_by_query.return_value = [Role(id="role-1-id", name="role-1")]
+            assert role_service.find_roles_by_names(["role-1"]) == [Role(id="role-1-id", name="role-1")]
+            assert mocked_client.return_value.find_by_query.call_count == 3
+
+    @staticmethod
+    def __analyzed_role(name: str):
+        return AnalyzedRole(role=Role(name=name), permissionSets=[], source="okapi", users=OrderedSet[str]())
+
+    @staticmethod
+    def __cleanup_record(role_id, capabilities):
+        return HashRoleCleanupRecord(role=Role(id=role_id, name=role_id), capabilities=capabilities, capabilitySets=[])
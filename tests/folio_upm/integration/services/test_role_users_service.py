@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from folio_upm.integration.services.role_users_service import RoleUsersService
+from folio_upm.model.analysis.analyzed_user_roles import AnalyzedUserRoles
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.eureka.role import Role
+from folio_upm.model.eureka.user_role import UserRole
+
+
+class TestRoleUsersService:
+
+    _module = "folio_upm.integration.services.role_users_service"
+    _roles = {"role-a": Role(id="aaaa-0001", name="role-a"), "role-b": Role(id="bbbb-0002", name="role-b")}
+
+    @pytest.fixture(autouse=True)
+    def user_role_assignment_env(self, monkeypatch):
+        monkeypatch.setenv("TENANT_ID", "test_tenant")
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_assign_user(self):
+        def post_user_roles(user_id, role_ids):
+            if user_id == "user-3" and "aaaa-0001" in role_ids:
+                response = requests.Response()
+                response.status_code = 400
+                response._content = (
+                    b"Relations between user and roles already exists (user: user-3, roles: [aaaa-0001])"
+                )
+                raise requests.HTTPError("400 Bad Request", response=response)
+            return [UserRole(userId=user_id, roleId=role_id) for role_id in role_ids]
+
+        with (
+            patch(f"{self._module}.RoleService") as role_service,
+            patch(f"{self._module}.UserRolesClient") as user_roles_client,
+            patch(f"{self._module}.EurekaClient"),
+        ):
+            role_service.return_value.find_roles_by_names.side_effect = lambda names: [self._roles[n] for n in names]
+            user_roles_client.return_value.post_user_roles.side_effect = post_user_roles
+            user_roles = [AnalyzedUserRoles(userId=f"user-{i}", roleNames=["role-a", "role-b"]) for i in range(8)]
+            result = [r for ur in user_roles for r in RoleUsersService().assign_user(ur)]
+
+        assert [r.srcEntityId for r in result if r.srcEntityId != "user-3"] == [
+            f"user-{i}" for i in range(8) if i != 3 for _ in range(2)
+        ]
+        assert all(r.status == "success" for r in result if r.srcEntityId != "user-3")
+        user_3_results = {(r.tarEntityId, r.status) for r in result if r.srcEntityId == "user-3"}
+        assert user_3_results == {("aaaa-0001", "skipped"), ("bbbb-0002", "success")}
+
+    def test_assign_user_skips_existing_user_roles(self):
+        with (
+            patch(f"{self._module}.RoleService") as role_service,
+            patch(f"{self._module}.UserRolesClient") as user_roles_client,
+            patch(f"{self._module}.EurekaClient"),
+        ):
+            role_service.return_value.find_roles_by_names.side_effect = lambda names: [self._roles[n] for n in names]
+            user_roles_client.return_value.post_user_roles.side_effect = lambda user_id, role_ids: [
+                UserRole(userId=user_id, roleId=role_id) for role_id in role_ids
+            ]
+            user_roles = [AnalyzedUserRoles(userId=f"user-{i}", roleNames=["role-a", "role-b"]) for i in range(2)]
+            existing_user_roles = [
+                UserRole(userId="user-0", roleId="aaaa-0001"),
+                UserRole(userId="user-1", roleId="aaaa-0001"),
+                UserRole(userId="user-1", roleId="bbbb-0002"),
+            ]
+            assigned_role_ids_by_user = RoleUsersService.group_role_ids_by_user(existing_user_roles)
+            role_users_service = RoleUsersService()
+            result = [
+                r
+                for ur in user_roles
+                for r in role_users_service.assign_user(ur, assigned_role_ids_by_user.get(ur.userId))
+            ]
+
+            user_roles_client.return_value.post_user_roles.assert_called_once_with("user-0", ["bbbb-0002"])
+
+        assert [(r.srcEntityId, r.tarEntityId, r.status) for r in result] == [
+            ("user-0", "aaaa-0001", "skipped"),
+            ("user-0", "bbbb-0002", "success"),
+            ("user-1", "aaaa-0001", "skipped"),
+            ("user-1", "bbbb-0002", "skipped"),
+        ]
@@ -0,0 +1,47 @@
+from folio_upm.model.eureka.role import Role
+from folio_upm.model.report.eureka_migration_report import EurekaMigrationReport
+from folio_upm.model.report.http_request_result import HttpRequestResult
+
+
+class TestEurekaMigrationReport:
+
+    def test_merge_concatenates_shard_results(self):
+        role1 = Role(id="r1", name="role1")
+        role2 = Role(id="r2", name="role2")
+        shard0 = EurekaMigrationReport(
+            roles=[HttpRequestResult.for_role(role2, "success")],
+            roleUsers=[HttpRequestResult.for_user_role(role1, "user1", "success")],
+            roleCapabilities=[],
+        )
+        shard1 = EurekaMigrationReport(
+            roles=[HttpRequestResult.for_role(role1, "skipped")],
+            roleUsers=[HttpRequestResult.for_user_role(role2, "user2", "success")],
+            roleCapabilities=[HttpRequestResult.role_capability_not_found_result("role3")],
+        )
+
+        merged_report = EurekaMigrationReport.merge([shard0, shard1])
+
+        assert [(r.srcEntityDisplayName, r.status) for r in merged_report.roles] == [
+            ("role2", "success"),
+            ("role1", "skipped"),
+        ]
+        assert [r.srcEntityId for r in merged_report.roleUsers] == ["user1", "user2"]
+        assert len(merged_report.roleCapabilities) == 1
+
+    def test_get_touched_role_ids(self):
+        role1 = Role(id="r1", name="role1")
+        role2 = Role(id="r2", name="role2")
+        report = EurekaMigrationReport(
+            roles=[HttpRequestResult.for_role(role1, "success"), HttpRequestResult.for_role(role2, "skipped")],
+            roleUsers=[
+                HttpRequestResult.for_user_role(role2, "user1", "skipped"),
+                HttpRequestResult.for_user_role(Role(id="r3", name="role3"), "user1", "success"),
+            ],
+            roleCapabilities=[
+                HttpRequestResult(status="success", srcEntityName="role", srcEntityId="r4"),
+                HttpRequestResult(status="error", srcEntityName="role", srcEntityId="r1"),
+                HttpRequestResult.role_capability_not_found_result("role5"),
+            ],
+        )
+
+        assert report.get_touched_role_ids() == ["r1", "r4", "r3"]
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.services.loaders.capabilities_loader import CapabilitiesLoader
+
+
+class TestCapabilitiesLoader:
+
+    _eureka_client = "folio_upm.services.loaders.capabilities_loader.EurekaClient"
+
+    @pytest.fixture(autouse=True)
+    def loader_env(self, monkeypatch):
+        monkeypatch.setenv("TENANT_ID", "test_tenant")
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_reload_roles_replaces_touched_role_records(self):
+        previous_load_result = {
+            "roles": [{"id": "r1", "name": "role1"}, {"id": "r2", "name": "role2"}],
+            "roleUsers": [{"roleId": "r1", "userId": "u1"}, {"roleId": "r2", "userId": "u2"}],
+            "roleCapabilities": [{"roleId": "r1", "capabilityId": "c1"}, {"roleId": "r2", "capabilityId": "c1"}],
+            "roleCapabilitySets": [],
+            "capabilities": [{"id": "c1"}, {"id": "c2"}],
+        }
+        reloaded_records = {
+            "/roles": [{"id": "r1", "name": "role1"}, {"id": "r3", "name": "role3"}],
+            "/roles/users": [{"roleId": "r3", "userId": "u3"}],
+            "/roles/capabilities": [{"roleId": "r1", "capabilityId": "c2"}, {"roleId": "r3", "capabilityId": "c1"}],
+            "/roles/capability-sets": [{"roleId": "r3", "capabilitySetId": "cs1"}],
+        }
+        queries = list[str]()
+
+        def load_page(resource, path, query, limit, offset):
+            queries.append(query)
+            return reloaded_records[path], len(reloaded_records[path])
+
+        with patch(self._eureka_client) as eureka_client:
+            eureka_client.return_value.load_page_by_query.side_effect = lambda *args: load_page(*args)[0]
+            eureka_client.return_value.load_counted_page_by_query.side_effect = load_page
+            result = CapabilitiesLoader().reload_roles(previous_load_result, ["r1", "r3"])
+
+        assert sorted(set(queries)) == ['id==("r1" or "r3")', 'roleId==("r1" or "r3")']
+        assert result["roles"] == [
+            {"id": "r2", "name": "role2"},
+            {"id": "r1", "name": "role1"},
+            {"id": "r3", "name": "role3"},
+        ]
+        assert result["roleUsers"] == [{"roleId": "r2", "userId": "u2"}, {"roleId": "r3", "userId": "u3"}]
+        assert result["roleCapabilities"] == [
+            {"roleId": "r2", "capabilityId": "c1"},
+            {"roleId": "r1", "capabilityId": "c2"},
+            {"roleId": "r3", "capabilityId": "c1"},
+        ]
+        assert result["roleCapabilitySets"] == [{"roleId": "r3", "capabilitySetId": "cs1"}]
+        assert result["capabilities"] == previous_load_result["capabilities"]
+
+    def test_reload_roles_keeps_records_of_failed_partitions(self, monkeypatch):
+        monkeypatch.setenv("QUERY_CHUNK_SIZE", "1")
+        previous_load_result = {
+            "roles": [{"id": "r1"}, {"id": "r2"}],
+            "roleCapabilities": [{"roleId": "r1", "capabilityId": "c1"}, {"roleId": "r2", "capabilityId": "c1"}],
+        }
+
+        def load_page(resource, path, query, limit, offset):
+            if '"r2"' in query:
+                raise ConnectionError("connection failed")
+            records = [{"id": "r1"}] if path == "/roles" else []
+            return records, len(records)
+
+        with patch(self._eureka_client) as eureka_client:
+            eureka_client.return_value.load_page_by_query.side_effect = lambda *args: load_page(*args)[0]
+            eureka_client.return_value.load_counted_page_by_query.side_effect = load_page
+            result = CapabilitiesLoader().reload_roles(previous_load_result, ["r1", "r2"])
+
+        assert result["roles"] == [{"id": "r2"}, {"id": "r1"}]
+        assert result["roleCapabilities"] == [{"roleId": "r2", "capabilityId": "c1"}]
+
+    def test_reload_roles_splits_rejected_queries(self):
+        previous_load_result = {"roles": [{"id": "r1"}, {"id": "r2"}, {"id": "r3"}]}
+        queries = list[str]()
+
+        def load_page(resource, path, query, limit, offset):
+            queries.append(query)
+            if " or " in query:
+                response = requests.Response()
+                response.status_code = 414
+                raise requests.HTTPError("414 URI Too Long", response=response)
+            role_ids = [role_id for role_id in ["r1", "r2"] if f'"{role_id}"' in query]
+            records = [{"id": role_id, "name": "reloaded"} for role_id in role_ids] if path == "/roles" else []
+            return records, len(records)
+
+        with patch(self._eureka_client) as eureka_client:
+            eureka_client.return_value.load_page_by_query.side_effect = lambda *args: load_page(*args)[0]
+            eureka_client.return_value.load_counted_page_by_query.side_effect = load_page
+            result = CapabilitiesLoader().reload_roles(previous_load_result, ["r1", "r2"])
+
+        assert 'id==("r1")' in queries and 'id==("r2")' in queries
+        assert result["roles"] == [{"id": "r3"}, {"id": "r1", "name": "reloaded"}, {"id": "r2", "name": "reloaded"}]
@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.eureka.capability import Capability
+from folio_upm.model.eureka.role import Role
+from folio_upm.model.load.eureka_load_result import EurekaLoadResult
+from folio_upm.storage.local_tenant_storage import LocalTenantStorage
+from folio_upm.storage.tenant_storage_service import TenantStorageService
+
+
+class TestLocalTenantStorage:
+
+    @pytest.fixture(autouse=True)
+    def local_storage_env(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("TENANT_ID", "test_tenant")
+        monkeypatch.setenv("JSON_GZ_CHUNK_SIZE", "64")
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_save_json_gz_streams_model(self, tmp_path):
+        load_result = EurekaLoadResult(roles=[Role(id=f"r{i}", name=f"role{i}") for i in range(50)])
+        storage = LocalTenantStorage()
+
+        storage.save_object("eureka-capabilities", "json.gz", load_result)
+
+        assert EurekaLoadResult(**storage.find_object("eureka-capabilities", "json.gz")) == load_result
+        stored_files = os.listdir(tmp_path / ".temp" / "test_tenant")
+        assert len(stored_files) == 1 and stored_files[0].endswith(".json.gz")
+
+    def test_find_object_items(self):
+        storage = LocalTenantStorage()
+        roles = [Role(id=f"r{i}", name=f"role{i}") for i in range(50)]
+        storage.save_object("eureka-capabilities", "json.gz", EurekaLoadResult(roles=roles))
+        storage.save_object("eureka-roles", "json.gz", roles)
+
+        assert [Role(**x) for x in storage.find_object_items("eureka-capabilities", "json.gz", "roles")] == roles
+        assert [Role(**x) for x in storage.find_object_items("eureka-roles", "json.gz")] == roles
+        assert storage.find_object_items("unknown", "json.gz") is None
+
+    def test_find_model(self):
+        storage = LocalTenantStorage()
+        load_results = [EurekaLoadResult(roles=[Role(id=f"r{i}", name=f"role{i}")]) for i in range(2)]
+        for load_result in load_results:
+            storage.save_object("eureka-capabilities", "json.gz", load_result)
+
+        assert storage.find_model("eureka-capabilities", "json.gz", EurekaLoadResult) == load_results[-1]
+        assert storage.find_models("eureka-capabilities", "json.gz", EurekaLoadResult) == load_results
+        assert storage.find_model("unknown", "json.gz", EurekaLoadResult) is None
+
+    def test_save_bin_gz_model(self):
+        load_result = EurekaLoadResult(roles=[Role(id=f"r{i}", name=f"role{i}") for i in range(50)])
+        storage = LocalTenantStorage()
+
+        storage.save_object("eureka-capabilities", "bin.gz", load_result)
+
+        assert storage.find_model("eureka-capabilities", "bin.gz", EurekaLoadResult) == load_result
+        assert EurekaLoadResult(**storage.find_object("eureka-capabilities", "bin.gz")) == load_result
+
+    def test_find_snapshot_in_other_format(self, monkeypatch):
+        load_result = EurekaLoadResult(roles=[Role(id="r1", name="role1")])
+        monkeypatch.setenv("ENABLED_STORAGES", "local")
+        TenantStorageService().save_snapshot("eureka-capabilities", load_result)
+
+        monkeypatch.setenv("SNAPSHOT_FORMAT", "bin.gz")
+        SingletonMeta._instances.clear()
+        storage_service = TenantStorageService()
+
+        assert storage_service.find_snapshot("eureka-capabilities", EurekaLoadResult) == load_result
+        assert storage_service.find_snapshot_object("eureka-capabilities") == load_result.model_dump(by_alias=True)
+        storage_service.save_snapshot("eureka-capabilities", EurekaLoadResult())
+        assert storage_service.find_snapshot("eureka-capabilities", EurekaLoadResult) == EurekaLoadResult()
+        assert storage_service.find_snapshot("unknown", EurekaLoadResult) is None
+
+    def test_find_latest_snapshot_across_formats(self, monkeypatch):
+        old_result = EurekaLoadResult(roles=[Role(id="r1", name="role1")])
+        new_result = EurekaLoadResult(roles=[Role(id="r2", name="role2")])
+        monkeypatch.setenv("ENABLED_STORAGES", "local")
+        TenantStorageService().save_snapshot("eureka-capabilities", old_result)
+
+        monkeypatch.setenv("SNAPSHOT_FORMAT", "bin.gz")
+        SingletonMeta._instances.clear()
+        TenantStorageService().save_snapshot("eureka-capabilities", new_result)
+
+        monkeypatch.delenv("SNAPSHOT_FORMAT")
+        SingletonMeta._instances.clear()
+        storage_service = TenantStorageService()
+
+        assert storage_service.find_snapshot("eureka-capabilities", EurekaLoadResult) == new_result
+        assert storage_service.find_snapshot_object("eureka-capabilities") == new_result.model_dump(by_alias=True)
+
+    def test_find_sections_model(self, monkeypatch):
+        capability_values = {"resource": "Users", "action": "view", "permission": "users.item.get", "type": "data"}
+        capabilities = [Capability(id="c1", name="users.view", **capability_values)]
+        load_result = EurekaLoadResult(roles=[Role(id="r1", name="role1")], capabilities=capabilities)
+        monkeypatch.setenv("ENABLED_STORAGES", "local")
+        monkeypatch.setenv("SNAPSHOT_FORMAT", "sections.bin")
+        storage_service = TenantStorageService()
+
+        storage_service.save_snapshot("eureka-capabilities", load_result)
+
+        found_result = storage_service.find_snapshot("eureka-capabilities", EurekaLoadResult, ["capabilities"])
+        assert found_result.capabilities == capabilities
+        assert found_result.roles == load_result.roles
+        assert found_result == load_result
+        assert storage_service.find_snapshot("eureka-capabilities", EurekaLoadResult) == load_result
+        assert storage_service.find_snapshot_object("eureka-capabilities") == load_result.model_dump(by_alias=True)
@@ -0,0 +1,72 @@
+import pytest
+
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.report.http_request_result import HttpRequestResult
+from folio_upm.storage.migration_journal import MigrationJournal
+
+
+class TestMigrationJournal:
+
+    _journal_name = "migration-journal-distributed"
+
+    @pytest.fixture(autouse=True)
+    def local_storage_env(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("TENANT_ID", "test_tenant")
+        monkeypatch.setenv("ENABLED_STORAGES", "local")
+        monkeypatch.setenv("MIGRATION_JOURNAL_FLUSH_SIZE", "2")
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_resume_loads_completed_entries(self):
+        journal = MigrationJournal(self._journal_name)
+        journal.record("roles", "role1", [self.__result("success")])
+        journal.record("roles", "role2", [self.__result("error")])
+        journal.record("roleUsers", "user1", [self.__result("skipped"), self.__result("success")])
+        journal.flush()
+
+        resumed_journal = MigrationJournal(self._journal_name, resume=True)
+
+        assert list(resumed_journal.get_completed_results("roles")) == ["role1"]
+        assert [r.status for r in resumed_journal.get_completed_results("roleUsers")["user1"]] == ["skipped", "success"]
+        assert resumed_journal.get_completed_results("roleCapabilities") == {}
+
+    def test_resume_continues_previous_run(self):
+        journal = MigrationJournal(self._journal_name)
+        journal.record("roles", "role1", [self.__result("error")])
+        journal.flush()
+
+        resumed_journal = MigrationJournal(self._journal_name, resume=True)
+        resumed_journal.record("roles", "role1", [self.__result("success")])
+        resumed_journal.record("roles", "role2", [self.__result("success")])
+
+        assert list(MigrationJournal(self._journal_name, resume=True).get_completed_results("roles")) == [
+            "role1",
+            "role2",
+        ]
+
+    def test_resume_retries_entries_of_not_created_roles(self):
+        journal = MigrationJournal(self._journal_name)
+        journal.record("roles", "role1", [self.__result("error")])
+        journal.record("roleCapabilities", "role1", [self.__result("not_found")])
+        journal.record("roleCapabilities", "role2", [self.__result("success"), self.__result("not_matched")])
+        journal.record("roleUsers", "user1", [self.__result("not_found")])
+        journal.flush()
+
+        resumed_journal = MigrationJournal(self._journal_name, resume=True)
+
+        assert resumed_journal.get_completed_results("roles") == {}
+        assert resumed_journal.get_completed_results("roleCapabilities") == {}
+        assert resumed_journal.get_completed_results("roleUsers") == {}
+
+    def test_new_run_ignores_previous_journal(self):
+        MigrationJournal(self._journal_name).record("roles", "role1", [self.__result("success")])
+        MigrationJournal(self._journal_name).flush()
+
+        assert MigrationJournal("migration-journal-consolidated", resume=True).get_completed_results("roles") == {}
+        assert MigrationJournal(self._journal_name).get_completed_results("roles") == {}
+
+    @staticmethod
+    def __result(status: str):
+        return HttpRequestResult(status=status, srcEntityName="role")
@@ -0,0 +1,99 @@
+import threading
+import time
+
+from folio_upm.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter:
+
+    def test_disabled_limiter(self):
+        limiter = AdaptiveConcurrencyLimiter("test", max_limit=0)
+        assert not limiter.is_enabled()
+        for _ in range(100):
+            limiter.acquire()
+
+    def test_limit_increased_only_when_reached(self):
+        limiter = AdaptiveConcurrencyLimiter("test", max_limit=3, target_latency=1.0)
+        for _ in range(100):
+            limiter.acquire()
+            limiter.release(0.01)
+        assert limiter.get_limit() == 2
+
+    def test_limit_increased_up_to_max_limit(self):
+        limiter = self.__saturated_limiter(max_limit=3)
+        limiter.acquire()
+        limiter.release(0.01)
+        assert limiter.get_limit() == 3
+
+    def test_limit_decreased_on_overload(self):
+        limiter = self.__saturated_limiter(max_limit=8)
+        assert limiter.get_limit() == 8
+
+        limiter.acquire()
+        limiter.release(0.01, overloaded=True)
+        limiter.acquire()
+        limiter.release(0.01, overloaded=True)
+
+        assert limiter.get_limit() == 4
+
+    def test_limit_decreased_on_high_latency(self):
+        limiter = self.__saturated_limiter(max_limit=8, target_latency=0.5)
+
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(1.0)
+
+        assert limiter.get_limit() == 4
+
+    def test_limit_bounds_in_flight_requests(self):
+        limiter = AdaptiveConcurrencyLimiter("test", max_limit=4, min_limit=2, target_latency=10.0)
+        in_flight = 0
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        def request():
+            nonlocal in_flight, max_in_flight
+            limiter.acquire()
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.002)
+            with lock:
+                in_flight -= 1
+            limiter.release(0.002)
+
+        threads = [threading.Thread(target=request) for _ in range(40)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+
+        assert 2 <= max_in_flight <= 4
+
+    def test_bind_sets_limiter_for_current_thread(self):
+        limiter = AdaptiveConcurrencyLimiter("test", max_limit=4)
+        nested_limiter = AdaptiveConcurrencyLimiter("nested", max_limit=4)
+        bound_limiters = list[AdaptiveConcurrencyLimiter | None]()
+
+        with limiter.bind():
+            thread = threading.Thread(target=lambda: bound_limiters.append(AdaptiveConcurrencyLimiter.get_bound()))
+            thread.start()
+            thread.join()
+            with nested_limiter.bind():
+                bound_limiters.append(AdaptiveConcurrencyLimiter.get_bound())
+            bound_limiters.append(AdaptiveConcurrencyLimiter.get_bound())
+
+        assert bound_limiters == [None, nested_limiter, limiter]
+        assert AdaptiveConcurrencyLimiter.get_bound() is None
+
+    @staticmethod
+    def __saturated_limiter(max_limit: int, target_latency: float = 1.0) -> AdaptiveConcurrencyLimiter:
+        limiter = AdaptiveConcurrencyLimiter("test", max_limit=max_limit, target_latency=target_latency)
+        while limiter.get_limit() < max_limit:
+            limit = limiter.get_limit()
+            for _ in range(limit):
+                limiter.acquire()
+            for _ in range(10):
+                limiter.release(0.01)
+                limiter.acquire()
+            for _ in range(limit):
+                limiter.release(0.01)
+        return limiter
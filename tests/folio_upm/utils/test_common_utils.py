@@ -35,6 +35,24 @@ class TestListUtils:
         expected_result = []
         assert partition_result == expected_result
 
+    def test_partition_by_weight(self):
+        given = ["a", "bb", "ccc", "dddd", "e", "f"]
+        partition_result = IterableUtils.partition_by_weight(given, 3, 5, len)
+        expected_result = [["a", "bb"], ["ccc"], ["dddd", "e"], ["f"]]
+        assert partition_result == expected_result
+
+    def test_partition_by_weight_limited_by_size(self):
+        given = [0] * 7
+        partition_result = IterableUtils.partition_by_weight(given, 3, 100, lambda x: 1)
+        expected_result = [[0] * 3, [0] * 3, [0]]
+        assert partition_result == expected_result
+
+    def test_partition_by_weight_heavy_value(self):
+        given = ["a", "long-value", "b"]
+        partition_result = IterableUtils.partition_by_weight(given, 5, 3, len)
+        expected_result = [["a"], ["long-value"], ["b"]]
+        assert partition_result == expected_result
+
 
 class TestCqlQueryUtils:
 
@@ -0,0 +1,29 @@
+import random
+import threading
+import time
+
+from folio_upm.utils.concurrency_utils import ConcurrencyUtils
+
+
+class TestConcurrencyUtils:
+
+    def test_map_ordered_sequential(self):
+        assert ConcurrencyUtils.map_ordered(lambda x: x * 2, [1, 2, 3]) == [2, 4, 6]
+
+    def test_map_ordered_concurrent_keeps_order(self):
+        def func(value):
+            time.sleep(random.uniform(0, 0.005))
+            return value * 2
+
+        assert ConcurrencyUtils.map_ordered(func, list(range(50)), 8) == [x * 2 for x in range(50)]
+
+    def test_map_ordered_reports_progress(self):
+        progress = []
+        lock = threading.Lock()
+
+        def on_completed(processed, total):
+            with lock:
+                progress.append((processed, total))
+
+        ConcurrencyUtils.map_ordered(lambda x: x, list(range(20)), 4, on_completed)
+        assert sorted(progress) == [(i, 20) for i in range(1, 21)]
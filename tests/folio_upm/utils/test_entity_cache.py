@@ -0,0 +1,51 @@
+import pytest
+
+from folio_upm.model.cls_support import SingletonMeta
+from folio_upm.model.eureka.role import Role
+from folio_upm.utils.entity_cache import EntityCache
+
+
+class TestEntityCache:
+
+    @pytest.fixture(autouse=True)
+    def clear_env(self):
+        SingletonMeta._instances.clear()
+        yield
+        SingletonMeta._instances.clear()
+
+    def test_get_all_returns_missing_values(self):
+        cache = EntityCache[Role]("roles")
+        cache.put_all("name", ["role1", "role2"], [Role(id="1", name="role1")])
+
+        cached_roles, missing_values = cache.get_all("name", ["role1", "role2", "role3", "role1"])
+
+        assert cached_roles == [Role(id="1", name="role1")]
+        assert missing_values == ["role3"]
+        assert cache.get_stats().model_dump() == {"hits": 2, "misses": 1, "size": 2}
+
+    def test_put_all_groups_entities_by_field(self):
+        cache = EntityCache[Role]("roles")
+        roles = [Role(id="1", name="role1", description="d"), Role(id="2", name="role2", description="d")]
+        cache.put_all("description", ["d"], roles)
+        assert cache.get_all("description", ["d"]) == (roles, [])
+
+    def test_put_all_without_missing_values(self):
+        cache = EntityCache[Role]("roles")
+        cache.put_all("name", ["role1", "role2"], [Role(id="1", name="role1")], cache_missing=False)
+        assert cache.get_all("name", ["role1", "role2"]) == ([Role(id="1", name="role1")], ["role2"])
+
+    def test_invalidate(self):
+        cache = EntityCache[Role]("roles")
+        cache.put_all("name", ["role1", "role2"], [Role(id="1", name="role1"), Role(id="2", name="role2")])
+
+        cache.invalidate("name", "role1")
+        assert cache.get_all("name", ["role1", "role2"]) == ([Role(id="2", name="role2")], ["role1"])
+
+        cache.invalidate_if(lambda role: role.id == "2")
+        assert cache.get_all("name", ["role1", "role2"]) == ([], ["role1", "role2"])
+
+    def test_disabled_cache(self, monkeypatch):
+        monkeypatch.setenv("ENTITY_CACHE_SIZE", "0")
+        cache = EntityCache[Role]("roles")
+        cache.put_all("name", ["role1"], [Role(id="1", name="role1")])
+        assert cache.get_all("name", ["role1"]) == ([], ["role1"])
@@ -0,0 +1,45 @@
+import io
+import json
+
+import pytest
+
+from folio_upm.utils.json_item_iterator import JsonItemIterator
+
+
+class TestJsonItemIterator:
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+    def test_iterate_top_level_array(self, chunk_size):
+        items = [{"id": "r1", "name": "röle"}, 12345, "value", [1, 2], None, 1.5e10]
+
+        assert self.__items(json.dumps(items), chunk_size=chunk_size) == items
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+    def test_iterate_object_field(self, chunk_size):
+        json_object = {
+            "okapiPermissions": [{"id": "mod-1", "permissionSets": [{"permissionName": "p1"}]}],
+            "allPermissionUsers": [{"userId": "u1"}, {"userId": "u2"}],
+            "allPermissions": [],
+        }
+        json_text = json.dumps(json_object, indent=2)
+
+        assert self.__items(json_text, "allPermissionUsers", chunk_size) == [{"userId": "u1"}, {"userId": "u2"}]
+        assert self.__items(json_text, "allPermissions", chunk_size) == []
+        assert self.__items(json_text, "unknown", chunk_size) == []
+
+    def test_iterate_empty_values(self):
+        assert self.__items("[]") == []
+        assert self.__items(" [ ] ") == []
+        assert self.__items("{}", "allPermissionUsers") == []
+
+    def test_iterate_invalid_json(self):
+        with pytest.raises(ValueError):
+            self.__items('{"roles": [1, 2]}')
+        with pytest.raises(ValueError):
+            self.__items("[1, 2")
+        with pytest.raises(ValueError):
+            self.__items('[{"id": 1} {"id": 2}]')
+
+    @staticmethod
+    def __items(json_text, field=None, chunk_size=1024):
+        return list(JsonItemIterator(io.BytesIO(json_text.encode("utf-8")), field, chunk_size))
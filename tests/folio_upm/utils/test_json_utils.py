@@ -0,0 +1,59 @@
+import gzip
+import json
+
+from folio_upm.model.analysis.analyzed_role import AnalyzedRole
+from folio_upm.model.eureka.capability import Capability
+from folio_upm.model.eureka.role import Role
+from folio_upm.model.load.eureka_load_result import EurekaLoadResult
+from folio_upm.model.result.eureka_migration_data import EurekaMigrationData
+from folio_upm.utils.json_utils import JsonUtils
+from folio_upm.utils.ordered_set import OrderedSet
+
+
+class TestJsonUtils:
+
+    def test_to_json_gz_stream_serializes_models_by_alias(self):
+        load_result = EurekaLoadResult(
+            roles=[Role(id="r1", name="role1")],
+            capabilities=[self.__capability(f"c{i}") for i in range(100)],
+        )
+
+        result = self.__read_stream(load_result, chunk_size=16)
+
+        assert result == json.loads(load_result.model_dump_json(by_alias=True))
+        assert result["capabilities"][0]["type"] == "data"
+
+    def test_to_json_gz_stream_applies_field_serializers(self):
+        analyzed_role = AnalyzedRole(
+            role=Role(name="role1"), permissionSets=[], source="okapi", users=OrderedSet(["u1"])
+        )
+        migration_data = EurekaMigrationData(roles=[analyzed_role], roleCapabilities=[], userRoles=[])
+
+        result = self.__read_stream(migration_data)
+
+        assert result == json.loads(migration_data.model_dump_json(by_alias=True))
+        assert result["roles"][0]["users"] == ["u1"]
+
+    def test_to_json_gz_stream_serializes_dicts_and_lists(self):
+        json_object = {"roles": [{"id": "r1"}, {"id": "r2"}], "empty": [], "values": {"a": None, "b": "ü"}}
+
+        assert self.__read_stream(json_object, chunk_size=1) == json_object
+        assert self.__read_stream([]) == []
+
+    @staticmethod
+    def __read_stream(json_object, chunk_size: int = 1024):
+        with JsonUtils.to_json_gz_stream(json_object, chunk_size) as json_gz_stream:
+            return json.loads(gzip.decompress(json_gz_stream.read()).decode("utf-8"))
+
+    @staticmethod
+    def __capability(capability_id: str):
+        return Capability(
+            **{
+                "id": capability_id,
+                "name": capability_id,
+                "resource": "r",
+                "action": "view",
+                "permission": f"perm.{capability_id}",
+                "type": "data",
+            }
+        )
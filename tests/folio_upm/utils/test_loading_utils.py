@@ -0,0 +1,115 @@
+import random
+import time
+
+import requests
+
+from folio_upm.utils.loading_utils import PagedDataLoader, PartitionedDataLoader
+
+
+class TestPartitionedDataLoader:
+
+    def test_load_sequential(self, test_tenant_env):
+        loader = PartitionedDataLoader("test", list(range(10)), self.__load_values, self.__build_query, 3, 1)
+        assert loader.load() == list(range(10))
+
+    def test_load_concurrent_keeps_order(self, test_tenant_env):
+        data = list(range(100))
+        loader = PartitionedDataLoader("test", data, self.__load_values_with_delay, self.__build_query, 5, 8)
+        assert loader.load() == data
+
+    def test_load_concurrent_isolates_failed_partition(self, test_tenant_env):
+        def failing_loader(query: str):
+            if query == "values=4,5":
+                raise ValueError("Failed to load partition")
+            return self.__load_values(query)
+
+        loader = PartitionedDataLoader("test", list(range(8)), failing_loader, self.__build_query, 2, 4)
+        assert loader.load() == [0, 1, 2, 3, 6, 7]
+
+    def test_load_partitions_limited_by_query_length(self, test_tenant_env):
+        queries = []
+
+        def loader(query: str):
+            queries.append(query)
+            return self.__load_values(query)
+
+        data = [1, 22, 333, 4444, 55555, 6]
+        loader = PartitionedDataLoader("test", data, loader, self.__build_query, 100, 1, 20)
+        assert loader.load() == data
+        assert queries == ["values=1,22", "values=333,4444", "values=55555,6"]
+
+    def test_load_splits_rejected_partition(self, test_tenant_env):
+        queries = []
+
+        def loader(query: str):
+            queries.append(query)
+            if len(query) > len("values=0,1"):
+                raise self.__http_error(414)
+            return self.__load_values(query)
+
+        loader = PartitionedDataLoader("test", list(range(5)), loader, self.__build_query, 5, 1)
+        assert loader.load() == list(range(5))
+        assert queries == ["values=0,1,2,3,4", "values=0,1", "values=2,3,4", "values=2", "values=3,4"]
+
+    def test_load_does_not_split_partition_on_server_error(self, test_tenant_env):
+        queries = []
+
+        def loader(query: str):
+            queries.append(query)
+            raise self.__http_error(500)
+
+        loader = PartitionedDataLoader("test", list(range(5)), loader, self.__build_query, 5, 1)
+        assert loader.load() == []
+        assert queries == ["values=0,1,2,3,4"]
+
+    @staticmethod
+    def __http_error(status_code: int):
+        response = requests.Response()
+        response.status_code = status_code
+        return requests.HTTPError(f"{status_code} Error", response=response)
+
+    @staticmethod
+    def __build_query(values):
+        return "values=" + ",".join(str(x) for x in values)
+
+    @staticmethod
+    def __load_values(query: str):
+        return [int(x) for x in query.removeprefix("values=").split(",")]
+
+    @staticmethod
+    def __load_values_with_delay(query: str):
+        time.sleep(random.uniform(0, 0.01))
+        return TestPartitionedDataLoader.__load_values(query)
+
+
+class TestPagedDataLoader:
+
+    _records = list(range(1234))
+
+    def test_load_sequential(self, test_tenant_env):
+        loader = PagedDataLoader("test", self.__load_page, batch_limit=100, concurrency=1)
+        assert loader.load() == self._records
+
+    def test_load_concurrent_keeps_offset_order(self, test_tenant_env):
+        loader = PagedDataLoader("test", self.__load_page, "query", 100, self.__load_counted_page, 8)
+        assert loader.load() == self._records
+
+    def test_load_concurrent_without_total_records(self, test_tenant_env):
+        def counted_loader_func(query, limit, offset):
+            return self.__load_page(query, limit, offset), None
+
+        loader = PagedDataLoader("test", self.__load_page, "query", 100, counted_loader_func, 8)
+        assert loader.load() == self._records
+
+    def test_load_concurrent_single_page(self, test_tenant_env):
+        loader = PagedDataLoader("test", self.__load_page, "query", 5000, self.__load_counted_page, 8)
+        assert loader.load() == self._records
+
+    @staticmethod
+    def __load_page(query, limit, offset):
+        time.sleep(random.uniform(0, 0.005))
+        return TestPagedDataLoader._records[offset : offset + limit]
+
+    @staticmethod
+    def __load_counted_page(query, limit, offset):
+        return TestPagedDataLoader.__load_page(query, limit, offset), len(TestPagedDataLoader._records)
@@ -0,0 +1,22 @@
+import time
+
+from folio_upm.utils.rate_limiter import TokenBucketRateLimiter
+
+
+class TestTokenBucketRateLimiter:
+
+    def test_disabled_limiter(self):
+        limiter = TokenBucketRateLimiter(0)
+        assert not limiter.is_enabled()
+        assert sum(limiter.acquire() for _ in range(100)) == 0.0
+
+    def test_burst_is_not_limited(self):
+        limiter = TokenBucketRateLimiter(1, capacity=5)
+        assert sum(limiter.acquire() for _ in range(5)) == 0.0
+
+    def test_requests_above_burst_are_delayed(self):
+        limiter = TokenBucketRateLimiter(50, capacity=1)
+        start_time = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        assert time.monotonic() - start_time >= 0.09
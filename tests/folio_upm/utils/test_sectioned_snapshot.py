@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from folio_upm.model.load.okapi_load_result import OkapiLoadResult
+from folio_upm.model.okapi.permission_set import PermissionSet
+from folio_upm.model.okapi.user_permission import UserPermission
+from folio_upm.utils.sectioned_snapshot import SectionedSnapshot
+
+
+class TestSectionedSnapshot:
+
+    def test_get_section(self):
+        sections = {"roles": [{"id": "r1", "name": "role1"}], "capabilities": [], "description": None}
+        snapshot = self.__snapshot(SectionedSnapshot.encode(sections.items()))
+
+        assert snapshot.get_section_names() == ["roles", "capabilities", "description"]
+        assert snapshot.get_section("roles") == sections["roles"]
+        assert snapshot.get_sections() == sections
+        assert snapshot.get_section("unknown") is None
+
+    def test_reads_only_requested_sections(self):
+        expanded_ps = [PermissionSet(permissionName=f"ps{i}", subPermissions=[f"p{i}"]) for i in range(20)]
+        load_result = OkapiLoadResult(allPermissionsExpanded=expanded_ps)
+        snapshot_bytes = SectionedSnapshot.encode(load_result.model_dump(mode="json").items())
+        read_ranges = list[tuple]()
+
+        snapshot = self.__snapshot(snapshot_bytes, read_ranges)
+        loaded_result = snapshot.to_model(OkapiLoadResult, ["allPermissionsExpanded", "unknown"])
+
+        assert loaded_result.allPermissionsExpanded == expanded_ps
+        assert len(read_ranges) == 2, "index and a single section are expected to be read"
+        assert snapshot.to_model(OkapiLoadResult).allPermissionsExpanded == expanded_ps
+
+    def test_loads_deferred_sections_on_first_access(self):
+        permission_users = [UserPermission(id="up1", userId="u1", permissions=["ps1"])]
+        load_result = OkapiLoadResult(allPermissionUsers=permission_users)
+        snapshot_bytes = SectionedSnapshot.encode(load_result.model_dump(mode="json").items())
+        read_ranges = list[tuple]()
+
+        loaded_result = self.__snapshot(snapshot_bytes, read_ranges).to_model(OkapiLoadResult, [])
+
+        assert len(read_ranges) == 1
+        assert loaded_result.allPermissionUsers == permission_users
+        assert loaded_result.allPermissionUsers == permission_users
+        assert len(read_ranges) == 2
+        assert loaded_result.model_dump() == load_result.model_dump()
+        assert len(read_ranges) == 5
+
+    def test_loads_deferred_sections_for_nested_dump_and_iteration(self):
+        permission_users = [UserPermission(id="up1", userId="u1", permissions=["ps1"])]
+        load_result = OkapiLoadResult(allPermissionUsers=permission_users)
+        snapshot = self.__snapshot(SectionedSnapshot.encode(load_result.model_dump(mode="json").items()))
+
+        nested_result = _LoadResultHolder(loadResult=snapshot.to_model(OkapiLoadResult, ["allPermissions"]))
+        assert nested_result.model_dump() == {"loadResult": load_result.model_dump()}
+
+        loaded_result = snapshot.to_model(OkapiLoadResult, ["allPermissions"])
+        assert dict(loaded_result) == dict(load_result)
+        assert loaded_result.model_fields_set == set(OkapiLoadResult.model_fields)
+
+    def test_loads_deferred_section_once_for_concurrent_readers(self):
+        load_result = OkapiLoadResult(allPermissionUsers=[UserPermission(id="up1", userId="u1")])
+        snapshot_bytes = SectionedSnapshot.encode(load_result.model_dump(mode="json").items())
+        read_ranges = list[tuple]()
+        loaded_result = self.__snapshot(snapshot_bytes, read_ranges).to_model(OkapiLoadResult, [])
+
+        threads = [threading.Thread(target=lambda: loaded_result.allPermissionUsers) for _ in range(8)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+
+        assert loaded_result.allPermissionUsers == load_result.allPermissionUsers
+        assert len(read_ranges) == 2
+
+    def test_invalid_snapshot(self):
+        with pytest.raises(ValueError, match="unknown format"):
+            self.__snapshot(b'{"roles": []}')
+
+    @staticmethod
+    def __snapshot(snapshot_bytes: bytes, read_ranges: list = None) -> SectionedSnapshot:
+        def read_range(offset, size):
+            if read_ranges is not None:
+                read_ranges.append((offset, size))
+            return snapshot_bytes[offset : offset + size]
+
+        return SectionedSnapshot(read_range)
+
+
+class _LoadResultHolder(BaseModel):
+    loadResult: OkapiLoadResult
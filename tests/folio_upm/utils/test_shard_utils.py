@@ -0,0 +1,50 @@
+import pytest
+
+from folio_upm.utils.shard_utils import ShardUtils
+
+
+class TestShardUtils:
+
+    def test_filter_shard_partitions_all_values(self):
+        user_ids = [f"user-{i}" for i in range(100)]
+        shards = [ShardUtils.filter_shard(user_ids, lambda x: x, i, 4) for i in range(4)]
+
+        assert sorted(value for shard in shards for value in shard) == sorted(user_ids)
+        assert all(shard for shard in shards)
+        assert shards[0] == ShardUtils.filter_shard(user_ids, lambda x: x, 0, 4)
+
+    def test_filter_shard_keeps_order(self):
+        user_ids = [f"user-{i}" for i in range(20)]
+        shard = ShardUtils.filter_shard(user_ids, lambda x: x, 1, 3)
+        assert shard == [x for x in user_ids if x in set(shard)]
+
+    def test_filter_single_shard(self):
+        assert ShardUtils.filter_shard(["a", "b"], lambda x: x, 0, 1) == ["a", "b"]
+
+    def test_iter_shard_consumes_values_lazily(self):
+        consumed_values = list[str]()
+
+        def values():
+            for i in range(20):
+                consumed_values.append(f"user-{i}")
+                yield f"user-{i}"
+
+        shard = ShardUtils.iter_shard(values(), lambda x: x, 1, 3)
+        first_value = next(shard)
+
+        assert consumed_values[-1] == first_value
+        assert [first_value, *shard] == ShardUtils.filter_shard(consumed_values, lambda x: x, 1, 3)
+
+    def test_get_shard_index_is_stable(self):
+        assert ShardUtils.get_shard_index("user-1", 8) == 2
+        assert ShardUtils.get_shard_index("role-1", 8) == 1
+
+    @pytest.mark.parametrize("shard_index, shard_count", [(2, 2), (-1, 2), (0, 0)])
+    def test_validate_invalid_shard(self, shard_index, shard_count):
+        with pytest.raises(ValueError):
+            ShardUtils.validate(shard_index, shard_count)
+
+    def test_get_shard_file_name(self):
+        assert ShardUtils.get_shard_file_name("migration-report", "distributed", 0, 1) == "migration-report-distributed"
+        shard_file_name = ShardUtils.get_shard_file_name("migration-report", "distributed", 1, 4)
+        assert shard_file_name == "migration-report-shard-1-of-4-distributed"
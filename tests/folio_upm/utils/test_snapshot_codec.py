@@ -0,0 +1,37 @@
+import pytest
+
+from folio_upm.utils.snapshot_codec import SnapshotCodec
+
+
+class TestSnapshotCodec:
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "value",
+            12345,
+            [],
+            {},
+            [1, None, 2**70, -(2**63)],
+            [True, False, None],
+            [1.5, None, -0.25],
+            ["a", 1, None, {"key": "value"}],
+            [[1, 2], None, [], [[3]]],
+            {"roles": [{"id": "r1", "name": "röle"}, {"id": "r2", "description": None}, None]},
+        ],
+    )
+    def test_encode_decode(self, value):
+        assert SnapshotCodec.decode(SnapshotCodec.encode(value)) == value
+
+    def test_decoded_strings_are_shared(self):
+        value = [{"permissionName": "users.item.get"}, {"permissionName": "users.item" + ".get"}]
+
+        decoded_value = SnapshotCodec.decode(SnapshotCodec.encode(value))
+
+        assert decoded_value == value
+        assert decoded_value[0]["permissionName"] is decoded_value[1]["permissionName"]
+
+    def test_decode_invalid_data(self):
+        with pytest.raises(ValueError, match="unknown format"):
+            SnapshotCodec.decode(b'{"roles": []}')
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+from folio_upm.utils.task_scheduler import DependencyScheduler
+
+
+class TestDependencyScheduler:
+
+    def test_run_respects_dependencies(self):
+        completed = []
+        lock = threading.Lock()
+
+        def task(key):
+            def run():
+                time.sleep(0.001)
+                with lock:
+                    completed.append(key)
+                return key.upper()
+
+            return run
+
+        scheduler = DependencyScheduler(max_workers=4)
+        scheduler.add_task("user", task("user"), ["role-a", "role-b"])
+        scheduler.add_task("role-a", task("role-a"))
+        scheduler.add_task("role-b", task("role-b"))
+        scheduler.add_task("rc-a", task("rc-a"), ["role-a"])
+        scheduler.add_task("rc-unknown", task("rc-unknown"), ["role-unknown"])
+
+        results = scheduler.run()
+
+        assert results == {k: k.upper() for k in ["user", "role-a", "role-b", "rc-a", "rc-unknown"]}
+        assert completed.index("rc-a") > completed.index("role-a")
+        assert completed.index("user") > max(completed.index("role-a"), completed.index("role-b"))
+
+    def test_run_starts_unlocked_tasks_first(self):
+        started = []
+        scheduler = DependencyScheduler(max_workers=1)
+        for i in range(3):
+            scheduler.add_task(f"role-{i}", lambda i=i: started.append(f"role-{i}"))
+            scheduler.add_task(f"rc-{i}", lambda i=i: started.append(f"rc-{i}"), [f"role-{i}"])
+
+        scheduler.run()
+
+        assert started == ["role-0", "rc-0", "role-1", "rc-1", "role-2", "rc-2"]
+
+    def test_run_reports_progress(self):
+        progress = []
+        scheduler = DependencyScheduler(max_workers=2, on_completed=lambda done, total: progress.append((done, total)))
+        scheduler.add_task("a", lambda: None)
+        scheduler.add_task("b", lambda: None, ["a"])
+
+        scheduler.run()
+
+        assert progress == [(1, 2), (2, 2)]
+
+    def test_run_fails_on_cyclic_dependencies(self):
+        scheduler = DependencyScheduler(max_workers=2)
+        scheduler.add_task("a", lambda: None, ["b"])
+        scheduler.add_task("b", lambda: None, ["a"])
+
+        with pytest.raises(ValueError, match="cyclic dependencies"):
+            scheduler.run()
+
+    def test_add_task_fails_on_duplicate_key(self):
+        scheduler = DependencyScheduler()
+        scheduler.add_task("a", lambda: None)
+
+        with pytest.raises(ValueError, match="already added"):
+            scheduler.add_task("a", lambda: None)